@@ -9,6 +9,7 @@ from station_api.models import (
     Trip,
     Ticket,
     Order,
+    SeatHold,
 )
 
 
@@ -29,3 +30,4 @@ admin.site.register(TrainType)
 admin.site.register(Train)
 admin.site.register(Trip)
 admin.site.register(Ticket)
+admin.site.register(SeatHold)
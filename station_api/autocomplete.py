@@ -0,0 +1,84 @@
+import re
+import threading
+from bisect import bisect_left
+
+from station_api.cache import get_model_versions
+from station_api.models import Station
+
+
+WORD_START = re.compile(r"\b\w")
+
+
+class StationAutocomplete:
+    """
+    In-memory prefix index of station names.
+    Keys are casefolded names and their suffixes starting at every
+    word, kept in a sorted list, so a prefix lookup is a binary search
+    followed by a scan of the matching range. The index is loaded on
+    first request and rebuilt when the shared change version of
+    stations differs from the loaded one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._versions: list[int] | None = None
+        self._keys: list[str] = []
+        self._entries: list[tuple[int, str, int]] = []
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._versions = None
+            self._keys = []
+            self._entries = []
+
+    def _get_index(self) -> tuple[list[str], list[tuple[int, str, int]]]:
+        # Read before stations, so a change committed while loading
+        # leaves the version outdated and the next call reloads again
+        versions = get_model_versions(Station)
+        with self._lock:
+            if self._versions == versions:
+                return self._keys, self._entries
+
+        index = []
+        for station_id, name in (
+            Station.objects.order_by().values_list("id", "name").iterator()
+        ):
+            folded = name.casefold()
+            for match in WORD_START.finditer(folded):
+                # Whole name matches rank before matches of later words
+                rank = 0 if match.start() == 0 else 1
+                index.append((folded[match.start():], rank, name, station_id))
+        index.sort()
+        keys = [key for key, *_entry in index]
+        entries = [tuple(entry) for _key, *entry in index]
+        with self._lock:
+            self._versions, self._keys, self._entries = (
+                versions, keys, entries
+            )
+        return keys, entries
+
+    def complete(self, query: str, limit: int) -> list[dict]:
+        """
+        Return up to `limit` stations with names or words of names
+        starting with the query, whole name matches first
+        """
+        query = query.strip().casefold()
+        if not query:
+            return []
+        keys, entries = self._get_index()
+        start = bisect_left(keys, query)
+        end = bisect_left(keys, query + "\U0010ffff", lo=start)
+
+        matches = sorted(entries[start:end])
+        result = []
+        seen = set()
+        for _rank, name, station_id in matches:
+            if station_id not in seen:
+                seen.add(station_id)
+                result.append({"id": station_id, "name": name})
+                if len(result) == limit:
+                    break
+        return result
+
+
+station_autocomplete = StationAutocomplete()
@@ -0,0 +1,173 @@
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models, transaction
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+def get_cache():
+    return caches[settings.CATALOG_CACHE_ALIAS]
+
+
+def version_key(model: type[models.Model]) -> str:
+    return f"model-version:{model._meta.label_lower}"
+
+
+def modified_key(model: type[models.Model]) -> str:
+    return f"model-modified:{model._meta.label_lower}"
+
+
+def get_model_versions(*model_classes: type[models.Model]) -> list[int]:
+    """
+    Return current change versions of models. Missing versions are
+    started from current time so they never repeat evicted ones
+    """
+    cache = get_cache()
+    keys = [version_key(model) for model in model_classes]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def get_models_modified(*model_classes: type[models.Model]) -> int:
+    """
+    Return timestamp in whole seconds of the latest change of models.
+    Unknown change times are assumed to be now
+    """
+    cache = get_cache()
+    keys = [modified_key(model) for model in model_classes]
+    modified = cache.get_many(keys)
+    for key in keys:
+        if key not in modified:
+            cache.add(key, math.ceil(time.time()), timeout=None)
+            modified[key] = cache.get(key)
+    return math.ceil(max(modified.values(), default=0))
+
+
+def bump_model_version(model: type[models.Model]) -> None:
+    """
+    Bump model version and change time. Change times are whole
+    seconds (as in Last-Modified) and always move past the previous
+    one, so two changes within a second never share a stamp
+    """
+    cache = get_cache()
+    try:
+        cache.incr(version_key(model))
+    except ValueError:
+        cache.add(version_key(model), time.time_ns(), timeout=None)
+    previous = math.ceil(cache.get(modified_key(model), 0))
+    cache.set(
+        modified_key(model),
+        max(math.ceil(time.time()), previous + 1),
+        timeout=None,
+    )
+
+
+def invalidate_model(model: type[models.Model]) -> None:
+    """
+    Bump model version right away and once more after commit, so
+    responses cached from not yet committed data are not reused
+    """
+    bump_model_version(model)
+    transaction.on_commit(lambda: bump_model_version(model))
+
+
+class NotModified(Exception):
+    def __init__(self, response: HttpResponseBase) -> None:
+        super().__init__()
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """
+    Answer list and retrieve requests with ETag and Last-Modified
+    derived from change versions of `cache_models`, returning 304
+    without touching the queryset when the client copy is fresh
+    """
+
+    cache_models: tuple[type[models.Model], ...] = ()
+    conditional_actions: tuple[str, ...] = ("list", "retrieve")
+
+    def get_etag(self, request: Request) -> str:
+        versions = get_model_versions(*self.cache_models)
+        key = (
+            f"{self.basename}:{self.action}:{request.user.pk}:"
+            f"{request.accepted_renderer.format}:{request.get_full_path()}:"
+            f"{'.'.join(map(str, versions))}"
+        )
+        return quote_etag(hashlib.md5(key.encode()).hexdigest())
+
+    def initial(self, request: Request, *args, **kwargs) -> None:
+        super().initial(request, *args, **kwargs)
+        self.etag = self.last_modified = None
+        if (
+            request.method in ("GET", "HEAD")
+            and self.action in self.conditional_actions
+        ):
+            self.etag = self.get_etag(request)
+            self.last_modified = get_models_modified(*self.cache_models)
+            response = get_conditional_response(
+                request, etag=self.etag, last_modified=self.last_modified
+            )
+            if response is not None:
+                raise NotModified(response)
+
+    def handle_exception(self, exc: Exception) -> HttpResponseBase:
+        if isinstance(exc, NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(
+        self,
+        request: Request,
+        response: HttpResponseBase,
+        *args,
+        **kwargs
+    ) -> HttpResponseBase:
+        response = super().finalize_response(
+            request, response, *args, **kwargs
+        )
+        if getattr(self, "etag", None) and response.status_code in (200, 304):
+            response["ETag"] = self.etag
+            response["Last-Modified"] = http_date(self.last_modified)
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class CachedListMixin:
+    """
+    Cache list responses per query string until any of
+    `cache_models` changes
+    """
+
+    cache_models: tuple[type[models.Model], ...] = ()
+
+    def get_list_cache_key(self, request: Request) -> str:
+        versions = get_model_versions(*self.cache_models)
+        query = hashlib.md5(
+            f"{request.get_host()}?"
+            f"{sorted(request.query_params.lists())}".encode()
+        ).hexdigest()
+        return (
+            f"catalog:{self.basename}:"
+            f"{'.'.join(map(str, versions))}:{query}"
+        )
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        cache = get_cache()
+        key = self.get_list_cache_key(request)
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, timeout=settings.CATALOG_CACHE_TIMEOUT)
+        return Response(data)
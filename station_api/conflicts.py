@@ -0,0 +1,250 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable, NamedTuple
+
+from django.contrib.postgres.fields import DateTimeRangeField
+from django.db import connection
+from django.db.models import Func, QuerySet
+
+from station_api.models import Crew, Train, Trip
+
+
+class TsTzRange(Func):
+    function = "TSTZRANGE"
+    output_field = DateTimeRangeField()
+
+
+class Interval(NamedTuple):
+    start: datetime
+    end: datetime
+    trip_id: int
+
+
+class IntervalIndex:
+    """
+    Static interval tree of half-open [start, end) intervals.
+    Intervals are sorted by start, every node of the implicit binary
+    tree over them keeps the latest end of its subtree, so overlap
+    queries skip subtrees which end before the queried period.
+    """
+
+    def __init__(self, intervals: Iterable[Interval]) -> None:
+        self._intervals = sorted(intervals)
+        self._max_end: list[datetime | None] = [None] * len(self._intervals)
+        self._build(0, len(self._intervals))
+
+    def _build(self, lo: int, hi: int) -> datetime | None:
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        max_end = self._intervals[mid].end
+        for child_end in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child_end is not None and child_end > max_end:
+                max_end = child_end
+        self._max_end[mid] = max_end
+        return max_end
+
+    def overlapping(self, start: datetime, end: datetime) -> list[Interval]:
+        result = []
+        stack = [(0, len(self._intervals))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_end[mid] <= start:
+                continue
+            stack.append((lo, mid))
+            interval = self._intervals[mid]
+            if interval.start < end:
+                if interval.end > start:
+                    result.append(interval)
+                stack.append((mid + 1, hi))
+        return sorted(result)
+
+
+def overlapping_trips(start: datetime, end: datetime) -> QuerySet:
+    """
+    Trips running during [start, end). On PostgreSQL periods are
+    compared as ranges, which is served by the trip period GiST index
+    """
+    if connection.vendor == "postgresql":
+        return Trip.objects.annotate(
+            period=TsTzRange("departure_time", "arrival_time")
+        ).filter(period__overlap=(start, end))
+    return Trip.objects.filter(departure_time__lt=end, arrival_time__gt=start)
+
+
+def lock_assignees(train_id: int, crew_ids: list[int]) -> None:
+    """
+    Lock rows of the train and crew members until the end of the
+    transaction, so concurrent assignments of them to trips are
+    checked for conflicts one after another
+    """
+    list(
+        Train.objects.select_for_update()
+        .filter(pk=train_id)
+        .values_list("pk", flat=True)
+    )
+    list(
+        Crew.objects.select_for_update()
+        .filter(pk__in=crew_ids)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+
+
+def format_ids(ids: Iterable[int]) -> str:
+    return ", ".join(map(str, sorted(set(ids))))
+
+
+def find_trip_conflicts(
+    departure_time: datetime,
+    arrival_time: datetime,
+    train_id: int,
+    crew_ids: list[int],
+    exclude_trip_id: int | None = None,
+) -> dict[str, list[str]]:
+    """
+    Return errors for the train and crew members already assigned
+    to trips overlapping the given period
+    """
+    trips = overlapping_trips(departure_time, arrival_time)
+    if exclude_trip_id is not None:
+        trips = trips.exclude(pk=exclude_trip_id)
+
+    errors = {}
+    train_trips = list(
+        trips.filter(train_id=train_id).values_list("id", flat=True)
+    )
+    if train_trips:
+        errors["train_id"] = [
+            f"Train is already assigned to overlapping trips: "
+            f"{format_ids(train_trips)}."
+        ]
+
+    if crew_ids:
+        crew_trips = defaultdict(list)
+        for crew_id, trip_id in Trip.crew.through.objects.filter(
+            crew_id__in=crew_ids, trip__in=trips.values("pk")
+        ).values_list("crew_id", "trip_id"):
+            crew_trips[crew_id].append(trip_id)
+        if crew_trips:
+            errors["crew_ids"] = [
+                f"Crew {crew_id} is already assigned to overlapping trips: "
+                f"{format_ids(trip_ids)}."
+                for crew_id, trip_ids in sorted(crew_trips.items())
+            ]
+    return errors
+
+
+def find_schedule_conflicts(
+    periods: list[tuple[datetime, datetime]],
+    train_id: int,
+    crew_ids: list[int],
+) -> dict[str, list[str]]:
+    """
+    Return errors for the train and crew members already assigned to
+    trips overlapping any of the periods, fetching trips of the whole
+    schedule window once and matching periods against interval trees
+    """
+    trips = overlapping_trips(periods[0][0], periods[-1][1])
+
+    train_index = IntervalIndex(
+        Interval(*row)
+        for row in trips.filter(train_id=train_id).values_list(
+            "departure_time", "arrival_time", "id"
+        )
+    )
+    crew_intervals = defaultdict(list)
+    for crew_id, *row in Trip.crew.through.objects.filter(
+        crew_id__in=crew_ids, trip__in=trips.values("pk")
+    ).values_list(
+        "crew_id", "trip__departure_time", "trip__arrival_time", "trip_id"
+    ):
+        crew_intervals[crew_id].append(Interval(*row))
+    crew_indexes = {
+        crew_id: IntervalIndex(intervals)
+        for crew_id, intervals in crew_intervals.items()
+    }
+
+    train_trips = []
+    crew_trips = defaultdict(list)
+    for start, end in periods:
+        train_trips.extend(
+            interval.trip_id
+            for interval in train_index.overlapping(start, end)
+        )
+        for crew_id, index in crew_indexes.items():
+            crew_trips[crew_id].extend(
+                interval.trip_id for interval in index.overlapping(start, end)
+            )
+
+    errors = {}
+    if train_trips:
+        errors["train_id"] = [
+            f"Train is already assigned to overlapping trips: "
+            f"{format_ids(train_trips)}."
+        ]
+    crew_errors = [
+        f"Crew {crew_id} is already assigned to overlapping trips: "
+        f"{format_ids(trip_ids)}."
+        for crew_id, trip_ids in sorted(crew_trips.items())
+        if trip_ids
+    ]
+    if crew_errors:
+        errors["crew_ids"] = crew_errors
+    return errors
+
+
+def find_conflicts(start: datetime, end: datetime) -> list[dict]:
+    """
+    Return pairs of overlapping trips during [start, end) sharing
+    a train or a crew member
+    """
+    trips = overlapping_trips(start, end)
+    resources = defaultdict(list)
+    names = {}
+    for trip_id, departure_time, arrival_time, train_id, name in (
+        trips.values_list(
+            "id", "departure_time", "arrival_time", "train_id", "train__name"
+        )
+    ):
+        resources["train", train_id].append(
+            Interval(departure_time, arrival_time, trip_id)
+        )
+        names["train", train_id] = name
+    for (
+        trip_id, departure_time, arrival_time, crew_id, first_name, last_name
+    ) in Trip.crew.through.objects.filter(
+        trip__in=trips.values("pk")
+    ).values_list(
+        "trip_id",
+        "trip__departure_time",
+        "trip__arrival_time",
+        "crew_id",
+        "crew__first_name",
+        "crew__last_name",
+    ):
+        resources["crew", crew_id].append(
+            Interval(departure_time, arrival_time, trip_id)
+        )
+        names["crew", crew_id] = f"{first_name} {last_name}"
+
+    conflicts = []
+    for (resource, resource_id), intervals in sorted(resources.items()):
+        if len(intervals) < 2:
+            continue
+        index = IntervalIndex(intervals)
+        for interval in sorted(intervals):
+            for other in index.overlapping(interval.start, interval.end):
+                if other.trip_id > interval.trip_id:
+                    conflicts.append(
+                        {
+                            "resource": resource,
+                            "id": resource_id,
+                            "name": names[resource, resource_id],
+                            "trips": [interval.trip_id, other.trip_id],
+                        }
+                    )
+    return conflicts
@@ -0,0 +1,99 @@
+import heapq
+import threading
+from collections import defaultdict
+
+from station_api.cache import get_model_versions
+from station_api.models import Route
+
+
+class StationDistances:
+    """
+    Shortest network distances between stations over routes.
+    Distances from every source station are computed with Dijkstra's
+    algorithm on first request and memoized until the shared change
+    version of routes differs from the one the graph was loaded at.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._versions: list[int] | None = None
+        self._graph: dict[int, list[tuple[int, float]]] = {}
+        self._from_source: dict[
+            int, tuple[dict[int, float], dict[int, int]]
+        ] = {}
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._versions = None
+            self._graph = {}
+            self._from_source = {}
+
+    def _get_graph(self) -> tuple[
+        dict[int, list[tuple[int, float]]],
+        dict[int, tuple[dict[int, float], dict[int, int]]],
+    ]:
+        """Return route graph and search results memoized for it"""
+        # Read before routes, so a change committed while loading
+        # leaves the version outdated and the next call reloads again
+        versions = get_model_versions(Route)
+        with self._lock:
+            if self._versions == versions:
+                return self._graph, self._from_source
+
+        graph = defaultdict(list)
+        for source_id, destination_id, distance in (
+            Route.objects.order_by()
+            .values_list("source_id", "destination_id", "distance")
+            .iterator()
+        ):
+            graph[source_id].append((destination_id, distance))
+        from_source = {}
+        with self._lock:
+            self._versions = versions
+            self._graph, self._from_source = graph, from_source
+        return graph, from_source
+
+    def _search(
+        self,
+        source_id: int
+    ) -> tuple[dict[int, float], dict[int, int]]:
+        """Return distances and previous stations of shortest paths"""
+        graph, from_source = self._get_graph()
+        result = from_source.get(source_id)
+        if result is not None:
+            return result
+
+        distances = {source_id: 0.0}
+        previous = {}
+        queue = [(0.0, source_id)]
+        while queue:
+            distance, station_id = heapq.heappop(queue)
+            if distance > distances[station_id]:
+                continue
+            for next_id, route_distance in graph.get(station_id, ()):
+                next_distance = distance + route_distance
+                if next_distance < distances.get(next_id, float("inf")):
+                    distances[next_id] = next_distance
+                    previous[next_id] = station_id
+                    heapq.heappush(queue, (next_distance, next_id))
+
+        with self._lock:
+            # Results of an outdated graph go to its own memo only
+            from_source[source_id] = (distances, previous)
+        return distances, previous
+
+    def distance(self, source_id: int, destination_id: int) -> float | None:
+        return self._search(source_id)[0].get(destination_id)
+
+    def path(self, source_id: int, destination_id: int) -> list[int]:
+        """Return station ids of the shortest path, empty if unreachable"""
+        distances, previous = self._search(source_id)
+        if destination_id not in distances:
+            return []
+        path = [destination_id]
+        while path[-1] != source_id:
+            path.append(previous[path[-1]])
+        return path[::-1]
+
+
+station_distances = StationDistances()
@@ -1,22 +1,29 @@
+from datetime import datetime, time, timedelta
+
 import django_filters
 from django.db.models import (
     Q,
     F,
-    Count,
     ExpressionWrapper,
     QuerySet,
     IntegerField,
 )
+from django.utils import timezone
 
 from station_api.models import Station, Route, Crew, TrainType, Train, Trip
+from station_api.search import search_by_name
 
 
 class StationFilter(django_filters.FilterSet):
     name = django_filters.CharFilter(lookup_expr="icontains")
+    search = django_filters.CharFilter(method="filter_search")
 
     class Meta:
         model = Station
-        fields = ("name",)
+        fields = ("name", "search")
+
+    def filter_search(self, queryset, name, value) -> QuerySet:
+        return search_by_name(queryset, "name", value)
 
 
 class RouteFilter(django_filters.FilterSet):
@@ -36,10 +43,11 @@ class RouteFilter(django_filters.FilterSet):
 
 class CrewFilter(django_filters.FilterSet):
     full_name = django_filters.CharFilter(method="filter_by_full_name")
+    search = django_filters.CharFilter(method="filter_search")
 
     class Meta:
         model = Crew
-        fields = ["full_name"]
+        fields = ["full_name", "search"]
 
     def filter_by_full_name(self, queryset, name, value) -> QuerySet:
         names = value.split()
@@ -53,6 +61,9 @@ class CrewFilter(django_filters.FilterSet):
             Q(first_name__icontains=value) | Q(last_name__icontains=value)
         )
 
+    def filter_search(self, queryset, name, value) -> QuerySet:
+        return search_by_name(queryset, ("first_name", "last_name"), value)
+
 
 class TrainTypeFilter(django_filters.FilterSet):
     name = django_filters.CharFilter(lookup_expr="icontains")
@@ -93,8 +104,7 @@ class TrainFilter(django_filters.FilterSet):
 
 class TripFilter(django_filters.FilterSet):
     departure_date = django_filters.DateFilter(
-        field_name="departure_time",
-        lookup_expr="date"
+        method="filter_departure_date"
     )
     source_station = django_filters.CharFilter(
         field_name="route__source__name",
@@ -122,13 +132,25 @@ class TripFilter(django_filters.FilterSet):
             "train_type"
         )
 
+    def filter_departure_date(self, queryset, name, value) -> QuerySet:
+        """
+        Compare departure time with the bounds of the day instead of
+        casting it to a date, so the departure time index can be used
+        """
+        return queryset.filter(
+            departure_time__gte=timezone.make_aware(
+                datetime.combine(value, time.min)
+            ),
+            departure_time__lt=timezone.make_aware(
+                datetime.combine(value + timedelta(days=1), time.min)
+            ),
+        )
+
     def filter_tickets_available(self, queryset, name, value) -> QuerySet:
         if value:
-            return queryset.annotate(
-                tickets_available=(
-                    F("train__cargo_num")
-                    * F("train__places_in_cargo")
-                    - Count("tickets")
+            return queryset.filter(
+                tickets_sold__lt=(
+                    F("train__cargo_num") * F("train__places_in_cargo")
                 )
-            ).filter(tickets_available__gt=0)
+            )
         return queryset
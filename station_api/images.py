@@ -0,0 +1,136 @@
+import io
+import os
+from typing import IO, Iterable
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db.models.fields.files import FieldFile
+from PIL import Image, ImageOps
+from rest_framework.request import Request
+
+
+RENDITION_EXTENSIONS = {"WEBP": "webp", "JPEG": "jpg"}
+
+# Raised by Pillow for images it cannot decode
+IMAGE_ERRORS = (OSError, Image.DecompressionBombError)
+
+
+def rendition_name(name: str, rendition: str) -> str:
+    """Storage name of the rendition, next to the original image"""
+    directory, filename = os.path.split(name)
+    stem, _ = os.path.splitext(filename)
+    extension = RENDITION_EXTENSIONS[settings.IMAGE_RENDITION_FORMAT]
+    return os.path.join(
+        directory, "renditions", f"{stem}-{rendition}.{extension}"
+    )
+
+
+def render(image: Image.Image, size: int) -> bytes:
+    """Encode image scaled down to fit a `size` pixels square"""
+    image = image.copy()
+    image.thumbnail((size, size), Image.Resampling.LANCZOS)
+    image_format = settings.IMAGE_RENDITION_FORMAT
+    if image_format == "WEBP" and image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+    else:
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(
+        buffer, format=image_format, quality=settings.IMAGE_RENDITION_QUALITY
+    )
+    return buffer.getvalue()
+
+
+def render_renditions(
+    file: IO[bytes], renditions: Iterable[str] | None = None
+) -> dict[str, bytes]:
+    """
+    Encode renditions of the image file, all configured ones by
+    default. The image is decoded once, JPEG images at the smallest
+    scale still larger than the biggest rendition. Raises one of
+    IMAGE_ERRORS for images Pillow cannot decode.
+    """
+    if renditions is None:
+        renditions = settings.IMAGE_RENDITIONS
+    sizes = {
+        rendition: settings.IMAGE_RENDITIONS[rendition]
+        for rendition in renditions
+    }
+    if not sizes:
+        return {}
+
+    file.seek(0)
+    try:
+        with Image.open(file) as original:
+            largest = max(sizes.values())
+            original.draft("RGB", (largest, largest))
+            image = ImageOps.exif_transpose(original)
+            image.load()
+    finally:
+        file.seek(0)
+    return {
+        rendition: render(image, size) for rendition, size in sizes.items()
+    }
+
+
+def save_renditions(
+    field_file: FieldFile, renditions: dict[str, bytes]
+) -> None:
+    storage = field_file.storage
+    for rendition, data in renditions.items():
+        name = rendition_name(field_file.name, rendition)
+        storage.delete(name)
+        saved = storage.save(name, ContentFile(data))
+        if saved != name:
+            # Rendition was saved by a concurrent build meanwhile
+            storage.delete(saved)
+
+
+def missing_renditions(field_file: FieldFile) -> list[str]:
+    return [
+        rendition for rendition in settings.IMAGE_RENDITIONS
+        if not field_file.storage.exists(
+            rendition_name(field_file.name, rendition)
+        )
+    ]
+
+
+def build_renditions(
+    field_file: FieldFile, renditions: Iterable[str] | None = None
+) -> None:
+    """Render and save renditions of a stored image"""
+    with field_file.open("rb"):
+        rendered = render_renditions(field_file, renditions)
+    save_renditions(field_file, rendered)
+
+
+def rendition_urls(
+    field_file: FieldFile, request: Request | None = None
+) -> dict[str, str] | None:
+    """
+    Return URLs of the image renditions, None for an empty image.
+    Renditions are saved on upload, and by the build_image_renditions
+    command for images stored before, so they are not checked here.
+    """
+    if not field_file:
+        return None
+
+    urls = {
+        rendition: field_file.storage.url(
+            rendition_name(field_file.name, rendition)
+        )
+        for rendition in settings.IMAGE_RENDITIONS
+    }
+    if request is not None:
+        urls = {
+            rendition: request.build_absolute_uri(url)
+            for rendition, url in urls.items()
+        }
+    return urls
+
+
+def delete_renditions(field_file: FieldFile) -> None:
+    if not field_file:
+        return
+    for rendition in settings.IMAGE_RENDITIONS:
+        field_file.storage.delete(rendition_name(field_file.name, rendition))
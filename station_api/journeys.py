@@ -0,0 +1,162 @@
+import threading
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+
+from station_api.cache import get_model_versions
+from station_api.models import Route, Trip
+
+
+class Connection(NamedTuple):
+    departure: float
+    trip_id: int
+    source_id: int
+    destination_id: int
+    arrival: float
+
+
+class JourneyPlanner:
+    """
+    In-memory timetable of trips sorted by departure time, searched with
+    the Connection Scan Algorithm. Every trip is a single connection
+    between the source and the destination of its route. The timetable
+    is reloaded when shared change versions of trips or routes differ
+    from the loaded ones, so changes made by any worker are picked up.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._versions: list[int] | None = None
+        self._timetable: tuple[list[float], list[Connection]] = ([], [])
+
+    @staticmethod
+    def _connections_from_db(trips) -> list[Connection]:
+        return [
+            Connection(
+                departure_time.timestamp(),
+                trip_id,
+                source_id,
+                destination_id,
+                arrival_time.timestamp(),
+            )
+            for (
+                trip_id,
+                source_id,
+                destination_id,
+                departure_time,
+                arrival_time,
+            ) in trips.order_by().values_list(
+                "id",
+                "route__source_id",
+                "route__destination_id",
+                "departure_time",
+                "arrival_time",
+            ).iterator()
+        ]
+
+    def load(
+        self, versions: list[int] | None = None
+    ) -> tuple[list[float], list[Connection]]:
+        if versions is None:
+            versions = get_model_versions(Trip, Route)
+        connections = sorted(self._connections_from_db(Trip.objects.all()))
+        # Departures and connections are swapped in one assignment
+        timetable = (
+            [connection.departure for connection in connections],
+            connections,
+        )
+        with self._lock:
+            self._timetable, self._versions = timetable, versions
+        return timetable
+
+    def get_timetable(self) -> tuple[list[float], list[Connection]]:
+        """Return the timetable, reloading it after trips or routes change"""
+        # Versions are read before trips, so a change committed while
+        # loading leaves them outdated and the next call reloads again
+        versions = get_model_versions(Trip, Route)
+        with self._lock:
+            if self._versions == versions:
+                return self._timetable
+        return self.load(versions)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._timetable = ([], [])
+            self._versions = None
+
+    def plan(
+        self,
+        source_id: int,
+        destination_id: int,
+        departure_after: datetime,
+        min_transfer_time: timedelta,
+        timetable: tuple[list[float], list[Connection]] | None = None,
+    ) -> list[Connection]:
+        """
+        Return connections of the earliest arriving journey
+        or an empty list if destination is unreachable
+        """
+        if timetable is None:
+            timetable = self.get_timetable()
+        departures, connections = timetable
+        transfer = min_transfer_time.total_seconds()
+        start = departure_after.timestamp()
+
+        never = float("inf")
+        arrival = {source_id: start}
+        ready = {source_id: start}
+        reached_by = {}
+        for index in range(bisect_left(departures, start), len(connections)):
+            connection = connections[index]
+            if arrival.get(destination_id, never) <= connection.departure:
+                break
+            if ready.get(connection.source_id, never) > connection.departure:
+                continue
+            if connection.arrival < arrival.get(
+                connection.destination_id, never
+            ):
+                arrival[connection.destination_id] = connection.arrival
+                ready[connection.destination_id] = (
+                    connection.arrival + transfer
+                )
+                reached_by[connection.destination_id] = connection
+
+        legs = []
+        station_id = destination_id
+        while station_id in reached_by:
+            connection = reached_by[station_id]
+            legs.append(connection)
+            station_id = connection.source_id
+        if station_id != source_id:
+            return []
+        return legs[::-1]
+
+    def plan_many(
+        self,
+        source_id: int,
+        destination_id: int,
+        departure_after: datetime,
+        min_transfer_time: timedelta,
+        limit: int,
+    ) -> list[list[Connection]]:
+        """Return up to `limit` journeys, each departing after the previous"""
+        timetable = self.get_timetable()
+        journeys = []
+        while len(journeys) < limit:
+            legs = self.plan(
+                source_id,
+                destination_id,
+                departure_after,
+                min_transfer_time,
+                timetable,
+            )
+            if not legs:
+                break
+            journeys.append(legs)
+            departure_after = datetime.fromtimestamp(
+                legs[0].departure + 1, tz=timezone.utc
+            )
+        return journeys
+
+
+journey_planner = JourneyPlanner()
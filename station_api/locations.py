@@ -0,0 +1,182 @@
+import heapq
+import math
+import threading
+from typing import Iterable, NamedTuple
+
+from station_api.cache import get_model_versions
+from station_api.models import Station
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+Point = tuple[float, float, float]
+
+
+def to_unit_vector(latitude: float, longitude: float) -> Point:
+    """Return point of the unit sphere at given coordinates in degrees"""
+    phi = math.radians(latitude)
+    lam = math.radians(longitude)
+    return (
+        math.cos(phi) * math.cos(lam),
+        math.cos(phi) * math.sin(lam),
+        math.sin(phi),
+    )
+
+
+def chord_to_km(chord: float) -> float:
+    """Great-circle distance of points of the unit sphere `chord` apart"""
+    return 2 * EARTH_RADIUS_KM * math.asin(min(chord / 2, 1.0))
+
+
+def km_to_chord(distance: float) -> float:
+    return 2 * math.sin(min(distance / (2 * EARTH_RADIUS_KM), math.pi / 2))
+
+
+class Location(NamedTuple):
+    point: Point
+    station_id: int
+    name: str
+    latitude: float
+    longitude: float
+
+
+class KDTree:
+    """
+    Static k-d tree of locations on the unit sphere.
+    Nodes are kept in an implicit binary tree over one list: every
+    range is ordered by the split axis and its middle is the node.
+    Chord length between points grows with great-circle distance, so
+    the nearest points by chord are the nearest on the Earth too.
+    """
+
+    def __init__(self, locations: Iterable[Location]) -> None:
+        self._nodes = list(locations)
+        self._build(0, len(self._nodes), 0)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _build(self, lo: int, hi: int, axis: int) -> None:
+        if hi - lo <= 1:
+            return
+        self._nodes[lo:hi] = sorted(
+            self._nodes[lo:hi], key=lambda location: location.point[axis]
+        )
+        mid = (lo + hi) // 2
+        self._build(lo, mid, (axis + 1) % 3)
+        self._build(mid + 1, hi, (axis + 1) % 3)
+
+    def nearest(
+        self, point: Point, k: int, max_chord: float = 2.0
+    ) -> list[tuple[float, Location]]:
+        """
+        Return up to k locations not farther than `max_chord` from the
+        point as (chord, location) pairs, nearest first
+        """
+        bound = max_chord * max_chord
+        # Max-heap of the best candidates found so far
+        heap: list[tuple[float, int, int]] = []
+        stack = [(0, len(self._nodes), 0, 0.0)]
+        while stack:
+            lo, hi, axis, gap = stack.pop()
+            if lo >= hi:
+                continue
+            if gap > (-heap[0][0] if len(heap) == k else bound):
+                continue
+            mid = (lo + hi) // 2
+            location = self._nodes[mid]
+            distance = sum(
+                (a - b) * (a - b) for a, b in zip(point, location.point)
+            )
+            if distance <= bound:
+                candidate = (-distance, -location.station_id, mid)
+                if len(heap) < k:
+                    heapq.heappush(heap, candidate)
+                elif candidate > heap[0]:
+                    heapq.heapreplace(heap, candidate)
+
+            diff = point[axis] - location.point[axis]
+            near, far = (lo, mid), (mid + 1, hi)
+            if diff > 0:
+                near, far = far, near
+            next_axis = (axis + 1) % 3
+            # Nearer side is pushed last to be searched first
+            stack.append((*far, next_axis, diff * diff))
+            stack.append((*near, next_axis, gap))
+
+        return [
+            (math.sqrt(-distance), self._nodes[mid])
+            for distance, _station_id, mid in sorted(heap, reverse=True)
+        ]
+
+
+class StationLocator:
+    """
+    In-memory spatial index of stations answering nearest station
+    queries. The index is loaded on first request and rebuilt when the
+    shared change version of stations differs from the loaded one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._versions: list[int] | None = None
+        self._tree: KDTree | None = None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._versions = None
+            self._tree = None
+
+    def _get_tree(self) -> KDTree:
+        # Read before stations, so a change committed while loading
+        # leaves the version outdated and the next call reloads again
+        versions = get_model_versions(Station)
+        with self._lock:
+            if self._tree is not None and self._versions == versions:
+                return self._tree
+
+        tree = KDTree(
+            Location(
+                to_unit_vector(latitude, longitude),
+                station_id,
+                name,
+                latitude,
+                longitude,
+            )
+            for station_id, name, latitude, longitude in (
+                Station.objects.order_by()
+                .values_list("id", "name", "latitude", "longitude")
+                .iterator()
+            )
+        )
+        with self._lock:
+            self._versions, self._tree = versions, tree
+        return tree
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        limit: int,
+        radius: float | None = None,
+    ) -> list[dict]:
+        """
+        Return up to `limit` stations nearest to the coordinates,
+        within `radius` km if given, with distances in km
+        """
+        max_chord = 2.0 if radius is None else km_to_chord(radius)
+        return [
+            {
+                "id": location.station_id,
+                "name": location.name,
+                "latitude": location.latitude,
+                "longitude": location.longitude,
+                "distance": round(chord_to_km(chord), 3),
+            }
+            for chord, location in self._get_tree().nearest(
+                to_unit_vector(latitude, longitude), limit, max_chord
+            )
+        ]
+
+
+station_locator = StationLocator()
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from station_api.images import (
+    IMAGE_ERRORS,
+    build_renditions,
+    missing_renditions,
+)
+from station_api.models import Crew, Train
+
+
+class Command(BaseCommand):
+    help = "Builds renditions missing for stored crew and train images"
+
+    def handle(self, *args, **options) -> None:
+        built = 0
+        failed = 0
+        for model, field in ((Crew, "crew_image"), (Train, "train_image")):
+            queryset = model.objects.exclude(**{field: ""}).only(field)
+            for instance in queryset.iterator():
+                field_file = getattr(instance, field)
+                renditions = missing_renditions(field_file)
+                if not renditions:
+                    continue
+                try:
+                    build_renditions(field_file, renditions)
+                except IMAGE_ERRORS as error:
+                    failed += 1
+                    self.stderr.write(
+                        f"{model.__name__} {instance.id}: "
+                        f"cannot render {field_file.name} ({error})"
+                    )
+                else:
+                    built += 1
+
+        if failed:
+            raise CommandError(
+                f"Built renditions of {built} image(s), {failed} failed"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Built renditions of {built} image(s)")
+        )
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from station_api.models import SeatHold
+
+
+class Command(BaseCommand):
+    help = "Deletes expired seat holds"
+
+    def handle(self, *args, **options) -> None:
+        deleted, _ = SeatHold.objects.filter(
+            expires_at__lte=timezone.now()
+        ).delete()
+        self.stdout.write(
+            self.style.SUCCESS(f"Deleted {deleted} expired seat hold(s)")
+        )
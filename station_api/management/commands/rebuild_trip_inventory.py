@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from station_api.cache import invalidate_model
+from station_api.models import Trip
+
+
+class Command(BaseCommand):
+    help = "Rebuilds (or verifies) trip sold counters and seat maps"
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report trips with out of sync inventory",
+        )
+
+    def handle(self, *args, **options) -> None:
+        with transaction.atomic():
+            trips = Trip.collect_stale_inventory(Trip.objects.all())
+            for trip in trips:
+                self.stdout.write(
+                    f"Trip {trip.id}: out of sync, "
+                    f"actual tickets sold {trip.tickets_sold}"
+                )
+
+            if options["check"]:
+                if trips:
+                    raise CommandError(
+                        f"{len(trips)} trip inventory(ies) out of sync"
+                    )
+                self.stdout.write(
+                    self.style.SUCCESS("All trip inventories in sync")
+                )
+                return
+
+            Trip.objects.bulk_update(trips, ["tickets_sold", "seat_map"])
+            invalidate_model(Trip)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {len(trips)} trip inventory(ies)")
+        )
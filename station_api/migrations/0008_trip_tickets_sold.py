@@ -0,0 +1,34 @@
+# Generated by Django 5.1.2 on 2026-10-18 02:54
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_tickets_sold(apps, schema_editor):
+    Trip = apps.get_model("station_api", "Trip")
+    Ticket = apps.get_model("station_api", "Ticket")
+    sold = (
+        Ticket.objects.filter(trip=OuterRef("pk"))
+        .order_by()
+        .values("trip")
+        .annotate(sold=Count("pk"))
+        .values("sold")
+    )
+    Trip.objects.update(tickets_sold=Coalesce(Subquery(sold), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("station_api", "0007_alter_crew_crew_image_alter_train_train_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="trip",
+            name="tickets_sold",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_tickets_sold, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.1.2 on 2026-10-18 02:57
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def build_seat_map(places, cargo_num, places_in_cargo):
+    """
+    Copy of station_api.seat_maps.build_seat_map at the time of this
+    migration: one bit per place, most significant bit first, places
+    ordered by cargo and then by seat
+    """
+    data = bytearray((cargo_num * places_in_cargo + 7) // 8)
+    for cargo, seat in places:
+        if not (1 <= cargo <= cargo_num and 1 <= seat <= places_in_cargo):
+            continue
+        index = (cargo - 1) * places_in_cargo + seat - 1
+        data[index // 8] |= 0x80 >> (index % 8)
+    return bytes(data)
+
+
+def fill_seat_maps(apps, schema_editor):
+    Trip = apps.get_model("station_api", "Trip")
+    Ticket = apps.get_model("station_api", "Ticket")
+    places = defaultdict(list)
+    for trip_id, cargo, seat in Ticket.objects.values_list(
+        "trip_id", "cargo", "seat"
+    ).iterator():
+        places[trip_id].append((cargo, seat))
+
+    trips = list(Trip.objects.select_related("train"))
+    for trip in trips:
+        trip.seat_map = build_seat_map(
+            places.get(trip.id, []),
+            trip.train.cargo_num,
+            trip.train.places_in_cargo,
+        )
+    Trip.objects.bulk_update(trips, ["seat_map"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("station_api", "0008_trip_tickets_sold"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="trip",
+            name="seat_map",
+            field=models.BinaryField(default=b"", editable=False),
+        ),
+        migrations.RunPython(fill_seat_maps, migrations.RunPython.noop),
+    ]
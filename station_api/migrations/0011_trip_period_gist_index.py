@@ -0,0 +1,32 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:40
+
+from django.db import migrations
+
+
+INDEX_NAME = "station_api_trip_period_gist"
+
+
+def create_period_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON station_api_trip "
+        f"USING gist (TSTZRANGE(departure_time, arrival_time))"
+    )
+
+
+def drop_period_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("station_api", "0010_seathold"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_period_index, drop_period_index),
+    ]
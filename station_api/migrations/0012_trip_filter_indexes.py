@@ -0,0 +1,33 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:39
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("station_api", "0011_trip_period_gist_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="station",
+            index=models.Index(
+                django.db.models.functions.text.Upper("name"),
+                name="station_name_upper_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trip",
+            index=models.Index(
+                fields=["departure_time"], name="trip_departure_time_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trip",
+            index=models.Index(
+                fields=["route", "departure_time"], name="trip_route_departure_time_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.2 on 2026-10-18 05:10
+
+from django.db import migrations
+
+
+# Indexes are built on UPPER(column) because icontains compiles to
+# UPPER(column::text) LIKE UPPER('%value%') on PostgreSQL
+TRIGRAM_INDEXES = (
+    ("station_name_trgm_idx", "station_api_station", "name"),
+    ("crew_first_name_trgm_idx", "station_api_crew", "first_name"),
+    ("crew_last_name_trgm_idx", "station_api_crew", "last_name"),
+    ("train_type_name_trgm_idx", "station_api_traintype", "name"),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} "
+            f"USING gin ((UPPER({column}::text)) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for index_name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("station_api", "0012_trip_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.1.2 on 2026-10-18 03:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_user_trips(apps, schema_editor):
+    Ticket = apps.get_model("station_api", "Ticket")
+    UserTrip = apps.get_model("station_api", "UserTrip")
+    UserTrip.objects.bulk_create(
+        UserTrip(user_id=user_id, trip_id=trip_id, tickets=tickets)
+        for user_id, trip_id, tickets in (
+            Ticket.objects
+            .order_by()
+            .values("order__user_id", "trip_id")
+            .annotate(tickets=Count("id"))
+            .values_list("order__user_id", "trip_id", "tickets")
+            .iterator()
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("station_api", "0013_trigram_name_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserTrip",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("tickets", models.PositiveIntegerField(default=0)),
+                (
+                    "trip",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_trips",
+                        to="station_api.trip",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_trips",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "trip"), name="unique_user_trip"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_user_trips, migrations.RunPython.noop),
+    ]
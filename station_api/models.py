@@ -1,10 +1,24 @@
+from collections import defaultdict
 from datetime import datetime
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, FileExtensionValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models import (
+    F,
+    Value,
+    QuerySet,
+    Case,
+    When,
+    Q,
+    Count,
+    Min,
+    Sum,
+)
+from django.db.models.functions import Coalesce, Greatest, Upper
 
+from station_api.seat_maps import build_seat_map, fit_seat_map, mark_seats
 from station_api.utils import train_image_file_path, crew_image_file_path
 from station_api.validators import (
     validate_latitude,
@@ -20,6 +34,10 @@ class Station(models.Model):
 
     class Meta:
         ordering = ("name",)
+        indexes = [
+            # Serves case insensitive (iexact) station name lookups
+            models.Index(Upper("name"), name="station_name_upper_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -148,9 +166,21 @@ class Trip(models.Model):
         related_name="trips",
         blank=True
     )
+    tickets_sold = models.PositiveIntegerField(default=0, editable=False)
+    seat_map = models.BinaryField(default=b"", editable=False)
 
     class Meta:
         ordering = ("departure_time",)
+        indexes = [
+            models.Index(
+                fields=["departure_time"],
+                name="trip_departure_time_idx"
+            ),
+            models.Index(
+                fields=["route", "departure_time"],
+                name="trip_route_departure_time_idx"
+            ),
+        ]
 
     def __str__(self) -> str:
         return (
@@ -176,6 +206,84 @@ class Trip(models.Model):
             error_to_raise=ValidationError
         )
 
+    @staticmethod
+    def update_seats(
+        trip_id: int,
+        places: list[tuple[int, int]],
+        taken: bool = True,
+    ) -> None:
+        """Mark places as taken (or free) in trip counter and seat map"""
+        with transaction.atomic():
+            trip = (
+                Trip.objects
+                .select_for_update(of=("self",))
+                .select_related("train")
+                .only(
+                    "seat_map",
+                    "train__cargo_num",
+                    "train__places_in_cargo"
+                )
+                .filter(pk=trip_id)
+                .first()
+            )
+            if trip is None:
+                return
+            delta = len(places) if taken else -len(places)
+            Trip.objects.filter(pk=trip_id).update(
+                tickets_sold=Greatest(F("tickets_sold") + delta, Value(0)),
+                seat_map=mark_seats(
+                    trip.seat_map,
+                    places,
+                    trip.train.cargo_num,
+                    trip.train.places_in_cargo,
+                    taken=taken,
+                ),
+            )
+
+    @staticmethod
+    def collect_stale_inventory(trips: QuerySet) -> list["Trip"]:
+        """
+        Return trips whose sold tickets counter or seat map
+        differs from their tickets, with actual values set.
+        """
+        places = defaultdict(list)
+        for trip_id, cargo, seat in (
+            Ticket.objects
+            .filter(trip__in=trips.values("pk"))
+            .order_by()
+            .values_list("trip_id", "cargo", "seat")
+            .iterator()
+        ):
+            places[trip_id].append((cargo, seat))
+
+        stale = []
+        for trip in (
+            trips
+            .select_related("train")
+            .only(
+                "tickets_sold",
+                "seat_map",
+                "train__cargo_num",
+                "train__places_in_cargo"
+            )
+            .iterator()
+        ):
+            trip_places = places.get(trip.id, [])
+            seat_map = build_seat_map(
+                trip_places,
+                trip.train.cargo_num,
+                trip.train.places_in_cargo,
+            )
+            if (
+                trip.tickets_sold != len(trip_places)
+                or fit_seat_map(trip.seat_map, trip.train.capacity)
+                != seat_map
+            ):
+                trip.tickets_sold = len(trip_places)
+                trip.seat_map = seat_map
+                stale.append(trip)
+        return stale
+
     def save(self, *args, **kwargs) -> None:
         self.full_clean()
         super().save(*args, **kwargs)
@@ -255,3 +363,109 @@ class Ticket(models.Model):
     def save(self, *args, **kwargs) -> None:
         self.full_clean()
         super().save(*args, **kwargs)
+
+
+class UserTrip(models.Model):
+    """
+    Number of tickets a user holds for a trip, maintained as orders
+    are created and tickets deleted
+    """
+
+    user = models.ForeignKey(
+        to=settings.AUTH_USER_MODEL,
+        related_name="user_trips",
+        on_delete=models.CASCADE
+    )
+    trip = models.ForeignKey(
+        to=Trip,
+        related_name="user_trips",
+        on_delete=models.CASCADE
+    )
+    tickets = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "trip"],
+                name="unique_user_trip"
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.trip} - {self.tickets} tickets"
+
+    @staticmethod
+    def add_tickets(user_id: int, trips_tickets: dict[int, int]) -> None:
+        """
+        Add numbers of tickets (negative to subtract) to user trips.
+        Rows are only created for added tickets, so removing tickets of
+        a user or trip being deleted does not insert new references
+        """
+        UserTrip.objects.bulk_create(
+            [
+                UserTrip(user_id=user_id, trip_id=trip_id)
+                for trip_id, tickets in trips_tickets.items()
+                if tickets > 0
+            ],
+            ignore_conflicts=True,
+        )
+        UserTrip.objects.filter(
+            user_id=user_id, trip_id__in=trips_tickets
+        ).update(
+            tickets=Greatest(
+                F("tickets")
+                + Case(
+                    *(
+                        When(trip_id=trip_id, then=Value(tickets))
+                        for trip_id, tickets in trips_tickets.items()
+                    ),
+                    default=Value(0),
+                    output_field=models.IntegerField(),
+                ),
+                Value(0),
+            )
+        )
+
+    @staticmethod
+    def summary(user_id: int, now: datetime) -> dict:
+        """Aggregate trips and tickets of user relative to `now`"""
+        upcoming = Q(trip__departure_time__gt=now)
+        return UserTrip.objects.filter(
+            user_id=user_id, tickets__gt=0
+        ).aggregate(
+            upcoming_trips=Count("id", filter=upcoming),
+            past_trips=Count("id", filter=~upcoming),
+            next_departure=Min("trip__departure_time", filter=upcoming),
+            total_tickets=Coalesce(Sum("tickets"), 0),
+        )
+
+
+class SeatHold(models.Model):
+    cargo = models.PositiveSmallIntegerField()
+    seat = models.PositiveSmallIntegerField()
+    trip = models.ForeignKey(
+        to=Trip,
+        related_name="seat_holds",
+        on_delete=models.CASCADE
+    )
+    user = models.ForeignKey(
+        to=settings.AUTH_USER_MODEL,
+        related_name="seat_holds",
+        on_delete=models.CASCADE
+    )
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["cargo", "seat", "trip"],
+                name="unique_cargo_seat_trip_hold"
+            )
+        ]
+        ordering = ("expires_at",)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.trip} - (cargo: {self.cargo}, seat: {self.seat}) "
+            f"held until {self.expires_at.strftime("%d %b %Y %H:%M")}"
+        )
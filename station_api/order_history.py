@@ -0,0 +1,44 @@
+from typing import Iterable
+
+from django.db.models import F, Prefetch, prefetch_related_objects
+
+from station_api.models import Order, Ticket, Trip
+
+
+def load_order_history(orders: Iterable[Order]) -> list[Order]:
+    """
+    Attach tickets to orders with one query joining their trips,
+    routes, stations, trains and train types. Trips repeated across
+    tickets are replaced by one shared instance per trip carrying
+    `tickets_available`
+    """
+    orders = list(orders)
+    prefetch_related_objects(
+        orders,
+        Prefetch(
+            "tickets",
+            queryset=Ticket.objects.select_related(
+                "trip__route__source",
+                "trip__route__destination",
+                "trip__train__train_type",
+            ).defer(
+                "trip__seat_map"
+            ).annotate(
+                trip_tickets_available=(
+                    F("trip__train__cargo_num")
+                    * F("trip__train__places_in_cargo")
+                    - F("trip__tickets_sold")
+                )
+            ),
+        ),
+    )
+
+    trips: dict[int, Trip] = {}
+    for order in orders:
+        for ticket in order.tickets.all():
+            trip = trips.get(ticket.trip_id)
+            if trip is None:
+                trip = trips[ticket.trip_id] = ticket.trip
+                trip.tickets_available = ticket.trip_tickets_available
+            ticket.trip = trip
+    return orders
@@ -1,35 +1,190 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from functools import cached_property, partial
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.paginator import (
+    Paginator,
+    Page,
+    EmptyPage,
+    PageNotAnInteger,
+)
+from django.db import connections
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class InexactCountPage(Page):
+    has_more = False
+
+    def has_next(self) -> bool:
+        return self.has_more
+
+
+class CountStrategyPaginator(Paginator):
+    """
+    Django paginator with a configurable count strategy:
+    - "exact": COUNT(*) of the whole queryset;
+    - "capped": count up to `count_cap` rows only;
+    - "estimated": PostgreSQL planner statistics for unfiltered
+      querysets, "capped" otherwise.
+    Pages of inexact counts are not limited by the number of counted
+    pages, next page existence is checked by fetching one more row.
+    """
+
+    def __init__(
+        self,
+        *args,
+        count_strategy: str = "exact",
+        count_cap: int = 1000,
+        **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.count_strategy = count_strategy
+        self.count_cap = count_cap
+
+    def estimate_count(self) -> int | None:
+        queryset = self.object_list
+        if (
+            not isinstance(queryset, QuerySet)
+            or queryset.query.where
+            or queryset.query.distinct
+        ):
+            return None
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        if row is None or row[0] < 0:
+            return None
+        return row[0]
+
+    @cached_property
+    def counted(self) -> tuple[int, str]:
+        """Return count and its kind: "exact", "capped" or "estimated" """
+        if self.count_strategy == "exact":
+            return super().count, "exact"
+        if self.count_strategy == "estimated":
+            estimate = self.estimate_count()
+            if estimate is not None:
+                return estimate, "estimated"
+        count = self.object_list[:self.count_cap + 1].count()
+        if count > self.count_cap:
+            return self.count_cap, "capped"
+        return count, "exact"
+
+    @property
+    def count(self) -> int:
+        return self.counted[0]
+
+    @property
+    def count_kind(self) -> str:
+        return self.counted[1]
+
+    def validate_number(self, number) -> int:
+        if self.count_kind == "exact":
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number) -> Page:
+        number = self.validate_number(number)
+        if self.count_kind == "exact":
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        page = InexactCountPage(rows[:self.per_page], number, self)
+        page.has_more = len(rows) > self.per_page
+        return page
 
 
 class TrainStationPaginator(PageNumberPagination):
+    """
+    Page number pagination counting with PAGINATION_COUNT_STRATEGY,
+    views can override it with `pagination_count_strategy` attribute
+    """
+
     page_size = 5
     page_size_query_param = "per_page"
     max_page_size = 10
 
-    def get_paginated_response(self, data: dict) -> Response:
-        return Response(
-            {
-                "pages": self.page.paginator.num_pages,
-                "count": self.page.paginator.count,
-                "next": self.get_next_link(),
-                "previous": self.get_previous_link(),
-                "results": data,
-            }
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: Request,
+        view=None
+    ) -> list | None:
+        self.django_paginator_class = partial(
+            CountStrategyPaginator,
+            count_strategy=getattr(
+                view,
+                "pagination_count_strategy",
+                settings.PAGINATION_COUNT_STRATEGY
+            ),
+            count_cap=settings.PAGINATION_COUNT_CAP,
         )
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data: dict) -> Response:
+        paginator = self.page.paginator
+        response = {
+            "pages": paginator.num_pages,
+            "count": paginator.count,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if paginator.count_kind == "capped":
+            response["pages"] = f"{paginator.num_pages}+"
+            response["count"] = f"{paginator.count}+"
+        if paginator.count_kind != "exact":
+            response["count_exact"] = False
+        return Response(response)
 
     def get_paginated_response_schema(self, schema) -> dict:
         return {
             "type": "object",
             "properties": {
                 "pages": {
-                    "type": "integer",
+                    "oneOf": [{"type": "integer"}, {"type": "string"}],
+                    "description": (
+                        "Integer or '<number>+' string for capped count"
+                    ),
                     "example": 4,
                 },
                 "count": {
-                    "type": "integer",
+                    "oneOf": [{"type": "integer"}, {"type": "string"}],
+                    "description": (
+                        "Integer or '<number>+' string for capped count"
+                    ),
                     "example": 18,
                 },
+                "count_exact": {
+                    "type": "boolean",
+                    "description": (
+                        "Only returned as false for capped or estimated count"
+                    ),
+                    "example": False,
+                },
                 "next": {
                     "type": "string",
                     "nullable": True,
@@ -49,3 +204,201 @@ class TrainStationPaginator(PageNumberPagination):
                 "results": schema,
             },
         }
+
+
+class Cursor(NamedTuple):
+    reverse: bool
+    position: list
+
+
+class TrainStationCursorPaginator(BasePagination):
+    """
+    Keyset pagination: pages are selected with a WHERE condition on
+    the ordering fields of the last seen row instead of OFFSET,
+    so deep pages are as fast as the first one
+    """
+
+    page_size = TrainStationPaginator.page_size
+    page_size_query_param = TrainStationPaginator.page_size_query_param
+    max_page_size = TrainStationPaginator.max_page_size
+    cursor_query_param = "cursor"
+    count_query_param = "count"
+    ordering = ("id",)
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_page_size(self, request: Request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def decode_cursor(self, request: Request) -> Cursor | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded))
+            cursor = Cursor(reverse=bool(data["r"]), position=data["p"])
+            if not (
+                isinstance(cursor.position, list)
+                and len(cursor.position) == len(self.ordering)
+                and all(
+                    isinstance(value, (str, int, float))
+                    for value in cursor.position
+                )
+            ):
+                raise ValueError("Invalid cursor position")
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    def encode_cursor(self, cursor: Cursor) -> str:
+        data = json.dumps({"r": int(cursor.reverse), "p": cursor.position})
+        encoded = base64.urlsafe_b64encode(data.encode()).decode("ascii")
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encoded
+        )
+
+    def get_position(self, instance) -> list:
+        position = []
+        for field in self.ordering:
+            value = getattr(instance, field.lstrip("-"))
+            if hasattr(value, "isoformat"):
+                value = value.isoformat()
+            position.append(value)
+        return position
+
+    def get_keyset_filter(self, cursor: Cursor, model) -> Q:
+        """(a, b) after (x, y) is: a > x OR (a = x AND b > y)"""
+        keyset_filter = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, cursor.position):
+            name = field.lstrip("-")
+            value = model._meta.get_field(name).to_python(value)
+            descending = field.startswith("-") != cursor.reverse
+            lookup = f"{name}__lt" if descending else f"{name}__gt"
+            keyset_filter |= equal & Q(**{lookup: value})
+            equal &= Q(**{name: value})
+        return keyset_filter
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: Request,
+        view=None
+    ) -> list:
+        self.ordering = getattr(view, "cursor_ordering", self.ordering)
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.count = (
+            queryset.count()
+            if request.query_params.get(self.count_query_param) == "true"
+            else None
+        )
+
+        cursor = self.decode_cursor(request)
+        reverse = cursor.reverse if cursor else False
+        ordering = [
+            field.lstrip("-") if field.startswith("-") == reverse
+            else f"-{field.lstrip("-")}"
+            for field in self.ordering
+        ]
+        queryset = queryset.order_by(*ordering)
+        if cursor:
+            try:
+                queryset = queryset.filter(
+                    self.get_keyset_filter(cursor, queryset.model)
+                )
+            except (ValidationError, TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        has_next = has_more if not reverse else True
+        has_previous = has_more if reverse else cursor is not None
+        self.next_cursor = (
+            Cursor(reverse=False, position=self.get_position(results[-1]))
+            if has_next and results else None
+        )
+        self.previous_cursor = (
+            Cursor(reverse=True, position=self.get_position(results[0]))
+            if has_previous and results else None
+        )
+        return results
+
+    def get_next_link(self) -> str | None:
+        if self.next_cursor is None:
+            return None
+        return self.encode_cursor(self.next_cursor)
+
+    def get_previous_link(self) -> str | None:
+        if self.previous_cursor is None:
+            return None
+        return self.encode_cursor(self.previous_cursor)
+
+    def get_paginated_response(self, data: dict) -> Response:
+        response = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if self.count is not None:
+            response = {"count": self.count, **response}
+        return Response(response)
+
+    def get_paginated_response_schema(self, schema) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "count": {
+                    "type": "integer",
+                    "example": 18,
+                    "description": "Only returned with '?count=true'",
+                },
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                    "example": (
+                        "http://localhost:8000/api/v1/train-station/"
+                        "?pagination=cursor&cursor=eyJyIjogMCwgInAiOiBbMl19"
+                    )
+                },
+                "previous": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                    "example": None,
+                },
+                "results": schema,
+            },
+        }
+
+
+class CursorPaginationMixin:
+    """
+    Allow view to switch from page numbers to keyset pagination
+    over `cursor_ordering` fields with '?pagination=cursor'
+    """
+
+    cursor_ordering: tuple[str, ...] = ("id",)
+    pagination_query_param = "pagination"
+
+    @property
+    def paginator(self) -> BasePagination | None:
+        request = getattr(self, "request", None)
+        if (
+            not hasattr(self, "_paginator")
+            and request is not None
+            and request.query_params.get(self.pagination_query_param)
+            == "cursor"
+        ):
+            self._paginator = TrainStationCursorPaginator()
+        return super().paginator
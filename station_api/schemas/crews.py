@@ -100,6 +100,18 @@ crew_set_schema = extend_schema_view(
                 ),
                 required=False,
             ),
+            OpenApiParameter(
+                name="search",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Search crew members by name. Every word has to match "
+                    "the first or the last name, names starting with the "
+                    "first word are ranked first. Misspelled names are "
+                    "matched too on PostgreSQL. Example: '?search=john d'"
+                ),
+                required=False,
+            ),
         ],
         examples=[
             OpenApiExample(
@@ -201,7 +213,9 @@ crew_set_schema = extend_schema_view(
     ),
     upload_image=extend_schema(
         description="Upload image for a crew member. Up to 1 MB. "
-                    "Allowed extensions: png, jpg, jpeg",
+                    "Allowed extensions: png, jpg, jpeg. "
+                    "Thumbnail and medium WebP renditions are generated "
+                    "from it. Images that cannot be decoded are rejected",
         request=CrewImageSerializer(),
         examples=[crew_image_response_example],
         responses={
@@ -2,28 +2,40 @@ crew_list_json = [
     {
         "id": 7,
         "full_name": "Andrew Kotsyi",
-        "crew_image": None
+        "crew_image": None,
+        "crew_image_renditions": None
     },
     {
         "id": 8,
         "full_name": "Bohdan Hmel",
-        "crew_image": None
+        "crew_image": None,
+        "crew_image_renditions": None
     },
     {
         "id": 6,
         "full_name": "Johny Depp",
-        "crew_image": None
+        "crew_image": None,
+        "crew_image_renditions": None
     },
     {
         "id": 1,
         "full_name": "Johny Doe",
         "crew_image": "http://localhost:8000/media/uploads/crew/"
-                      "johny-doe-c0b937a9-d9a2-40c5-882c-03b01cf0a214.png"
+                      "johny-doe-c0b937a9-d9a2-40c5-882c-03b01cf0a214.png",
+        "crew_image_renditions": {
+            "thumbnail": "http://localhost:8000/media/uploads/crew/"
+                         "renditions/johny-doe-c0b937a9-d9a2-40c5-882c-"
+                         "03b01cf0a214-thumbnail.webp",
+            "medium": "http://localhost:8000/media/uploads/crew/"
+                      "renditions/johny-doe-c0b937a9-d9a2-40c5-882c-"
+                      "03b01cf0a214-medium.webp"
+        }
     },
     {
         "id": 2,
         "full_name": "Rick Astley",
-        "crew_image": None
+        "crew_image": None,
+        "crew_image_renditions": None
     }
 ]
 
@@ -31,7 +43,15 @@ crew_detail_json = {
     "id": 1,
     "full_name": "Johny Doe",
     "crew_image": "http://localhost:8000/media/uploads/crew/"
-                  "johny-doe-c0b937a9-d9a2-40c5-882c-03b01cf0a214.png"
+                  "johny-doe-c0b937a9-d9a2-40c5-882c-03b01cf0a214.png",
+    "crew_image_renditions": {
+        "thumbnail": "http://localhost:8000/media/uploads/crew/"
+                     "renditions/johny-doe-c0b937a9-d9a2-40c5-882c-"
+                     "03b01cf0a214-thumbnail.webp",
+        "medium": "http://localhost:8000/media/uploads/crew/"
+                  "renditions/johny-doe-c0b937a9-d9a2-40c5-882c-"
+                  "03b01cf0a214-medium.webp"
+    }
 }
 
 crew_create_update_request_json = {
@@ -48,7 +68,15 @@ crew_create_update_response_json = {
 crew_upload_image_response_json = {
     "id": 2,
     "crew_image": "http://localhost:8000/media/uploads/crew/"
-                  "rick-astley-aec99aa5-0fa2-45d0-ad88-10a23ff07994.png"
+                  "rick-astley-aec99aa5-0fa2-45d0-ad88-10a23ff07994.png",
+    "crew_image_renditions": {
+        "thumbnail": "http://localhost:8000/media/uploads/crew/"
+                     "renditions/rick-astley-aec99aa5-0fa2-45d0-ad88-"
+                     "10a23ff07994-thumbnail.webp",
+        "medium": "http://localhost:8000/media/uploads/crew/"
+                  "renditions/rick-astley-aec99aa5-0fa2-45d0-ad88-"
+                  "10a23ff07994-medium.webp"
+    }
 }
 
 error_400_empty_fields = {
@@ -0,0 +1,41 @@
+journey_list_json = [
+    {
+        "departure_time": "14 Oct 2024 00:00",
+        "arrival_time": "14 Oct 2024 18:00",
+        "transfers": 1,
+        "legs": [
+            {
+                "id": 33,
+                "route": "Chernivtsi - Kyiv",
+                "train": "Bird AB 0323",
+                "train_type": "Super fast",
+                "departure_time": "14 Oct 2024 00:00",
+                "arrival_time": "14 Oct 2024 10:00",
+                "train_capacity": 120,
+                "tickets_available": 120
+            },
+            {
+                "id": 30,
+                "route": "Kyiv - Donetsk",
+                "train": "Train AB 012",
+                "train_type": "Night train",
+                "departure_time": "14 Oct 2024 13:00",
+                "arrival_time": "14 Oct 2024 18:00",
+                "train_capacity": 258,
+                "tickets_available": 255
+            }
+        ]
+    }
+]
+
+error_400_same_stations = {
+    "non_field_errors": [
+        "The source and destination stations must be different."
+    ]
+}
+
+error_400_invalid_station = {
+    "source": [
+        "Invalid pk \"100\" - object does not exist."
+    ]
+}
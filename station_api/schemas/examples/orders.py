@@ -13,7 +13,8 @@ order_list_json = [
                     "train_type": "Night train",
                     "departure_time": "14 Oct 2024 13:00",
                     "arrival_time": "14 Oct 2024 18:00",
-                    "train_capacity": 258
+                    "train_capacity": 258,
+                    "tickets_available": 255
                 }
             },
             {
@@ -27,7 +28,8 @@ order_list_json = [
                     "train_type": "Super fast",
                     "departure_time": "15 Oct 2024 12:05",
                     "arrival_time": "15 Oct 2024 16:00",
-                    "train_capacity": 120
+                    "train_capacity": 120,
+                    "tickets_available": 114
                 }
             }
         ],
@@ -47,7 +49,8 @@ order_list_json = [
                     "train_type": "Night train",
                     "departure_time": "13 Oct 2024 18:00",
                     "arrival_time": "13 Oct 2024 22:00",
-                    "train_capacity": 75
+                    "train_capacity": 75,
+                    "tickets_available": 60
                 }
             },
             {
@@ -61,7 +64,8 @@ order_list_json = [
                     "train_type": "Night train",
                     "departure_time": "13 Oct 2024 18:00",
                     "arrival_time": "13 Oct 2024 22:00",
-                    "train_capacity": 75
+                    "train_capacity": 75,
+                    "tickets_available": 60
                 }
             },
             {
@@ -75,7 +79,8 @@ order_list_json = [
                     "train_type": "Night train",
                     "departure_time": "13 Oct 2024 18:00",
                     "arrival_time": "13 Oct 2024 22:00",
-                    "train_capacity": 75
+                    "train_capacity": 75,
+                    "tickets_available": 60
                 }
             }
         ],
@@ -117,6 +122,13 @@ order_create_response_json = {
     "created_at": "15 Oct 2024 13:13"
 }
 
+order_summary_json = {
+    "upcoming_trips": 2,
+    "past_trips": 5,
+    "next_departure": "14 Oct 2024 13:00",
+    "total_tickets": 11
+}
+
 error_400_empty_fields = {
     "tickets": {
         "non_field_errors": [
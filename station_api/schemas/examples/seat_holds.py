@@ -0,0 +1,75 @@
+seat_hold_list_json = [
+    {
+        "id": 3,
+        "cargo": 1,
+        "seat": 2,
+        "trip": 33,
+        "expires_at": "2024-10-15T13:23:41.512Z"
+    },
+    {
+        "id": 4,
+        "cargo": 1,
+        "seat": 3,
+        "trip": 33,
+        "expires_at": "2024-10-15T13:23:41.512Z"
+    }
+]
+
+seat_hold_create_request_json = {
+    "tickets": [
+        {
+            "cargo": 1,
+            "seat": 2,
+            "trip": 33
+        },
+        {
+            "cargo": 1,
+            "seat": 3,
+            "trip": 33
+        }
+    ]
+}
+
+seat_hold_confirm_request_json = {
+    "holds": [3, 4]
+}
+
+seat_hold_confirm_response_json = {
+    "id": 11,
+    "tickets": [
+        {
+            "id": 20,
+            "cargo": 1,
+            "seat": 2,
+            "trip": 33
+        },
+        {
+            "id": 21,
+            "cargo": 1,
+            "seat": 3,
+            "trip": 33
+        }
+    ],
+    "created_at": "15 Oct 2024 13:15"
+}
+
+error_400_held_place = {
+    "tickets": [
+        {
+            "non_field_errors": [
+                "This place is temporarily held by another user."
+            ]
+        },
+        {}
+    ]
+}
+
+error_400_expired_holds = {
+    "holds": [
+        "Holds [4] do not exist or have expired."
+    ]
+}
+
+error_404_not_found = {
+    "detail": "No SeatHold matches the given query."
+}
@@ -70,3 +70,54 @@ error_400_not_valid_latitude_and_longitude = {
         "Longitude must be between -180 and 180 degrees."
     ]
 }
+
+station_distance_json = {
+    "source": 1,
+    "destination": 3,
+    "distance": 1020.0,
+    "stations": [
+        "Lviv",
+        "Kyiv",
+        "Kharkiv"
+    ]
+}
+
+station_autocomplete_json = [
+    {
+        "id": 4,
+        "name": "Chernihiv"
+    },
+    {
+        "id": 1,
+        "name": "Chernivtsi"
+    }
+]
+
+station_nearest_json = [
+    {
+        "id": 1,
+        "name": "Chernivtsi",
+        "latitude": 48.29,
+        "longitude": 25.39,
+        "distance": 3.161
+    },
+    {
+        "id": 3,
+        "name": "Lutsk",
+        "latitude": 50.76,
+        "longitude": 25.34,
+        "distance": 273.541
+    }
+]
+
+error_400_not_valid_coordinates = {
+    "latitude": [
+        "Latitude must be between -90 and 90 degrees."
+    ]
+}
+
+error_400_same_stations = {
+    "non_field_errors": [
+        "The source and destination stations must be different."
+    ]
+}
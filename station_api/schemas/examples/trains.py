@@ -7,7 +7,15 @@ train_list_json = [
         "capacity": 60,
         "train_type": "Night train",
         "train_image": "http://localhost:8000/media/uploads/trains/"
-                       "new-2ee2e586-0467-42a7-862e-df53515c62fe.png"
+                       "new-2ee2e586-0467-42a7-862e-df53515c62fe.png",
+        "train_image_renditions": {
+            "thumbnail": "http://localhost:8000/media/uploads/trains/"
+                         "renditions/new-2ee2e586-0467-42a7-862e-"
+                         "df53515c62fe-thumbnail.webp",
+            "medium": "http://localhost:8000/media/uploads/trains/"
+                      "renditions/new-2ee2e586-0467-42a7-862e-"
+                      "df53515c62fe-medium.webp"
+        }
     },
     {
         "id": 2,
@@ -16,7 +24,8 @@ train_list_json = [
         "places_in_cargo": 43,
         "capacity": 258,
         "train_type": "Night train",
-        "train_image": None
+        "train_image": None,
+        "train_image_renditions": None
     },
     {
         "id": 3,
@@ -26,7 +35,15 @@ train_list_json = [
         "capacity": 40,
         "train_type": "Inter-city",
         "train_image": "http://localhost:8000/media/uploads/trains/"
-                       "freedom-2133-aea03a10-d019-4e4a-8c72-49b7f0b2edd1.png"
+                       "freedom-2133-aea03a10-d019-4e4a-8c72-49b7f0b2edd1.png",
+        "train_image_renditions": {
+            "thumbnail": "http://localhost:8000/media/uploads/trains/"
+                         "renditions/freedom-2133-aea03a10-d019-4e4a-8c72-"
+                         "49b7f0b2edd1-thumbnail.webp",
+            "medium": "http://localhost:8000/media/uploads/trains/"
+                      "renditions/freedom-2133-aea03a10-d019-4e4a-8c72-"
+                      "49b7f0b2edd1-medium.webp"
+        }
     },
     {
         "id": 4,
@@ -36,7 +53,15 @@ train_list_json = [
         "capacity": 160,
         "train_type": "Night train",
         "train_image": "http://localhost:8000/media/uploads/trains/"
-                       "owl-1212-6ecb3eef-8031-4947-9f5a-f734eb9dc880.png"
+                       "owl-1212-6ecb3eef-8031-4947-9f5a-f734eb9dc880.png",
+        "train_image_renditions": {
+            "thumbnail": "http://localhost:8000/media/uploads/trains/"
+                         "renditions/owl-1212-6ecb3eef-8031-4947-9f5a-"
+                         "f734eb9dc880-thumbnail.webp",
+            "medium": "http://localhost:8000/media/uploads/trains/"
+                      "renditions/owl-1212-6ecb3eef-8031-4947-9f5a-"
+                      "f734eb9dc880-medium.webp"
+        }
     },
     {
         "id": 5,
@@ -46,7 +71,16 @@ train_list_json = [
         "capacity": 215,
         "train_type": "Regional",
         "train_image": "http://localhost:8000/media/uploads/trains/"
-                       "eagle-as-0322-932ceb26-df58-41b6-9b04-59f08caa24cd.png"
+                       "eagle-as-0322-932ceb26-df58-41b6-9b04-"
+                       "59f08caa24cd.png",
+        "train_image_renditions": {
+            "thumbnail": "http://localhost:8000/media/uploads/trains/"
+                         "renditions/eagle-as-0322-932ceb26-df58-41b6-9b04-"
+                         "59f08caa24cd-thumbnail.webp",
+            "medium": "http://localhost:8000/media/uploads/trains/"
+                      "renditions/eagle-as-0322-932ceb26-df58-41b6-9b04-"
+                      "59f08caa24cd-medium.webp"
+        }
     }
 ]
 
@@ -58,7 +92,15 @@ train_detail_json = {
     "capacity": 60,
     "train_type": "Night train",
     "train_image": "http://localhost:8000/media/uploads/trains/"
-                   "new-2ee2e586-0467-42a7-862e-df53515c62fe.png"
+                   "new-2ee2e586-0467-42a7-862e-df53515c62fe.png",
+    "train_image_renditions": {
+        "thumbnail": "http://localhost:8000/media/uploads/trains/"
+                     "renditions/new-2ee2e586-0467-42a7-862e-"
+                     "df53515c62fe-thumbnail.webp",
+        "medium": "http://localhost:8000/media/uploads/trains/"
+                  "renditions/new-2ee2e586-0467-42a7-862e-"
+                  "df53515c62fe-medium.webp"
+    }
 }
 
 train_create_update_request_json = {
@@ -71,7 +113,15 @@ train_create_update_request_json = {
 train_upload_image_response_json = {
     "id": 1,
     "train_image": "http://localhost:8000/media/uploads/trains/"
-                   "new-2ee2e586-0467-42a7-862e-df53515c62fe.png"
+                   "new-2ee2e586-0467-42a7-862e-df53515c62fe.png",
+    "train_image_renditions": {
+        "thumbnail": "http://localhost:8000/media/uploads/trains/"
+                     "renditions/new-2ee2e586-0467-42a7-862e-"
+                     "df53515c62fe-thumbnail.webp",
+        "medium": "http://localhost:8000/media/uploads/trains/"
+                  "renditions/new-2ee2e586-0467-42a7-862e-"
+                  "df53515c62fe-medium.webp"
+    }
 }
 
 train_create_update_response_json = {
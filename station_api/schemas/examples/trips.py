@@ -110,6 +110,34 @@ trip_detail_json = {
     ]
 }
 
+trip_detail_bitmap_json = {
+    **{
+        key: value
+        for key, value in trip_detail_json.items()
+        if key != "taken_places"
+    },
+    "seat_map": {
+        "encoding": "bitmap",
+        "cargo_num": 6,
+        "places_in_cargo": 43,
+        "data": "IAAAAAADAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA"
+    }
+}
+
+trip_detail_rle_json = {
+    **{
+        key: value
+        for key, value in trip_detail_json.items()
+        if key != "taken_places"
+    },
+    "seat_map": {
+        "encoding": "rle",
+        "cargo_num": 6,
+        "places_in_cargo": 43,
+        "runs": [2, 1, 43, 2, 210]
+    }
+}
+
 error_400_empty_fields = {
     "route_id": [
         "This field is required."
@@ -128,6 +156,67 @@ error_400_empty_fields = {
     ]
 }
 
+trip_schedule_request_json = {
+    "route_id": 4,
+    "train_id": 8,
+    "crew_ids": [1, 2],
+    "departure_time": "2024-10-11 08:15",
+    "arrival_time": "2024-10-11 15:42",
+    "repeat_every_days": 1,
+    "repeat_count": 3
+}
+
+trip_schedule_response_json = [
+    {
+        "id": 36,
+        "departure_time": "2024-10-11T08:15:00Z",
+        "arrival_time": "2024-10-11T15:42:00Z"
+    },
+    {
+        "id": 37,
+        "departure_time": "2024-10-12T08:15:00Z",
+        "arrival_time": "2024-10-12T15:42:00Z"
+    },
+    {
+        "id": 38,
+        "departure_time": "2024-10-13T08:15:00Z",
+        "arrival_time": "2024-10-13T15:42:00Z"
+    }
+]
+
+error_400_schedule_invalid_references = {
+    "route_id": [
+        "Route 999 does not exist."
+    ],
+    "crew_ids": [
+        "Crew 7, 12 does not exist."
+    ]
+}
+
+trip_conflicts_json = [
+    {
+        "resource": "crew",
+        "id": 2,
+        "name": "John Doe",
+        "trips": [35, 41]
+    },
+    {
+        "resource": "train",
+        "id": 8,
+        "name": "Eagle AS 0322",
+        "trips": [35, 36]
+    }
+]
+
+error_400_overlapping_trips = {
+    "train_id": [
+        "Train is already assigned to overlapping trips: 35."
+    ],
+    "crew_ids": [
+        "Crew 2 is already assigned to overlapping trips: 35, 41."
+    ]
+}
+
 error_400_invalid_route = {
     "detail": "No Route matches the given query."
 }
@@ -137,7 +226,9 @@ error_400_invalid_train = {
 }
 
 error_400_invalid_crew = {
-    "detail": "No Crew matches the given query."
+    "crew_ids": [
+        "Crew 7, 12 does not exist."
+    ]
 }
 
 error_400_arrival_time_before_departure_time = {
@@ -0,0 +1,23 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse
+
+
+export_format_parameter = OpenApiParameter(
+    name="export_format",
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.QUERY,
+    enum=["ndjson", "csv"],
+    description=(
+        "Format of exported rows, NDJSON by default. "
+        "Example: '?export_format=csv'"
+    ),
+    required=False,
+)
+
+export_response = OpenApiResponse(
+    response=OpenApiTypes.STR,
+    description=(
+        "Streamed file with one JSON object per line (NDJSON) "
+        "or CSV rows with a header"
+    ),
+)
@@ -0,0 +1,103 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    extend_schema_view,
+    extend_schema,
+    OpenApiParameter,
+    OpenApiExample,
+    OpenApiResponse
+)
+from rest_framework import status
+
+from station_api.schemas.examples.common_responses import (
+    unauthorized_response,
+)
+from station_api.schemas.examples.journeys import (
+    journey_list_json,
+    error_400_same_stations,
+    error_400_invalid_station,
+)
+from station_api.serializers import JourneySerializer
+
+
+journey_list_schema = extend_schema_view(
+    list=extend_schema(
+        description=(
+            "Find the earliest arriving journeys between two stations, "
+            "including connections with transfers between trips"
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="source",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Source station id. Example: '?source=1'",
+                required=True,
+            ),
+            OpenApiParameter(
+                name="destination",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Destination station id. Example: '?destination=2'"
+                ),
+                required=True,
+            ),
+            OpenApiParameter(
+                name="departure_after",
+                type=OpenApiTypes.DATETIME,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Depart not earlier than this time, now by default. "
+                    "Example: '?departure_after=2024-10-14T00:00Z'"
+                ),
+                required=False,
+            ),
+            OpenApiParameter(
+                name="transfer_minutes",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Minimum time between trips at transfer station, "
+                    "15 minutes by default. Example: '?transfer_minutes=30'"
+                ),
+                required=False,
+            ),
+            OpenApiParameter(
+                name="limit",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Number of journeys to return, from 1 to 5, "
+                    "3 by default. Example: '?limit=1'"
+                ),
+                required=False,
+            ),
+        ],
+        examples=[
+            OpenApiExample(
+                name="Journey list example",
+                value=journey_list_json
+            )
+        ],
+        responses={
+            status.HTTP_200_OK: JourneySerializer(many=True),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="Bad request, invalid data",
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    OpenApiExample(
+                        name="Same stations example",
+                        value=error_400_same_stations,
+                        response_only=True,
+                    ),
+                    OpenApiExample(
+                        name="Not valid station example",
+                        value=error_400_invalid_station,
+                        response_only=True,
+                    ),
+                ]
+            ),
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response
+        },
+    ),
+)
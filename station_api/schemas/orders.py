@@ -15,15 +15,26 @@ from station_api.schemas.examples.orders import (
     order_list_json,
     order_create_request_json,
     order_create_response_json,
+    order_summary_json,
     error_400_empty_fields,
     error_400_invalid_place
 )
-from station_api.serializers import OrderListSerializer, OrderSerializer
+from station_api.schemas.exports import (
+    export_format_parameter,
+    export_response,
+)
+from station_api.schemas.pagination import cursor_pagination_parameters
+from station_api.serializers import (
+    OrderListSerializer,
+    OrderSerializer,
+    OrderSummarySerializer,
+)
 
 
 order_list_create_schema = extend_schema_view(
     list=extend_schema(
         description="Retrieve list of authorised user orders",
+        parameters=cursor_pagination_parameters,
         examples=[
             OpenApiExample(
                 name="Order list example",
@@ -71,5 +82,47 @@ order_list_create_schema = extend_schema_view(
             status.HTTP_401_UNAUTHORIZED: unauthorized_response,
             status.HTTP_403_FORBIDDEN: forbidden_response,
         }
-    )
+    ),
+    export=extend_schema(
+        description=(
+            "Stream all authorised user orders as NDJSON or CSV "
+            "with id, creation time and number of tickets"
+        ),
+        parameters=[export_format_parameter],
+        responses={
+            (status.HTTP_200_OK, "application/x-ndjson"): export_response,
+            (status.HTTP_200_OK, "text/csv"): export_response,
+            status.HTTP_400_BAD_REQUEST: OpenApiTypes.OBJECT,
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response
+        },
+    ),
+    summary=extend_schema(
+        description=(
+            "Retrieve numbers of upcoming and past trips, the next "
+            "departure and the total number of tickets of authorised "
+            "user orders"
+        ),
+        examples=[
+            OpenApiExample(
+                name="Order summary example",
+                value=order_summary_json
+            )
+        ],
+        responses={
+            status.HTTP_200_OK: OrderSummarySerializer(),
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response
+        },
+    ),
+    export_tickets=extend_schema(
+        description=(
+            "Stream all tickets of authorised user orders as NDJSON or CSV"
+        ),
+        parameters=[export_format_parameter],
+        responses={
+            (status.HTTP_200_OK, "application/x-ndjson"): export_response,
+            (status.HTTP_200_OK, "text/csv"): export_response,
+            status.HTTP_400_BAD_REQUEST: OpenApiTypes.OBJECT,
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response
+        },
+    ),
 )
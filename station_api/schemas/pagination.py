@@ -0,0 +1,38 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+
+
+cursor_pagination_parameters = [
+    OpenApiParameter(
+        name="pagination",
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        enum=["cursor"],
+        description=(
+            "Use keyset pagination with 'next' and 'previous' cursor links "
+            "instead of page numbers. Page latency doesn't depend on "
+            "its depth. Example: '?pagination=cursor'"
+        ),
+        required=False,
+    ),
+    OpenApiParameter(
+        name="cursor",
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        description=(
+            "Cursor value from 'next' or 'previous' link "
+            "of keyset pagination"
+        ),
+        required=False,
+    ),
+    OpenApiParameter(
+        name="count",
+        type=OpenApiTypes.BOOL,
+        location=OpenApiParameter.QUERY,
+        description=(
+            "Include total 'count' into keyset paginated response. "
+            "Example: '?pagination=cursor&count=true'"
+        ),
+        required=False,
+    ),
+]
@@ -0,0 +1,127 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    extend_schema_view,
+    extend_schema,
+    OpenApiExample,
+    OpenApiResponse
+)
+from rest_framework import status
+
+from station_api.schemas.examples.common_responses import (
+    unauthorized_response,
+)
+from station_api.schemas.examples.seat_holds import (
+    seat_hold_list_json,
+    seat_hold_create_request_json,
+    seat_hold_confirm_request_json,
+    seat_hold_confirm_response_json,
+    error_400_held_place,
+    error_400_expired_holds,
+    error_404_not_found,
+)
+from station_api.serializers import (
+    OrderSerializer,
+    SeatHoldSerializer,
+    SeatHoldCreateSerializer,
+    SeatHoldConfirmSerializer,
+)
+
+
+seat_hold_set_schema = extend_schema_view(
+    list=extend_schema(
+        description="Retrieve list of active seat holds of authorised user",
+        examples=[
+            OpenApiExample(
+                name="Seat hold list example",
+                value=seat_hold_list_json
+            )
+        ],
+        responses={
+            status.HTTP_200_OK: SeatHoldSerializer(many=True),
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response
+        },
+    ),
+    create=extend_schema(
+        description=(
+            "Hold places for a limited time (10 minutes by default). "
+            "Held places can't be ordered or held by other users"
+        ),
+        request=SeatHoldCreateSerializer(),
+        examples=[
+            OpenApiExample(
+                name="Seat hold request example",
+                value=seat_hold_create_request_json,
+                request_only=True,
+            ),
+            OpenApiExample(
+                name="Seat hold response example",
+                value=seat_hold_list_json,
+                response_only=True,
+            ),
+        ],
+        responses={
+            status.HTTP_201_CREATED: SeatHoldSerializer(many=True),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="Bad request, invalid data",
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    OpenApiExample(
+                        name="Held place example",
+                        value=error_400_held_place,
+                        response_only=True,
+                    ),
+                ]
+            ),
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response,
+        },
+    ),
+    destroy=extend_schema(
+        description="Release held place",
+        responses={
+            status.HTTP_204_NO_CONTENT: None,
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response,
+            status.HTTP_404_NOT_FOUND: OpenApiResponse(
+                description="Not found",
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    OpenApiExample(
+                        name="Not found",
+                        value=error_404_not_found,
+                        response_only=True,
+                    )
+                ]
+            ),
+        },
+    ),
+    confirm=extend_schema(
+        description="Create an order from active seat holds",
+        request=SeatHoldConfirmSerializer(),
+        examples=[
+            OpenApiExample(
+                name="Seat hold confirm request example",
+                value=seat_hold_confirm_request_json,
+                request_only=True,
+            ),
+            OpenApiExample(
+                name="Seat hold confirm response example",
+                value=seat_hold_confirm_response_json,
+                response_only=True,
+            ),
+        ],
+        responses={
+            status.HTTP_201_CREATED: OrderSerializer(),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="Bad request, invalid data",
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    OpenApiExample(
+                        name="Expired holds example",
+                        value=error_400_expired_holds,
+                        response_only=True,
+                    ),
+                ]
+            ),
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response,
+        },
+    ),
+)
@@ -18,9 +18,19 @@ from station_api.schemas.examples.stations import (
     station_create_response_json,
     error_400_empty_fields,
     error_400_same_station_name,
-    error_400_not_valid_latitude_and_longitude
+    error_400_not_valid_latitude_and_longitude,
+    station_distance_json,
+    station_autocomplete_json,
+    station_nearest_json,
+    error_400_not_valid_coordinates,
+    error_400_same_stations,
+)
+from station_api.serializers import (
+    StationSerializer,
+    StationDistanceSerializer,
+    StationAutocompleteResultSerializer,
+    StationNearestResultSerializer,
 )
-from station_api.serializers import StationSerializer
 
 
 station_list_create_schema = extend_schema_view(
@@ -36,7 +46,18 @@ station_list_create_schema = extend_schema_view(
                     "Example: '?name=chernivtsi'"
                 ),
                 required=False,
-            )
+            ),
+            OpenApiParameter(
+                name="search",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Search stations by name, ranking names starting with "
+                    "the query first. Misspelled names are matched too "
+                    "on PostgreSQL. Example: '?search=cherniv'"
+                ),
+                required=False,
+            ),
         ],
         examples=[
             OpenApiExample(
@@ -90,5 +111,162 @@ station_list_create_schema = extend_schema_view(
             status.HTTP_401_UNAUTHORIZED: unauthorized_response,
             status.HTTP_403_FORBIDDEN: forbidden_response,
         }
-    )
+    ),
+    distance=extend_schema(
+        description=(
+            "Retrieve the shortest network distance between stations "
+            "over routes and stations of this path. Distance is null "
+            "if stations are not connected"
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="source",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description="Source station id. Example: '?source=1'",
+                required=True,
+            ),
+            OpenApiParameter(
+                name="destination",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Destination station id. Example: '?destination=3'"
+                ),
+                required=True,
+            ),
+        ],
+        examples=[
+            OpenApiExample(
+                name="Station distance example",
+                value=station_distance_json,
+            )
+        ],
+        responses={
+            status.HTTP_200_OK: StationDistanceSerializer(),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="Bad request, invalid data",
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    OpenApiExample(
+                        name="Same stations example",
+                        value=error_400_same_stations,
+                        response_only=True,
+                    ),
+                ]
+            ),
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response,
+        },
+    ),
+    autocomplete=extend_schema(
+        description=(
+            "Complete station names starting with the query or having "
+            "a word starting with it, whole name matches first. "
+            "Served from memory without querying the database"
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="q",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Beginning of station name or its word, case "
+                    "insensitive. Example: '?q=cher'"
+                ),
+                required=True,
+            ),
+            OpenApiParameter(
+                name="limit",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Maximum number of stations, 10 by default and "
+                    "at most 50. Example: '?limit=5'"
+                ),
+                required=False,
+            ),
+        ],
+        examples=[
+            OpenApiExample(
+                name="Station autocomplete example",
+                value=station_autocomplete_json,
+            )
+        ],
+        responses={
+            status.HTTP_200_OK: StationAutocompleteResultSerializer(
+                many=True
+            ),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="Bad request, invalid query",
+                response=OpenApiTypes.OBJECT,
+            ),
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response,
+        },
+    ),
+    nearest=extend_schema(
+        description=(
+            "Retrieve stations nearest to the coordinates, nearest first, "
+            "with great-circle distances in km. "
+            "Served from memory without querying the database"
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="latitude",
+                type=OpenApiTypes.FLOAT,
+                location=OpenApiParameter.QUERY,
+                description="Latitude in degrees. Example: '?latitude=48.3'",
+                required=True,
+            ),
+            OpenApiParameter(
+                name="longitude",
+                type=OpenApiTypes.FLOAT,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Longitude in degrees. Example: '?longitude=25.35'"
+                ),
+                required=True,
+            ),
+            OpenApiParameter(
+                name="radius",
+                type=OpenApiTypes.FLOAT,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Only return stations within this distance in km. "
+                    "Example: '?radius=50'"
+                ),
+                required=False,
+            ),
+            OpenApiParameter(
+                name="limit",
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Maximum number of stations, 10 by default and "
+                    "at most 50. Example: '?limit=5'"
+                ),
+                required=False,
+            ),
+        ],
+        examples=[
+            OpenApiExample(
+                name="Nearest stations example",
+                value=station_nearest_json,
+            )
+        ],
+        responses={
+            status.HTTP_200_OK: StationNearestResultSerializer(many=True),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="Bad request, invalid coordinates",
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    OpenApiExample(
+                        name="Not valid coordinates example",
+                        value=error_400_not_valid_coordinates,
+                        response_only=True,
+                    ),
+                ]
+            ),
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response,
+        },
+    ),
 )
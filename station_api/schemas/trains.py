@@ -232,7 +232,9 @@ train_set_schema = extend_schema_view(
     ),
     upload_image=extend_schema(
         description="Upload image for a train. Up to 1 MB. "
-                    "Allowed extensions: png, jpg, jpeg",
+                    "Allowed extensions: png, jpg, jpeg. "
+                    "Thumbnail and medium WebP renditions are generated "
+                    "from it. Images that cannot be decoded are rejected",
         request=TrainImageSerializer(),
         examples=[train_image_response_example],
         responses={
@@ -23,11 +23,25 @@ from station_api.schemas.examples.trips import (
     error_400_invalid_crew,
     error_400_arrival_time_before_departure_time,
     trip_detail_json,
+    trip_detail_bitmap_json,
+    trip_detail_rle_json,
+    trip_schedule_request_json,
+    trip_schedule_response_json,
+    error_400_schedule_invalid_references,
+    trip_conflicts_json,
+    error_400_overlapping_trips,
     error_404_not_found
 )
+from station_api.schemas.exports import (
+    export_format_parameter,
+    export_response,
+)
+from station_api.schemas.pagination import cursor_pagination_parameters
 from station_api.serializers import (
     TripListSerializer,
     TripCreateUpdateSerializer, TripRetrieveSerializer,
+    TripScheduleSerializer,
+    TripConflictSerializer,
 )
 
 
@@ -73,6 +87,12 @@ arrival_time_before_departure_time_example = OpenApiExample(
     response_only=True,
 )
 
+overlapping_trips_example = OpenApiExample(
+    name="Train or crew assigned to overlapping trips example",
+    value=error_400_overlapping_trips,
+    response_only=True,
+)
+
 not_found_response = OpenApiResponse(
     description="Not found",
     response=OpenApiTypes.OBJECT,
@@ -86,60 +106,66 @@ not_found_response = OpenApiResponse(
 )
 
 
+trip_filter_parameters = [
+    OpenApiParameter(
+        name="departure_date",
+        type=OpenApiTypes.DATE,
+        location=OpenApiParameter.QUERY,
+        description=(
+            "Filter by departure date. Format: YYYY-MM-DD. "
+            "Example: '?departure_date=2024-10-15'"
+        ),
+        required=False,
+    ),
+    OpenApiParameter(
+        name="source_station",
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        description=(
+            "Filter by source station name. Case insensitive. "
+            "Example: '?source_station=chernivtsi'"
+        ),
+        required=False,
+    ),
+    OpenApiParameter(
+        name="destination_station",
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        description=(
+            "Filter by destination station name. Case insensitive. "
+            "Example: '?destination_station=kyiv'"
+        ),
+        required=False,
+    ),
+    OpenApiParameter(
+        name="train_type",
+        type=OpenApiTypes.STR,
+        location=OpenApiParameter.QUERY,
+        description=(
+            "Filter by train type name or its part. Case insensitive. "
+            "Example: '?train_type=night'"
+        ),
+        required=False,
+    ),
+    OpenApiParameter(
+        name="tickets_available",
+        type=OpenApiTypes.BOOL,
+        location=OpenApiParameter.QUERY,
+        description=(
+            "Filter trips that have available tickets. "
+            "Example: '?tickets_available=true'"
+        ),
+        required=False,
+    ),
+]
+
+
 trip_set_schema = extend_schema_view(
     list=extend_schema(
         description="Retrieve list of trips, allowing filter",
         parameters=[
-            OpenApiParameter(
-                name="departure_date",
-                type=OpenApiTypes.DATE,
-                location=OpenApiParameter.QUERY,
-                description=(
-                    "Filter by departure date. Format: YYYY-MM-DD. "
-                    "Example: '?departure_date=2024-10-15'"
-                ),
-                required=False,
-            ),
-            OpenApiParameter(
-                name="source_station",
-                type=OpenApiTypes.STR,
-                location=OpenApiParameter.QUERY,
-                description=(
-                    "Filter by source station name. Case insensitive. "
-                    "Example: '?source_station=chernivtsi'"
-                ),
-                required=False,
-            ),
-            OpenApiParameter(
-                name="destination_station",
-                type=OpenApiTypes.STR,
-                location=OpenApiParameter.QUERY,
-                description=(
-                    "Filter by destination station name. Case insensitive. "
-                    "Example: '?destination_station=kyiv'"
-                ),
-                required=False,
-            ),
-            OpenApiParameter(
-                name="train_type",
-                type=OpenApiTypes.STR,
-                location=OpenApiParameter.QUERY,
-                description=(
-                    "Filter by train type name or its part. Case insensitive. "
-                    "Example: '?train_type=night'"
-                ),
-                required=False,
-            ),
-            OpenApiParameter(
-                name="tickets_available",
-                type=OpenApiTypes.BOOL,
-                location=OpenApiParameter.QUERY,
-                description=(
-                    "Filter trips that have available tickets. "
-                    "Example: '?tickets_available=true'"
-                ),
-                required=False,
-            ),
+            *trip_filter_parameters,
+            *cursor_pagination_parameters,
         ],
         examples=[
             OpenApiExample(
@@ -152,6 +178,19 @@ trip_set_schema = extend_schema_view(
             status.HTTP_401_UNAUTHORIZED: unauthorized_response
         },
     ),
+    export=extend_schema(
+        description=(
+            "Stream all trips matching filters as NDJSON or CSV, "
+            "rows have the same fields as the trip list"
+        ),
+        parameters=[*trip_filter_parameters, export_format_parameter],
+        responses={
+            (status.HTTP_200_OK, "application/x-ndjson"): export_response,
+            (status.HTTP_200_OK, "text/csv"): export_response,
+            status.HTTP_400_BAD_REQUEST: OpenApiTypes.OBJECT,
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response
+        },
+    ),
     create=extend_schema(
         description="Create a new trip",
         request=TripCreateUpdateSerializer(),
@@ -169,20 +208,127 @@ trip_set_schema = extend_schema_view(
                     not_valid_route_example,
                     not_valid_crew_example,
                     not_valid_train_example,
-                    arrival_time_before_departure_time_example
+                    arrival_time_before_departure_time_example,
+                    overlapping_trips_example
+                ]
+            ),
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response,
+            status.HTTP_403_FORBIDDEN: forbidden_response,
+        },
+    ),
+    schedule=extend_schema(
+        description=(
+            "Create recurring trips of one route, train and crew: "
+            "'repeat_count' trips starting at given departure and arrival "
+            "times, each 'repeat_every_days' days after the previous one"
+        ),
+        request=TripScheduleSerializer(),
+        examples=[
+            OpenApiExample(
+                name="Trip schedule request example",
+                value=trip_schedule_request_json,
+                request_only=True,
+            ),
+            OpenApiExample(
+                name="Trip schedule response example",
+                value=trip_schedule_response_json,
+                response_only=True,
+            ),
+        ],
+        responses={
+            status.HTTP_201_CREATED: TripCreateUpdateSerializer(many=True),
+            status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+                description="Bad request, invalid data",
+                response=OpenApiTypes.OBJECT,
+                examples=[
+                    OpenApiExample(
+                        name="Not existing route, train or crew example",
+                        value=error_400_schedule_invalid_references,
+                        response_only=True,
+                    ),
+                    arrival_time_before_departure_time_example,
+                    overlapping_trips_example
                 ]
             ),
             status.HTTP_401_UNAUTHORIZED: unauthorized_response,
             status.HTTP_403_FORBIDDEN: forbidden_response,
         },
     ),
+    conflicts=extend_schema(
+        description=(
+            "Retrieve pairs of overlapping trips sharing a train or a crew "
+            "member, for trips running between given dates (admin only)"
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="date_from",
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "First day of the window. Format: YYYY-MM-DD. "
+                    "Example: '?date_from=2024-10-01'"
+                ),
+                required=True,
+            ),
+            OpenApiParameter(
+                name="date_to",
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+                description=(
+                    "Last day of the window, inclusive. Format: YYYY-MM-DD. "
+                    "Example: '?date_to=2024-10-31'"
+                ),
+                required=True,
+            ),
+        ],
+        examples=[
+            OpenApiExample(
+                name="Trip conflicts example",
+                value=trip_conflicts_json,
+            )
+        ],
+        responses={
+            status.HTTP_200_OK: TripConflictSerializer(many=True),
+            status.HTTP_400_BAD_REQUEST: OpenApiTypes.OBJECT,
+            status.HTTP_401_UNAUTHORIZED: unauthorized_response,
+            status.HTTP_403_FORBIDDEN: forbidden_response,
+        },
+    ),
     retrieve=extend_schema(
-        description="Retrieve detail trip information",
+        description=(
+            "Retrieve detail trip information. Taken places can be "
+            "returned as a compact seat map: one bit per place "
+            "(1 - taken), ordered by cargo and then by seat, "
+            "most significant bit first"
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="seat_map",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                enum=["bitmap", "rle"],
+                description=(
+                    "Return 'seat_map' instead of 'taken_places': "
+                    "'bitmap' - base64 encoded bits, 'rle' - lengths "
+                    "of alternating free and taken runs, starting with "
+                    "free places. Example: '?seat_map=rle'"
+                ),
+                required=False,
+            ),
+        ],
         examples=[
             OpenApiExample(
                 name="Trip detail example",
                 value=trip_detail_json,
-            )
+            ),
+            OpenApiExample(
+                name="Trip detail with bitmap seat map example",
+                value=trip_detail_bitmap_json,
+            ),
+            OpenApiExample(
+                name="Trip detail with rle seat map example",
+                value=trip_detail_rle_json,
+            ),
         ],
         responses={
             status.HTTP_200_OK: TripRetrieveSerializer(),
@@ -207,7 +353,8 @@ trip_set_schema = extend_schema_view(
                     not_valid_route_example,
                     not_valid_crew_example,
                     not_valid_train_example,
-                    arrival_time_before_departure_time_example
+                    arrival_time_before_departure_time_example,
+                    overlapping_trips_example
                 ]
             ),
             status.HTTP_401_UNAUTHORIZED: unauthorized_response,
@@ -231,7 +378,8 @@ trip_set_schema = extend_schema_view(
                     not_valid_route_example,
                     not_valid_crew_example,
                     not_valid_train_example,
-                    arrival_time_before_departure_time_example
+                    arrival_time_before_departure_time_example,
+                    overlapping_trips_example
                 ]
             ),
             status.HTTP_401_UNAUTHORIZED: unauthorized_response,
@@ -0,0 +1,88 @@
+from functools import reduce
+from operator import add, and_, or_
+from typing import Sequence
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connection
+from django.db.models import (
+    Case,
+    Expression,
+    F,
+    IntegerField,
+    Q,
+    QuerySet,
+    TextField,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Greatest, Upper
+
+
+def greatest(expressions: list[Expression]) -> Expression:
+    return expressions[0] if len(expressions) == 1 else Greatest(*expressions)
+
+
+def search_by_name(
+    queryset: QuerySet, fields: str | Sequence[str], query: str
+) -> QuerySet:
+    """
+    Filter rows where every word of the query is contained in one of
+    the name fields, ranking rows whose first field starts with the
+    first word first. On PostgreSQL words fuzzily matching a field
+    are included too and ranked by trigram word similarity. Fields
+    are compared as UPPER(field::text), which the pg_trgm GIN indexes
+    are built on, so every condition can use them
+    """
+    words = query.upper().split()
+    if not words:
+        return queryset
+    if isinstance(fields, str):
+        fields = (fields,)
+
+    names = [f"search_{field}" for field in fields]
+    queryset = queryset.annotate(
+        **{
+            name: Upper(Cast(F(field), output_field=TextField()))
+            for name, field in zip(names, fields)
+        }
+    ).annotate(
+        search_prefix=Case(
+            When(**{f"{names[0]}__startswith": words[0]}, then=Value(0)),
+            default=Value(1),
+            output_field=IntegerField(),
+        )
+    )
+    postgresql = connection.vendor == "postgresql"
+    lookups = ["contains", "trigram_word_similar"] if postgresql else [
+        "contains"
+    ]
+    queryset = queryset.filter(
+        reduce(
+            and_,
+            (
+                reduce(
+                    or_,
+                    (
+                        Q(**{f"{name}__{lookup}": word})
+                        for name in names
+                        for lookup in lookups
+                    ),
+                )
+                for word in words
+            ),
+        )
+    )
+    if not postgresql:
+        return queryset.order_by("search_prefix", *names)
+
+    return queryset.annotate(
+        search_similarity=reduce(
+            add,
+            (
+                greatest(
+                    [TrigramWordSimilarity(word, name) for name in names]
+                )
+                for word in words
+            ),
+        )
+    ).order_by("search_prefix", "-search_similarity", *names)
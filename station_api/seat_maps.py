@@ -0,0 +1,73 @@
+import base64
+from itertools import groupby
+from typing import Iterable
+
+
+def seat_map_size(capacity: int) -> int:
+    return (capacity + 7) // 8
+
+
+def fit_seat_map(seat_map: bytes, capacity: int) -> bytes:
+    """
+    Pad (or cut) seat map to the size of `capacity` places. Maps of
+    trips without tickets may be stored empty.
+    """
+    size = seat_map_size(capacity)
+    return bytes(seat_map)[:size].ljust(size, b"\0")
+
+
+def seat_index(cargo: int, seat: int, places_in_cargo: int) -> int:
+    return (cargo - 1) * places_in_cargo + seat - 1
+
+
+def mark_seats(
+    seat_map: bytes,
+    places: Iterable[tuple[int, int]],
+    cargo_num: int,
+    places_in_cargo: int,
+    taken: bool = True,
+) -> bytes:
+    """
+    Set (or clear) bits of (cargo, seat) places in seat map.
+    Bit of every place is stored most significant bit first,
+    places are ordered by cargo and then by seat.
+    """
+    data = bytearray(fit_seat_map(seat_map, cargo_num * places_in_cargo))
+    for cargo, seat in places:
+        if not (1 <= cargo <= cargo_num and 1 <= seat <= places_in_cargo):
+            continue
+        index = seat_index(cargo, seat, places_in_cargo)
+        mask = 0x80 >> (index % 8)
+        if taken:
+            data[index // 8] |= mask
+        else:
+            data[index // 8] &= ~mask
+    return bytes(data)
+
+
+def build_seat_map(
+    places: Iterable[tuple[int, int]],
+    cargo_num: int,
+    places_in_cargo: int,
+) -> bytes:
+    return mark_seats(b"", places, cargo_num, places_in_cargo)
+
+
+def encode_bitmap(seat_map: bytes, capacity: int) -> str:
+    return base64.b64encode(fit_seat_map(seat_map, capacity)).decode("ascii")
+
+
+def encode_runs(seat_map: bytes, capacity: int) -> list[int]:
+    """
+    Encode seat map as lengths of alternating free and taken runs,
+    always starting with a (possibly empty) run of free places.
+    """
+    seat_map = fit_seat_map(seat_map, capacity)
+    if not capacity:
+        return []
+    bits = format(
+        int.from_bytes(seat_map, "big"), f"0{len(seat_map) * 8}b"
+    )[:capacity]
+    runs = [] if bits[0] == "0" else [0]
+    runs.extend(len(list(group)) for _, group in groupby(bits))
+    return runs
@@ -1,8 +1,27 @@
-from django.db import transaction
+from collections import defaultdict
+from datetime import timedelta
+from typing import Iterable
+
+from django.db import transaction, IntegrityError
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 from rest_framework.generics import get_object_or_404
 
+from station_api.cache import invalidate_model
+from station_api.conflicts import (
+    find_schedule_conflicts,
+    find_trip_conflicts,
+    lock_assignees,
+)
+from station_api.images import (
+    IMAGE_ERRORS,
+    render_renditions,
+    rendition_urls,
+    save_renditions,
+)
 from station_api.models import (
     Station,
     Route,
@@ -12,7 +31,11 @@ from station_api.models import (
     Trip,
     Ticket,
     Order,
+    SeatHold,
+    UserTrip,
 )
+from station_api.seat_maps import encode_bitmap, encode_runs
+from station_api.validators import validate_latitude, validate_longitude
 
 
 class StationSerializer(serializers.ModelSerializer):
@@ -21,6 +44,64 @@ class StationSerializer(serializers.ModelSerializer):
         fields = ("id", "name", "latitude", "longitude")
 
 
+class StationPairSerializer(serializers.Serializer):
+    source = serializers.PrimaryKeyRelatedField(
+        queryset=Station.objects.all()
+    )
+    destination = serializers.PrimaryKeyRelatedField(
+        queryset=Station.objects.all()
+    )
+
+    def validate(self, attrs: dict) -> dict:
+        data = super().validate(attrs=attrs)
+        Route.validate_different_stations(
+            source=attrs["source"],
+            destination=attrs["destination"],
+            error_to_raise=ValidationError
+        )
+        return data
+
+
+class StationDistanceSerializer(StationPairSerializer):
+    distance = serializers.FloatField(read_only=True, allow_null=True)
+    stations = serializers.ListField(
+        child=serializers.CharField(),
+        read_only=True
+    )
+
+
+class StationAutocompleteSerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=63, trim_whitespace=True)
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=settings.STATION_AUTOCOMPLETE_MAX_LIMIT,
+        default=settings.STATION_AUTOCOMPLETE_LIMIT,
+    )
+
+
+class StationAutocompleteResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
+
+
+class StationNearestSerializer(serializers.Serializer):
+    latitude = serializers.FloatField(validators=[validate_latitude])
+    longitude = serializers.FloatField(validators=[validate_longitude])
+    radius = serializers.FloatField(min_value=0, required=False)
+    limit = serializers.IntegerField(
+        min_value=1,
+        max_value=settings.STATION_NEAREST_MAX_LIMIT,
+        default=settings.STATION_NEAREST_LIMIT,
+    )
+
+
+class StationNearestResultSerializer(StationSerializer):
+    distance = serializers.FloatField(read_only=True)
+
+    class Meta(StationSerializer.Meta):
+        fields = StationSerializer.Meta.fields + ("distance",)
+
+
 class RouteSerializer(serializers.ModelSerializer):
     class Meta:
         model = Route
@@ -60,22 +141,68 @@ class CrewSerializer(serializers.ModelSerializer):
 
 class CrewReadSerializer(CrewSerializer):
     full_name = serializers.SerializerMethodField()
+    crew_image_renditions = serializers.SerializerMethodField()
 
     class Meta(CrewSerializer.Meta):
-        fields = ("id", "full_name", "crew_image")
+        fields = ("id", "full_name", "crew_image", "crew_image_renditions")
 
     def get_full_name(self, obj: Crew) -> str:
         return f"{obj.first_name} {obj.last_name}"
 
+    def get_crew_image_renditions(self, obj: Crew) -> dict[str, str] | None:
+        return rendition_urls(obj.crew_image, self.context.get("request"))
+
 
 class CrewCreateUpdateSerializer(CrewSerializer):
     class Meta(CrewSerializer.Meta):
         fields = ("id", "first_name", "last_name")
 
 
-class CrewImageSerializer(CrewSerializer):
+class ImageUploadSerializerMixin:
+    """
+    Render renditions of the uploaded image while validating it and
+    save them next to the image, so images Pillow cannot decode are
+    rejected before anything is stored
+    """
+
+    image_field: str
+
+    def validate(self, attrs: dict) -> dict:
+        attrs = super().validate(attrs)
+        self.renditions = {}
+        image = attrs.get(self.image_field)
+        if image:
+            try:
+                self.renditions = render_renditions(image)
+            except IMAGE_ERRORS:
+                raise ValidationError(
+                    {
+                        self.image_field: [
+                            "Upload a valid image. "
+                            "The image could not be decoded."
+                        ]
+                    }
+                )
+        return attrs
+
+    def update(self, instance, validated_data: dict):
+        instance = super().update(instance, validated_data)
+        if self.renditions:
+            save_renditions(
+                getattr(instance, self.image_field), self.renditions
+            )
+        return instance
+
+
+class CrewImageSerializer(ImageUploadSerializerMixin, CrewSerializer):
+    image_field = "crew_image"
+    crew_image_renditions = serializers.SerializerMethodField()
+
     class Meta(CrewSerializer.Meta):
-        fields = ("id", "crew_image")
+        fields = ("id", "crew_image", "crew_image_renditions")
+
+    def get_crew_image_renditions(self, obj: Crew) -> dict[str, str] | None:
+        return rendition_urls(obj.crew_image, self.context.get("request"))
 
 
 class TrainTypeSerializer(serializers.ModelSerializer):
@@ -103,6 +230,15 @@ class TrainReadSerializer(TrainSerializer):
         source="train_type.name",
         read_only=True
     )
+    train_image_renditions = serializers.SerializerMethodField()
+
+    class Meta(TrainSerializer.Meta):
+        fields = TrainSerializer.Meta.fields + ("train_image_renditions",)
+
+    def get_train_image_renditions(
+        self, obj: Train
+    ) -> dict[str, str] | None:
+        return rendition_urls(obj.train_image, self.context.get("request"))
 
 
 class TrainCreateUpdateSerializer(TrainSerializer):
@@ -116,9 +252,17 @@ class TrainCreateUpdateSerializer(TrainSerializer):
         )
 
 
-class TrainImageSerializer(TrainSerializer):
+class TrainImageSerializer(ImageUploadSerializerMixin, TrainSerializer):
+    image_field = "train_image"
+    train_image_renditions = serializers.SerializerMethodField()
+
     class Meta(TrainSerializer.Meta):
-        fields = ("id", "train_image")
+        fields = ("id", "train_image", "train_image_renditions")
+
+    def get_train_image_renditions(
+        self, obj: Train
+    ) -> dict[str, str] | None:
+        return rendition_urls(obj.train_image, self.context.get("request"))
 
 
 class TripSerializer(serializers.ModelSerializer):
@@ -165,6 +309,101 @@ class TripListSerializer(TripSerializer):
         return obj.arrival_time.strftime("%d %b %Y %H:%M")
 
 
+class TripListRowSerializer:
+    """
+    Plain Python counterpart of TripListSerializer for rows fetched
+    with `values_list(*TripListRowSerializer.columns)`,
+    rendering the same output without model instances and DRF fields
+    """
+
+    columns = (
+        "id",
+        "route__source__name",
+        "route__destination__name",
+        "train__name",
+        "train__train_type__name",
+        "departure_time",
+        "arrival_time",
+        "train__cargo_num",
+        "train__places_in_cargo",
+        "tickets_available",
+    )
+    fields = (
+        "id",
+        "route",
+        "train",
+        "train_type",
+        "departure_time",
+        "arrival_time",
+        "train_capacity",
+        "tickets_available",
+    )
+
+    @staticmethod
+    def to_representation(row: tuple) -> dict:
+        (
+            trip_id,
+            source,
+            destination,
+            train,
+            train_type,
+            departure_time,
+            arrival_time,
+            cargo_num,
+            places_in_cargo,
+            tickets_available,
+        ) = row
+        return {
+            "id": trip_id,
+            "route": f"{source} - {destination}",
+            "train": train,
+            "train_type": train_type,
+            "departure_time": departure_time.strftime("%d %b %Y %H:%M"),
+            "arrival_time": arrival_time.strftime("%d %b %Y %H:%M"),
+            "train_capacity": cargo_num * places_in_cargo,
+            "tickets_available": tickets_available,
+        }
+
+    @classmethod
+    def serialize(cls, rows: Iterable[tuple]) -> list[dict]:
+        to_representation = cls.to_representation
+        return [to_representation(row) for row in rows]
+
+
+class JourneySearchSerializer(StationPairSerializer):
+    departure_after = serializers.DateTimeField(required=False)
+    transfer_minutes = serializers.IntegerField(min_value=0, required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=5, default=3)
+
+
+class JourneySerializer(serializers.Serializer):
+    departure_time = serializers.SerializerMethodField()
+    arrival_time = serializers.SerializerMethodField()
+    transfers = serializers.SerializerMethodField()
+    legs = TripListSerializer(many=True, read_only=True)
+
+    def get_departure_time(self, obj: dict) -> str:
+        return obj["legs"][0].departure_time.strftime("%d %b %Y %H:%M")
+
+    def get_arrival_time(self, obj: dict) -> str:
+        return obj["legs"][-1].arrival_time.strftime("%d %b %Y %H:%M")
+
+    def get_transfers(self, obj: dict) -> int:
+        return len(obj["legs"]) - 1
+
+
+def get_crew_in_bulk(crew_ids: list[int]) -> list[Crew]:
+    """Fetch crew members with one query, listing missing ids in error"""
+    crew_ids = list(dict.fromkeys(crew_ids))
+    crew = Crew.objects.in_bulk(crew_ids)
+    missing = [crew_id for crew_id in crew_ids if crew_id not in crew]
+    if missing:
+        raise ValidationError(
+            f"Crew {', '.join(map(str, missing))} does not exist."
+        )
+    return [crew[crew_id] for crew_id in crew_ids]
+
+
 class TripCreateUpdateSerializer(TripSerializer):
     route_id = serializers.IntegerField(write_only=True)
     train_id = serializers.IntegerField(write_only=True)
@@ -185,49 +424,84 @@ class TripCreateUpdateSerializer(TripSerializer):
 
     def validate(self, attrs: dict) -> dict:
         data = super().validate(attrs=attrs)
+        departure_time = attrs.get(
+            "departure_time",
+            self.instance.departure_time if self.instance else None
+        )
+        arrival_time = attrs.get(
+            "arrival_time",
+            self.instance.arrival_time if self.instance else None
+        )
         Trip.validate_times(
-            departure_time=attrs.get(
-                "departure_time",
-                self.instance.departure_time if self.instance else None
-            ),
-            arrival_time=attrs.get(
-                "arrival_time",
-                self.instance.arrival_time if self.instance else None
-            ),
+            departure_time=departure_time,
+            arrival_time=arrival_time,
             error_to_raise=ValidationError
         )
+
+        if "crew_ids" in attrs:
+            crew_ids = [crew.id for crew in attrs["crew_ids"]]
+        elif self.instance:
+            crew_ids = list(self.instance.crew.values_list("id", flat=True))
+        else:
+            crew_ids = []
+        self.assignment = {
+            "departure_time": departure_time,
+            "arrival_time": arrival_time,
+            "train_id": attrs.get(
+                "train_id",
+                self.instance.train_id if self.instance else None
+            ),
+            "crew_ids": crew_ids,
+            "exclude_trip_id": self.instance.pk if self.instance else None,
+        }
+        self.check_conflicts()
         return data
 
+    def validate_crew_ids(self, crew_ids: list[int]) -> list[Crew]:
+        return get_crew_in_bulk(crew_ids)
+
+    def check_conflicts(self) -> None:
+        errors = find_trip_conflicts(**self.assignment)
+        if errors:
+            raise ValidationError(errors)
+
+    def lock_assignment(self) -> None:
+        """
+        Lock the train and crew rows and check conflicts again,
+        as trips may have been assigned since validation
+        """
+        lock_assignees(
+            self.assignment["train_id"], self.assignment["crew_ids"]
+        )
+        self.check_conflicts()
+
     def create(self, validated_data: dict) -> Trip:
         route_id = validated_data.pop("route_id")
         train_id = validated_data.pop("train_id")
-        crew_ids = validated_data.pop("crew_ids", [])
+        crew = validated_data.pop("crew_ids", [])
 
         route = get_object_or_404(Route, pk=route_id)
         train = get_object_or_404(Train, pk=train_id)
-        crew = [get_object_or_404(Crew, pk=crew_id) for crew_id in crew_ids]
 
-        trip = Trip.objects.create(
-            route=route,
-            train=train,
-            **validated_data
-        )
+        with transaction.atomic():
+            self.lock_assignment()
+            trip = Trip.objects.create(
+                route=route,
+                train=train,
+                **validated_data
+            )
 
-        trip.crew.set(crew)
+            if crew:
+                trip.crew.add(*crew)
 
         return trip
 
     def update(self, instance: Trip, validated_data: dict) -> Trip:
         route_id = validated_data.pop("route_id", instance.route.id)
         train_id = validated_data.pop("train_id", instance.train.id)
-        crew_ids = validated_data.pop(
-            "crew_ids",
-            list(instance.crew.values_list("id", flat=True))
-        )
 
         route = get_object_or_404(Route, pk=route_id)
         train = get_object_or_404(Train, pk=train_id)
-        crew = [get_object_or_404(Crew, pk=crew_id) for crew_id in crew_ids]
 
         instance.route = route
         instance.train = train
@@ -239,13 +513,139 @@ class TripCreateUpdateSerializer(TripSerializer):
             "arrival_time",
             instance.arrival_time
         )
-        instance.save()
+        with transaction.atomic():
+            self.lock_assignment()
+            instance.save()
 
-        instance.crew.set(crew)
+            if "crew_ids" in validated_data:
+                # set() only deletes and inserts rows of changed members
+                instance.crew.set(validated_data["crew_ids"])
 
         return instance
 
 
+class TripScheduleSerializer(serializers.Serializer):
+    route_id = serializers.IntegerField()
+    train_id = serializers.IntegerField()
+    crew_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        default=list
+    )
+    departure_time = serializers.DateTimeField(
+        help_text="Departure time of the first trip"
+    )
+    arrival_time = serializers.DateTimeField(
+        help_text="Arrival time of the first trip"
+    )
+    repeat_every_days = serializers.IntegerField(min_value=1, default=1)
+    repeat_count = serializers.IntegerField(
+        min_value=1,
+        max_value=settings.TRIP_SCHEDULE_MAX_TRIPS,
+        help_text="Number of trips to create"
+    )
+
+    def validate_route_id(self, route_id: int) -> int:
+        if not Route.objects.filter(pk=route_id).exists():
+            raise ValidationError(f"Route {route_id} does not exist.")
+        return route_id
+
+    def validate_train_id(self, train_id: int) -> int:
+        if not Train.objects.filter(pk=train_id).exists():
+            raise ValidationError(f"Train {train_id} does not exist.")
+        return train_id
+
+    def validate_crew_ids(self, crew_ids: list[int]) -> list[int]:
+        return [crew.id for crew in get_crew_in_bulk(crew_ids)]
+
+    def validate(self, attrs: dict) -> dict:
+        Trip.validate_times(
+            departure_time=attrs["departure_time"],
+            arrival_time=attrs["arrival_time"],
+            error_to_raise=ValidationError
+        )
+        step = timedelta(days=attrs["repeat_every_days"])
+        if (
+            attrs["repeat_count"] > 1
+            and step < attrs["arrival_time"] - attrs["departure_time"]
+        ):
+            raise ValidationError(
+                "Trips of the schedule must not overlap each other."
+            )
+
+        self.check_conflicts(attrs)
+        return attrs
+
+    def check_conflicts(self, attrs: dict) -> None:
+        step = timedelta(days=attrs["repeat_every_days"])
+        errors = find_schedule_conflicts(
+            periods=[
+                (
+                    attrs["departure_time"] + step * index,
+                    attrs["arrival_time"] + step * index,
+                )
+                for index in range(attrs["repeat_count"])
+            ],
+            train_id=attrs["train_id"],
+            crew_ids=attrs["crew_ids"],
+        )
+        if errors:
+            raise ValidationError(errors)
+
+    def create(self, validated_data: dict) -> list[Trip]:
+        """
+        Insert all trips and their crew with two bulk inserts.
+        Signals are not sent for bulk inserts, so caches and
+        the journey planner are updated here
+        """
+        crew_ids = validated_data["crew_ids"]
+        step = timedelta(days=validated_data["repeat_every_days"])
+        with transaction.atomic():
+            # Trips may have been assigned since validation
+            lock_assignees(validated_data["train_id"], crew_ids)
+            self.check_conflicts(validated_data)
+            trips = Trip.objects.bulk_create(
+                [
+                    Trip(
+                        route_id=validated_data["route_id"],
+                        train_id=validated_data["train_id"],
+                        departure_time=(
+                            validated_data["departure_time"] + step * index
+                        ),
+                        arrival_time=(
+                            validated_data["arrival_time"] + step * index
+                        ),
+                    )
+                    for index in range(validated_data["repeat_count"])
+                ]
+            )
+            Trip.crew.through.objects.bulk_create(
+                [
+                    Trip.crew.through(trip_id=trip.id, crew_id=crew_id)
+                    for trip in trips
+                    for crew_id in crew_ids
+                ]
+            )
+            invalidate_model(Trip)
+        return trips
+
+
+class TripConflictSearchSerializer(serializers.Serializer):
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+
+    def validate(self, attrs: dict) -> dict:
+        if attrs["date_from"] > attrs["date_to"]:
+            raise ValidationError("'date_from' must not be after 'date_to'.")
+        return attrs
+
+
+class TripConflictSerializer(serializers.Serializer):
+    resource = serializers.ChoiceField(choices=["train", "crew"])
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    trips = serializers.ListField(child=serializers.IntegerField())
+
+
 class TicketSerializer(serializers.ModelSerializer):
     class Meta:
         model = Ticket
@@ -262,6 +662,90 @@ class TicketSerializer(serializers.ModelSerializer):
         return data
 
 
+def validate_places(tickets: list[dict], user) -> list[dict]:
+    """
+    Validate requested places with one query for trips, one for sold
+    and one for places held by other users
+    """
+    trips = (
+        Trip.objects
+        .select_related("train")
+        .only("train__cargo_num", "train__places_in_cargo")
+        .in_bulk({ticket["trip_id"] for ticket in tickets})
+    )
+    taken_places = Q()
+    for ticket in tickets:
+        taken_places |= Q(
+            trip_id=ticket["trip_id"],
+            cargo=ticket["cargo"],
+            seat=ticket["seat"],
+        )
+    taken = set(
+        Ticket.objects
+        .filter(taken_places)
+        .values_list("trip_id", "cargo", "seat")
+    )
+    held = set(
+        SeatHold.objects
+        .filter(taken_places, expires_at__gt=timezone.now())
+        .exclude(user=user)
+        .values_list("trip_id", "cargo", "seat")
+    )
+
+    errors = []
+    requested = set()
+    for ticket in tickets:
+        place = (ticket["trip_id"], ticket["cargo"], ticket["seat"])
+        trip = trips.get(ticket["trip_id"])
+        error = {}
+        if trip is None:
+            error = {
+                "trip": [
+                    f'Invalid pk "{ticket["trip_id"]}" '
+                    f"- object does not exist."
+                ]
+            }
+        elif place in taken or place in requested:
+            error = {
+                "non_field_errors": [
+                    "The fields cargo, seat, trip must make a unique set."
+                ]
+            }
+        elif place in held:
+            error = {
+                "non_field_errors": [
+                    "This place is temporarily held by another user."
+                ]
+            }
+        else:
+            try:
+                Ticket.validate_ticket(
+                    cargo=ticket["cargo"],
+                    seat=ticket["seat"],
+                    train=trip.train,
+                    error_to_raise=ValidationError
+                )
+            except ValidationError as exc:
+                error = serializers.as_serializer_error(exc)
+        requested.add(place)
+        errors.append(error)
+
+    if any(errors):
+        raise ValidationError(errors)
+    return tickets
+
+
+class TicketCreateSerializer(TicketSerializer):
+    trip = serializers.IntegerField(source="trip_id")
+
+    class Meta(TicketSerializer.Meta):
+        validators = []
+
+    def validate(self, attrs: dict) -> dict:
+        """Places are validated in bulk by OrderSerializer"""
+        return attrs
+
+
 class TicketListSerializer(TicketSerializer):
     trip = TripListSerializer(read_only=True)
 
@@ -301,21 +785,90 @@ class TripRetrieveSerializer(TripListSerializer):
         ]
 
 
+class TripSeatMapSerializer(TripRetrieveSerializer):
+    seat_map = serializers.SerializerMethodField()
+
+    class Meta(TripRetrieveSerializer.Meta):
+        fields = (
+            "id",
+            "route",
+            "train",
+            "departure_time",
+            "arrival_time",
+            "crew",
+            "seat_map"
+        )
+
+    def get_seat_map(self, obj: Trip) -> dict:
+        return {
+            "encoding": "bitmap",
+            "cargo_num": obj.train.cargo_num,
+            "places_in_cargo": obj.train.places_in_cargo,
+            "data": encode_bitmap(obj.seat_map, obj.train.capacity),
+        }
+
+
+class TripSeatRunsSerializer(TripSeatMapSerializer):
+    def get_seat_map(self, obj: Trip) -> dict:
+        return {
+            "encoding": "rle",
+            "cargo_num": obj.train.cargo_num,
+            "places_in_cargo": obj.train.places_in_cargo,
+            "runs": encode_runs(obj.seat_map, obj.train.capacity),
+        }
+
+
 class OrderSerializer(serializers.ModelSerializer):
-    tickets = TicketSerializer(many=True, read_only=False, allow_empty=False)
+    tickets = TicketCreateSerializer(
+        many=True,
+        read_only=False,
+        allow_empty=False
+    )
     created_at = serializers.SerializerMethodField()
 
     class Meta:
         model = Order
         fields = ("id", "tickets", "created_at")
 
+    def validate_tickets(self, tickets: list[dict]) -> list[dict]:
+        request = self.context.get("request")
+        return validate_places(tickets, request.user if request else None)
+
     def create(self, validated_data: dict) -> Order:
-        with transaction.atomic():
-            tickets_data = validated_data.pop("tickets")
-            order = Order.objects.create(**validated_data)
-            for ticket_data in tickets_data:
-                Ticket.objects.create(order=order, **ticket_data)
-            return order
+        tickets_data = validated_data.pop("tickets")
+        try:
+            with transaction.atomic():
+                order = Order.objects.create(**validated_data)
+                Ticket.objects.bulk_create(
+                    [
+                        Ticket(order=order, **ticket_data)
+                        for ticket_data in tickets_data
+                    ]
+                )
+                invalidate_model(Ticket)
+                places = Q()
+                trips_places = defaultdict(list)
+                for ticket_data in tickets_data:
+                    places |= Q(**ticket_data)
+                    trips_places[ticket_data["trip_id"]].append(
+                        (ticket_data["cargo"], ticket_data["seat"])
+                    )
+                # Own holds of ordered places are released by the order
+                SeatHold.objects.filter(places, user=order.user_id).delete()
+                for trip_id, places in trips_places.items():
+                    Trip.update_seats(trip_id, places, taken=True)
+                UserTrip.add_tickets(
+                    order.user_id,
+                    {
+                        trip_id: len(places)
+                        for trip_id, places in trips_places.items()
+                    }
+                )
+        except IntegrityError:
+            raise ValidationError(
+                {"tickets": ["Some of the places have already been taken."]}
+            )
+        return order
 
     def get_created_at(self, obj: Order) -> str:
         return obj.created_at.strftime("%d %b %Y %H:%M")
@@ -323,3 +876,98 @@ class OrderSerializer(serializers.ModelSerializer):
 
 class OrderListSerializer(OrderSerializer):
     tickets = TicketListSerializer(many=True, read_only=True)
+
+
+class OrderSummarySerializer(serializers.Serializer):
+    upcoming_trips = serializers.IntegerField(read_only=True)
+    past_trips = serializers.IntegerField(read_only=True)
+    next_departure = serializers.DateTimeField(
+        format="%d %b %Y %H:%M",
+        read_only=True,
+        allow_null=True
+    )
+    total_tickets = serializers.IntegerField(read_only=True)
+
+
+class SeatHoldSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SeatHold
+        fields = ("id", "cargo", "seat", "trip", "expires_at")
+
+
+class SeatHoldCreateSerializer(serializers.Serializer):
+    tickets = TicketCreateSerializer(many=True, allow_empty=False)
+
+    def validate_tickets(self, tickets: list[dict]) -> list[dict]:
+        return validate_places(tickets, self.context["request"].user)
+
+    def create(self, validated_data: dict) -> list[SeatHold]:
+        user = validated_data["user"]
+        tickets_data = validated_data["tickets"]
+        now = timezone.now()
+        places = Q()
+        for ticket_data in tickets_data:
+            places |= Q(**ticket_data)
+        try:
+            with transaction.atomic():
+                SeatHold.objects.filter(
+                    places, Q(expires_at__lte=now) | Q(user=user)
+                ).delete()
+                return SeatHold.objects.bulk_create(
+                    [
+                        SeatHold(
+                            user=user,
+                            expires_at=now + settings.SEAT_HOLD_LIFETIME,
+                            **ticket_data
+                        )
+                        for ticket_data in tickets_data
+                    ]
+                )
+        except IntegrityError:
+            raise ValidationError(
+                {"tickets": ["Some of the places have already been held."]}
+            )
+
+
+class SeatHoldConfirmSerializer(serializers.Serializer):
+    holds = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False
+    )
+
+    def create(self, validated_data: dict) -> Order:
+        hold_ids = set(validated_data["holds"])
+        with transaction.atomic():
+            holds = list(
+                SeatHold.objects
+                .select_for_update()
+                .filter(
+                    pk__in=hold_ids,
+                    user=validated_data["user"],
+                    expires_at__gt=timezone.now()
+                )
+            )
+            missing_ids = hold_ids - {hold.id for hold in holds}
+            if missing_ids:
+                raise ValidationError(
+                    {
+                        "holds": [
+                            f"Holds {sorted(missing_ids)} "
+                            f"do not exist or have expired."
+                        ]
+                    }
+                )
+            SeatHold.objects.filter(pk__in=hold_ids).delete()
+            return OrderSerializer().create(
+                {
+                    "user": validated_data["user"],
+                    "tickets": [
+                        {
+                            "cargo": hold.cargo,
+                            "seat": hold.seat,
+                            "trip_id": hold.trip_id,
+                        }
+                        for hold in holds
+                    ],
+                }
+            )
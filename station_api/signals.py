@@ -1,13 +1,32 @@
 import os
 
-from django.db.models.signals import pre_delete
+from django.db.models.signals import (
+    pre_delete,
+    pre_save,
+    post_save,
+    post_delete,
+    m2m_changed,
+)
 from django.dispatch import receiver
 
-from station_api.models import Crew, Train
+from station_api.cache import invalidate_model
+from station_api.images import delete_renditions
+from station_api.models import (
+    Station,
+    Route,
+    Crew,
+    TrainType,
+    Train,
+    Trip,
+    Order,
+    Ticket,
+    UserTrip,
+)
 
 
 @receiver(pre_delete, sender=Crew)
 def delete_crew_image(sender, instance, **kwargs) -> None:
+    delete_renditions(instance.crew_image)
     if instance.crew_image and hasattr(instance.crew_image, "path"):
         if os.path.isfile(instance.crew_image.path):
             os.remove(instance.crew_image.path)
@@ -15,6 +34,122 @@ def delete_crew_image(sender, instance, **kwargs) -> None:
 
 @receiver(pre_delete, sender=Train)
 def delete_train_image(sender, instance, **kwargs) -> None:
+    delete_renditions(instance.train_image)
     if instance.train_image and hasattr(instance.train_image, "path"):
         if os.path.isfile(instance.train_image.path):
             os.remove(instance.train_image.path)
+
+
+@receiver(pre_save, sender=Ticket)
+def remember_ticket_place(sender, instance, raw, **kwargs) -> None:
+    instance._previous_place = None
+    if instance.pk is not None and not raw:
+        instance._previous_place = (
+            Ticket.objects
+            .filter(pk=instance.pk)
+            .values("trip_id", "cargo", "seat", "order_id", "order__user_id")
+            .first()
+        )
+
+
+@receiver(post_save, sender=Ticket)
+def take_trip_seat(sender, instance, created, raw, **kwargs) -> None:
+    if raw:
+        return
+    previous = getattr(instance, "_previous_place", None)
+    if not created:
+        if previous is None or (
+            (previous["trip_id"], previous["cargo"], previous["seat"])
+            == (instance.trip_id, instance.cargo, instance.seat)
+        ):
+            return
+        Trip.update_seats(
+            previous["trip_id"],
+            [(previous["cargo"], previous["seat"])],
+            taken=False,
+        )
+    Trip.update_seats(
+        instance.trip_id, [(instance.cargo, instance.seat)], taken=True
+    )
+
+
+@receiver(post_delete, sender=Ticket)
+def free_trip_seat(sender, instance, **kwargs) -> None:
+    Trip.update_seats(
+        instance.trip_id, [(instance.cargo, instance.seat)], taken=False
+    )
+
+
+@receiver(post_save, sender=Ticket)
+def add_user_trip_ticket(sender, instance, created, raw, **kwargs) -> None:
+    if raw:
+        return
+    previous = getattr(instance, "_previous_place", None)
+    if not created:
+        if previous is None or (
+            (previous["trip_id"], previous["order_id"])
+            == (instance.trip_id, instance.order_id)
+        ):
+            return
+        UserTrip.add_tickets(
+            previous["order__user_id"], {previous["trip_id"]: -1}
+        )
+    UserTrip.add_tickets(instance.order.user_id, {instance.trip_id: 1})
+
+
+@receiver(post_delete, sender=Ticket)
+def remove_user_trip_ticket(sender, instance, **kwargs) -> None:
+    user_id = (
+        Order.objects
+        .filter(pk=instance.order_id)
+        .values_list("user_id", flat=True)
+        .first()
+    )
+    if user_id is not None:
+        UserTrip.add_tickets(user_id, {instance.trip_id: -1})
+
+
+@receiver(post_save, sender=Trip)
+def rebuild_trip_inventory(sender, instance, created, raw, **kwargs) -> None:
+    if not created and not raw:
+        Trip.objects.bulk_update(
+            Trip.collect_stale_inventory(Trip.objects.filter(pk=instance.pk)),
+            ["tickets_sold", "seat_map"],
+        )
+
+
+@receiver(post_save, sender=Train)
+def rebuild_train_trips_inventory(
+    sender, instance, created, raw, **kwargs
+) -> None:
+    if not created and not raw:
+        Trip.objects.bulk_update(
+            Trip.collect_stale_inventory(instance.trips.all()),
+            ["tickets_sold", "seat_map"],
+        )
+
+
+@receiver(post_save, sender=Station)
+@receiver(post_delete, sender=Station)
+@receiver(post_save, sender=Route)
+@receiver(post_delete, sender=Route)
+@receiver(post_save, sender=TrainType)
+@receiver(post_delete, sender=TrainType)
+@receiver(post_save, sender=Train)
+@receiver(post_delete, sender=Train)
+@receiver(post_save, sender=Crew)
+@receiver(post_delete, sender=Crew)
+@receiver(post_save, sender=Trip)
+@receiver(post_delete, sender=Trip)
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+def invalidate_model_cache(sender, **kwargs) -> None:
+    invalidate_model(sender)
+
+
+@receiver(m2m_changed, sender=Trip.crew.through)
+def invalidate_trip_crew_cache(sender, action, **kwargs) -> None:
+    if action.startswith("post_"):
+        invalidate_model(Trip)
@@ -0,0 +1,50 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from django.test import SimpleTestCase
+
+from station_api.conflicts import Interval, IntervalIndex
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def hours(start: int, end: int) -> tuple[datetime, datetime]:
+    return START + timedelta(hours=start), START + timedelta(hours=end)
+
+
+class IntervalIndexTests(SimpleTestCase):
+    def test_half_open_intervals(self) -> None:
+        index = IntervalIndex([Interval(*hours(2, 4), trip_id=1)])
+
+        self.assertEqual(index.overlapping(*hours(0, 2)), [])
+        self.assertEqual(index.overlapping(*hours(4, 6)), [])
+        self.assertEqual(
+            [interval.trip_id for interval in index.overlapping(*hours(3, 5))],
+            [1]
+        )
+
+    def test_matches_brute_force(self) -> None:
+        rng = random.Random(42)
+        intervals = []
+        for trip_id in range(300):
+            start = rng.randrange(1000)
+            intervals.append(
+                Interval(*hours(start, start + rng.randrange(1, 50)), trip_id)
+            )
+        index = IntervalIndex(intervals)
+
+        for _ in range(200):
+            start = rng.randrange(1050)
+            query = hours(start, start + rng.randrange(1, 30))
+            self.assertEqual(
+                index.overlapping(*query),
+                sorted(
+                    interval
+                    for interval in intervals
+                    if interval.start < query[1] and interval.end > query[0]
+                )
+            )
+
+    def test_empty_index(self) -> None:
+        self.assertEqual(IntervalIndex([]).overlapping(*hours(0, 1)), [])
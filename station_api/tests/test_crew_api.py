@@ -8,6 +8,7 @@ from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
 
+from station_api.images import rendition_name
 from station_api.models import Crew
 from station_api.serializers import CrewReadSerializer
 from station_api.views import CrewViewSet
@@ -72,6 +73,26 @@ class AuthenticatedCrewApiTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["results"], serializer.data)
 
+    def test_search_crew_by_full_name(self) -> None:
+        Crew.objects.create(first_name="Ann", last_name="Johnson")
+        response = self.client.get(CREW_URL, {"search": "john"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [crew["full_name"] for crew in response.data["results"]],
+            ["John Doe", "Ann Johnson"]
+        )
+
+    def test_search_crew_by_first_and_last_name(self) -> None:
+        Crew.objects.create(first_name="Ann", last_name="Johnson")
+        response = self.client.get(CREW_URL, {"search": "doe jo"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [crew["full_name"] for crew in response.data["results"]],
+            ["John Doe"]
+        )
+
     def test_create_crew_forbidden(self) -> None:
         response = self.client.post(CREW_URL, self.payload)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -184,6 +205,70 @@ class AdminCrewApiTests(TestCase):
 
         crew.crew_image.delete()
 
+    def test_upload_image_builds_renditions(self) -> None:
+        crew = self.crew
+        url = image_upload_url(crew.id)
+        with tempfile.NamedTemporaryFile(suffix=".jpg") as ntf:
+            img = Image.new("RGB", (1000, 500))
+            img.save(ntf, format="JPEG")
+            ntf.seek(0)
+            response = self.client.post(
+                url,
+                {"crew_image": ntf},
+                format="multipart"
+            )
+        crew.refresh_from_db()
+        storage = crew.crew_image.storage
+        thumbnail = rendition_name(crew.crew_image.name, "thumbnail")
+        medium = rendition_name(crew.crew_image.name, "medium")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["crew_image_renditions"],
+            {
+                "thumbnail": "http://testserver" + storage.url(thumbnail),
+                "medium": "http://testserver" + storage.url(medium),
+            }
+        )
+        with Image.open(storage.path(thumbnail)) as image:
+            self.assertEqual(image.format, "WEBP")
+            self.assertEqual(image.size, (150, 75))
+        with Image.open(storage.path(medium)) as image:
+            self.assertEqual(image.size, (600, 300))
+
+        crew.delete()
+
+        self.assertFalse(storage.exists(thumbnail))
+        self.assertFalse(storage.exists(medium))
+
+    def test_upload_without_image_to_crew(self) -> None:
+        response = self.client.post(
+            image_upload_url(self.crew.id), {}, format="multipart"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["crew_image"])
+        self.assertIsNone(response.data["crew_image_renditions"])
+
+    def test_upload_undecodable_image_to_crew(self) -> None:
+        crew = self.crew
+        url = image_upload_url(crew.id)
+        with tempfile.NamedTemporaryFile(suffix=".jpg") as ntf:
+            img = Image.effect_noise((500, 500), 64).convert("RGB")
+            img.save(ntf, format="JPEG")
+            ntf.truncate(ntf.tell() // 2)
+            ntf.seek(0)
+            response = self.client.post(
+                url,
+                {"crew_image": ntf},
+                format="multipart"
+            )
+        crew.refresh_from_db()
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("crew_image", response.data)
+        self.assertFalse(crew.crew_image)
+
     def test_upload_not_valid_size_image_to_crew(self) -> None:
         crew = self.crew
         url = image_upload_url(crew.id)
@@ -0,0 +1,64 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework import status, viewsets
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from station_api.exports import ExportMixin
+from station_api.models import Station
+from station_api.serializers import StationSerializer
+
+
+class StationExportViewSet(ExportMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Station.objects.order_by("id")
+    serializer_class = StationSerializer
+    export_fields = ("id", "name")
+
+
+class ExportMixinTests(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com",
+            password="testpassword"
+        )
+        self.stations = [
+            Station.objects.create(name="Lviv", latitude=49.8, longitude=24),
+            Station.objects.create(name="Kyiv", latitude=50.4, longitude=30.5),
+        ]
+
+    def export(self, **params):
+        request = APIRequestFactory().get("/stations/export/", params)
+        force_authenticate(request, self.user)
+        view = StationExportViewSet.as_view(
+            {"get": "export"}, basename="station"
+        )
+        return view(request)
+
+    def test_export_rows_default_to_export_fields(self) -> None:
+        response = self.export()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [
+                json.loads(line)
+                for line in b"".join(response.streaming_content).splitlines()
+            ],
+            [
+                {"id": station.id, "name": station.name}
+                for station in self.stations
+            ]
+        )
+
+    def test_export_csv_has_export_fields_header(self) -> None:
+        response = self.export(export_format="csv")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            b"".join(response.streaming_content).decode().splitlines()[0],
+            "id,name"
+        )
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="station.csv"'
+        )
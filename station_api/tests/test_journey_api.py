@@ -0,0 +1,158 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+from station_api.cache import bump_model_version
+from station_api.journeys import journey_planner
+from station_api.models import Station, Route, TrainType, Train, Trip
+
+
+JOURNEY_URL = reverse("station-api:journey-list")
+
+
+class NotAuthenticatedJourneyApiTests(TestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+
+    def test_auth_required(self) -> None:
+        response = self.client.get(JOURNEY_URL)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class AuthenticatedJourneyApiTests(TestCase):
+    def setUp(self) -> None:
+        journey_planner.reset()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com",
+            password="testpassword",
+        )
+        self.client.force_authenticate(self.user)
+
+        self.lviv = Station.objects.create(
+            name="Lviv", latitude=49.84, longitude=24.02
+        )
+        self.kyiv = Station.objects.create(
+            name="Kyiv", latitude=50.45, longitude=30.52
+        )
+        self.kharkiv = Station.objects.create(
+            name="Kharkiv", latitude=49.99, longitude=36.23
+        )
+        self.lviv_kyiv = Route.objects.create(
+            source=self.lviv, destination=self.kyiv, distance=540
+        )
+        self.kyiv_kharkiv = Route.objects.create(
+            source=self.kyiv, destination=self.kharkiv, distance=480
+        )
+        self.train = Train.objects.create(
+            name="Intercity Express",
+            cargo_num=3,
+            places_in_cargo=50,
+            train_type=TrainType.objects.create(name="Inter-city")
+        )
+
+        self.first_leg = self.create_trip(
+            self.lviv_kyiv, "2024-01-01T06:00Z", "2024-01-01T12:00Z"
+        )
+        self.too_close_leg = self.create_trip(
+            self.kyiv_kharkiv, "2024-01-01T12:05Z", "2024-01-01T16:00Z"
+        )
+        self.second_leg = self.create_trip(
+            self.kyiv_kharkiv, "2024-01-01T13:00Z", "2024-01-01T18:00Z"
+        )
+
+    def create_trip(self, route: Route, departure: str, arrival: str) -> Trip:
+        return Trip.objects.create(
+            route=route,
+            train=self.train,
+            departure_time=departure,
+            arrival_time=arrival,
+        )
+
+    def search(self, **params) -> list[dict]:
+        response = self.client.get(
+            JOURNEY_URL,
+            {
+                "source": self.lviv.id,
+                "destination": self.kharkiv.id,
+                "departure_after": "2024-01-01T00:00Z",
+                **params,
+            }
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_journey_with_transfer(self) -> None:
+        journeys = self.search(limit=1)
+
+        self.assertEqual(len(journeys), 1)
+        self.assertEqual(journeys[0]["transfers"], 1)
+        self.assertEqual(
+            [leg["id"] for leg in journeys[0]["legs"]],
+            [self.first_leg.id, self.second_leg.id]
+        )
+        self.assertEqual(journeys[0]["arrival_time"], "01 Jan 2024 18:00")
+
+    def test_journey_respects_transfer_minutes(self) -> None:
+        journeys = self.search(limit=1, transfer_minutes=0)
+
+        self.assertEqual(
+            [leg["id"] for leg in journeys[0]["legs"]],
+            [self.first_leg.id, self.too_close_leg.id]
+        )
+
+    def test_journey_departure_after(self) -> None:
+        self.assertEqual(self.search(departure_after="2024-01-01T07:00Z"), [])
+
+    def test_journey_planner_follows_trip_changes(self) -> None:
+        self.search()
+        with self.captureOnCommitCallbacks(execute=True):
+            direct_trip = Trip.objects.create(
+                route=Route.objects.create(
+                    source=self.lviv, destination=self.kharkiv, distance=1000
+                ),
+                train=self.train,
+                departure_time="2024-01-01T07:00Z",
+                arrival_time="2024-01-01T17:00Z",
+            )
+        self.assertEqual(
+            [leg["id"] for leg in self.search(limit=1)[0]["legs"]],
+            [direct_trip.id]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            direct_trip.delete()
+        self.assertEqual(len(self.search(limit=1)[0]["legs"]), 2)
+
+    def test_journey_planner_follows_shared_versions(self) -> None:
+        direct_route = Route.objects.create(
+            source=self.lviv, destination=self.kharkiv, distance=1000
+        )
+        self.search()
+        # Trip added by another worker: no signals run in this process,
+        # only the shared change version is bumped
+        direct_trip, = Trip.objects.bulk_create(
+            [
+                Trip(
+                    route=direct_route,
+                    train=self.train,
+                    departure_time="2024-01-01T07:00Z",
+                    arrival_time="2024-01-01T17:00Z",
+                )
+            ]
+        )
+        self.assertEqual(len(self.search(limit=1)[0]["legs"]), 2)
+
+        bump_model_version(Trip)
+        self.assertEqual(
+            [leg["id"] for leg in self.search(limit=1)[0]["legs"]],
+            [direct_trip.id]
+        )
+
+    def test_journey_same_stations(self) -> None:
+        response = self.client.get(
+            JOURNEY_URL, {"source": self.kyiv.id, "destination": self.kyiv.id}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,85 @@
+import math
+import random
+
+from django.test import SimpleTestCase
+
+from station_api.locations import (
+    EARTH_RADIUS_KM,
+    KDTree,
+    Location,
+    chord_to_km,
+    km_to_chord,
+    to_unit_vector,
+)
+
+
+def haversine(
+    latitude: float, longitude: float, other_latitude: float,
+    other_longitude: float
+) -> float:
+    phi, other_phi = math.radians(latitude), math.radians(other_latitude)
+    half_phi = (other_phi - phi) / 2
+    half_lam = math.radians(other_longitude - longitude) / 2
+    a = (
+        math.sin(half_phi) ** 2
+        + math.cos(phi) * math.cos(other_phi) * math.sin(half_lam) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def location(station_id: int, latitude: float, longitude: float) -> Location:
+    return Location(
+        to_unit_vector(latitude, longitude),
+        station_id,
+        str(station_id),
+        latitude,
+        longitude,
+    )
+
+
+class KDTreeTests(SimpleTestCase):
+    def test_chord_distance_matches_haversine(self) -> None:
+        kyiv, lviv = (50.45, 30.52), (49.84, 24.02)
+        chord = math.dist(to_unit_vector(*kyiv), to_unit_vector(*lviv))
+
+        self.assertAlmostEqual(chord_to_km(chord), haversine(*kyiv, *lviv))
+        self.assertAlmostEqual(km_to_chord(chord_to_km(chord)), chord)
+
+    def test_empty_tree(self) -> None:
+        self.assertEqual(KDTree([]).nearest(to_unit_vector(0, 0), 5), [])
+
+    def test_matches_brute_force(self) -> None:
+        rng = random.Random(42)
+        locations = [
+            location(
+                station_id, rng.uniform(-89, 89), rng.uniform(-179, 179)
+            )
+            for station_id in range(500)
+        ]
+        tree = KDTree(locations)
+
+        for _ in range(100):
+            latitude, longitude = rng.uniform(-89, 89), rng.uniform(-179, 179)
+            k = rng.randrange(1, 20)
+            radius = rng.choice([None, rng.uniform(100, 3000)])
+            expected = sorted(
+                (
+                    haversine(
+                        latitude, longitude, other.latitude, other.longitude
+                    ),
+                    other.station_id,
+                )
+                for other in locations
+            )
+            if radius is not None:
+                expected = [item for item in expected if item[0] <= radius]
+            result = tree.nearest(
+                to_unit_vector(latitude, longitude),
+                k,
+                2.0 if radius is None else km_to_chord(radius),
+            )
+
+            self.assertEqual(
+                [found.station_id for _chord, found in result],
+                [station_id for _distance, station_id in expected[:k]]
+            )
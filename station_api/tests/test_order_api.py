@@ -1,15 +1,26 @@
+import csv
+import json
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
+from django.core import serializers
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
 
 from station_api.models import Order, Ticket, Trip, Train, Route, Station, \
-    TrainType
+    TrainType, UserTrip
 from station_api.serializers import OrderListSerializer
 from station_api.views import OrderViewSet
 
 ORDER_URL = reverse("station-api:order-list")
+ORDER_SUMMARY_URL = reverse("station-api:order-summary")
+ORDER_EXPORT_URL = reverse("station-api:order-export")
+TICKET_EXPORT_URL = reverse("station-api:order-export-tickets")
 PAGE_SIZE = OrderViewSet.pagination_class.page_size
 
 
@@ -87,6 +98,251 @@ class AuthenticatedOrderApiTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["results"], serializer.data)
 
+    def test_list_orders_tickets_available(self) -> None:
+        self.client.post(ORDER_URL, self.payload, format="json")
+
+        response = self.client.get(ORDER_URL)
+        trips = [
+            ticket["trip"]
+            for ticket in response.data["results"][0]["tickets"]
+        ]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(trips), 2)
+        for trip in trips:
+            self.assertEqual(trip["id"], self.trip.id)
+            self.assertEqual(trip["tickets_available"], 148)
+
+    def test_list_orders_queries_do_not_grow_with_tickets(self) -> None:
+        self.client.post(ORDER_URL, self.payload, format="json")
+        with CaptureQueriesContext(connection) as short_history:
+            self.client.get(ORDER_URL)
+
+        other_trip = Trip.objects.create(
+            route=self.route,
+            train=self.train,
+            departure_time="2024-01-02T08:00:00Z",
+            arrival_time="2024-01-02T12:00:00Z"
+        )
+        for cargo in (2, 3):
+            self.client.post(
+                ORDER_URL,
+                {
+                    "tickets": [
+                        {"cargo": cargo, "seat": seat, "trip": trip.id}
+                        for seat in range(1, 11)
+                        for trip in (self.trip, other_trip)
+                    ]
+                },
+                format="json"
+            )
+        with CaptureQueriesContext(connection) as long_history:
+            response = self.client.get(ORDER_URL)
+
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(len(long_history), len(short_history))
+
+    def test_order_summary(self) -> None:
+        upcoming_trip = Trip.objects.create(
+            route=self.route,
+            train=self.train,
+            departure_time=timezone.now() + timedelta(days=2),
+            arrival_time=timezone.now() + timedelta(days=2, hours=4)
+        )
+        self.client.post(ORDER_URL, self.payload, format="json")
+        self.client.post(
+            ORDER_URL,
+            {"tickets": [{"cargo": 1, "seat": 1, "trip": upcoming_trip.id}]},
+            format="json"
+        )
+
+        response = self.client.get(ORDER_SUMMARY_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            {
+                "upcoming_trips": 1,
+                "past_trips": 1,
+                "next_departure": upcoming_trip.departure_time.strftime(
+                    "%d %b %Y %H:%M"
+                ),
+                "total_tickets": 3,
+            }
+        )
+
+    def test_order_summary_follows_deleted_tickets(self) -> None:
+        self.client.post(ORDER_URL, self.payload, format="json")
+        order = Order.objects.get(user=self.user)
+        order.tickets.first().delete()
+        Ticket.objects.create(trip=self.trip, cargo=2, seat=1, order=order)
+        Order.objects.create(user=self.user).delete()
+
+        self.assertEqual(
+            self.client.get(ORDER_SUMMARY_URL).data["total_tickets"], 2
+        )
+        order.delete()
+        self.assertEqual(
+            self.client.get(ORDER_SUMMARY_URL).data,
+            {
+                "upcoming_trips": 0,
+                "past_trips": 0,
+                "next_departure": None,
+                "total_tickets": 0,
+            }
+        )
+
+    def test_updated_ticket_moves_taken_place(self) -> None:
+        other_trip = Trip.objects.create(
+            route=self.route,
+            train=self.train,
+            departure_time="2024-01-02T08:00:00Z",
+            arrival_time="2024-01-02T12:00:00Z"
+        )
+        other_user = get_user_model().objects.create_user(
+            email="other@test.com",
+            password="testpassword",
+        )
+        self.client.post(ORDER_URL, self.payload, format="json")
+        ticket = Ticket.objects.get(cargo=1, seat=1)
+
+        ticket.seat = 3
+        ticket.save()
+        ticket.trip = other_trip
+        ticket.order = Order.objects.create(user=other_user)
+        ticket.save()
+
+        self.assertEqual(
+            list(Trip.collect_stale_inventory(Trip.objects.all())), []
+        )
+        self.trip.refresh_from_db()
+        other_trip.refresh_from_db()
+        self.assertEqual(self.trip.tickets_sold, 1)
+        self.assertEqual(other_trip.tickets_sold, 1)
+        self.assertEqual(
+            set(
+                UserTrip.objects.values_list("user_id", "trip_id", "tickets")
+            ),
+            {
+                (self.user.id, self.trip.id, 1),
+                (other_user.id, other_trip.id, 1),
+            }
+        )
+
+    def test_loaded_tickets_are_not_counted_twice(self) -> None:
+        self.client.post(ORDER_URL, self.payload, format="json")
+        fixture = serializers.serialize(
+            "json",
+            [
+                *Trip.objects.all(),
+                *Order.objects.all(),
+                *Ticket.objects.all(),
+            ]
+        )
+        Trip.objects.all().delete()
+        Order.objects.all().delete()
+
+        for loaded in serializers.deserialize("json", fixture):
+            loaded.save()
+
+        self.trip.refresh_from_db()
+        self.assertEqual(self.trip.tickets_sold, 2)
+        self.assertEqual(
+            list(Trip.collect_stale_inventory(Trip.objects.all())), []
+        )
+
+    def test_empty_order_summary(self) -> None:
+        with self.assertNumQueries(1):
+            response = self.client.get(ORDER_SUMMARY_URL)
+
+        self.assertEqual(response.data["next_departure"], None)
+        self.assertEqual(response.data["upcoming_trips"], 0)
+
+    def test_list_orders_cursor_pagination(self) -> None:
+        for _ in range(5):
+            Order.objects.create(user=self.user)
+        expected_ids = list(
+            Order.objects.order_by("-created_at", "-id")
+            .values_list("id", flat=True)
+        )
+
+        ids = []
+        url = ORDER_URL
+        params = {"pagination": "cursor", "per_page": 2}
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(order["id"] for order in response.data["results"])
+            url, params = response.data["next"], None
+        self.assertEqual(ids, expected_ids)
+
+    def test_export_orders(self) -> None:
+        order = Order.objects.create(user=self.user)
+        Ticket.objects.create(trip=self.trip, cargo=1, seat=1, order=order)
+        Ticket.objects.create(trip=self.trip, cargo=1, seat=2, order=order)
+        Order.objects.create(
+            user=get_user_model().objects.create_user(
+                email="other@test.com",
+                password="testpassword",
+            )
+        )
+
+        response = self.client.get(ORDER_EXPORT_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        self.assertEqual(
+            rows,
+            [
+                {
+                    "id": order.id,
+                    "created_at": order.created_at.strftime("%d %b %Y %H:%M"),
+                    "tickets": 2,
+                }
+            ]
+        )
+
+    def test_export_tickets_csv(self) -> None:
+        order = Order.objects.create(user=self.user)
+        ticket = Ticket.objects.create(
+            trip=self.trip, cargo=2, seat=7, order=order
+        )
+
+        response = self.client.get(TICKET_EXPORT_URL, {"export_format": "csv"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(
+            csv.reader(
+                b"".join(response.streaming_content).decode().splitlines()
+            )
+        )
+        self.assertEqual(
+            rows,
+            [
+                [
+                    "id",
+                    "order",
+                    "trip",
+                    "route",
+                    "departure_time",
+                    "cargo",
+                    "seat",
+                ],
+                [
+                    str(ticket.id),
+                    str(order.id),
+                    str(self.trip.id),
+                    "Kyiv - Lviv",
+                    "01 Jan 2024 08:00",
+                    "2",
+                    "7",
+                ],
+            ]
+        )
+
     def test_create_order(self) -> None:
         response = self.client.post(ORDER_URL, self.payload, format="json")
         print(response.data)
@@ -105,3 +361,45 @@ class AuthenticatedOrderApiTests(TestCase):
         self.payload["tickets"][0]["seat"] = 100
         response = self.client.post(ORDER_URL, self.payload)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_order_queries_do_not_grow_with_tickets(self) -> None:
+        with CaptureQueriesContext(connection) as small_order:
+            self.client.post(ORDER_URL, self.payload, format="json")
+
+        payload = {
+            "tickets": [
+                {"cargo": 2, "seat": seat, "trip": self.trip.id}
+                for seat in range(1, 41)
+            ]
+        }
+        with CaptureQueriesContext(connection) as group_order:
+            response = self.client.post(ORDER_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["tickets"]), 40)
+        self.assertEqual(len(group_order), len(small_order))
+        self.trip.refresh_from_db()
+        self.assertEqual(self.trip.tickets_sold, 42)
+
+    def test_create_order_taken_place(self) -> None:
+        self.client.post(ORDER_URL, self.payload, format="json")
+        response = self.client.post(ORDER_URL, self.payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("non_field_errors", response.data["tickets"][0])
+
+    def test_create_order_duplicated_place(self) -> None:
+        self.payload["tickets"][1]["seat"] = 1
+        response = self.client.post(ORDER_URL, self.payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["tickets"][0], {})
+        self.assertIn("non_field_errors", response.data["tickets"][1])
+        self.assertFalse(Ticket.objects.exists())
+
+    def test_create_order_invalid_trip(self) -> None:
+        self.payload["tickets"][0]["trip"] = self.trip.id + 1
+        response = self.client.post(ORDER_URL, self.payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("trip", response.data["tickets"][0])
@@ -0,0 +1,53 @@
+import datetime
+import decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from station_api.renderers import FastJSONRenderer
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.data = ReturnDict(
+            {
+                "count": 2,
+                "results": ReturnList(
+                    [
+                        {
+                            "id": 1,
+                            "created_at": datetime.datetime(
+                                2024, 1, 1, 12, 0, 30, 123456,
+                                tzinfo=datetime.timezone.utc
+                            ),
+                            "date": datetime.date(2024, 1, 1),
+                            "price": decimal.Decimal("10.50"),
+                            "detail": gettext_lazy("Not found."),
+                            "route": "Kyiv   Lviv ",
+                            "name": "Київ",
+                        },
+                        {"id": 2, 3: None, "ratio": 0.1},
+                    ],
+                    serializer=None
+                ),
+            },
+            serializer=None
+        )
+
+    def test_output_matches_json_renderer(self) -> None:
+        self.assertEqual(
+            FastJSONRenderer().render(self.data),
+            JSONRenderer().render(self.data)
+        )
+
+    def test_indented_output_matches_json_renderer(self) -> None:
+        media_type = "application/json; indent=4"
+        self.assertEqual(
+            FastJSONRenderer().render(self.data, media_type),
+            JSONRenderer().render(self.data, media_type)
+        )
+
+    def test_empty_data(self) -> None:
+        self.assertEqual(FastJSONRenderer().render(None), b"")
@@ -112,6 +112,15 @@ class AuthenticatedRouteApiTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["results"], serializer.data)
 
+    def test_route_list_cache_invalidated_on_station_change(self) -> None:
+        self.client.get(ROUTE_URL)
+        self.station_1.name = "Kyiv"
+        self.station_1.save()
+        response = self.client.get(ROUTE_URL, {"source": "kyiv"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+
     def test_create_route_forbidden(self) -> None:
         response = self.client.post(ROUTE_URL, self.payload)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
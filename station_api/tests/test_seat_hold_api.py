@@ -0,0 +1,218 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+
+from station_api.models import (
+    Station,
+    Route,
+    TrainType,
+    Train,
+    Trip,
+    Ticket,
+    SeatHold,
+)
+
+
+SEAT_HOLD_URL = reverse("station-api:seathold-list")
+SEAT_HOLD_CONFIRM_URL = reverse("station-api:seathold-confirm")
+ORDER_URL = reverse("station-api:order-list")
+
+
+def detail_url(hold_id: int) -> str:
+    return reverse("station-api:seathold-detail", args=[hold_id])
+
+
+class NotAuthenticatedSeatHoldApiTests(TestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+
+    def test_auth_required(self) -> None:
+        response = self.client.get(SEAT_HOLD_URL)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class AuthenticatedSeatHoldApiTests(TestCase):
+    def setUp(self) -> None:
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com",
+            password="testpassword",
+        )
+        self.other_user = get_user_model().objects.create_user(
+            email="other@test.com",
+            password="testpassword",
+        )
+        self.client.force_authenticate(self.user)
+
+        self.trip = Trip.objects.create(
+            route=Route.objects.create(
+                source=Station.objects.create(
+                    name="Kyiv",
+                    latitude=50.45,
+                    longitude=30.52
+                ),
+                destination=Station.objects.create(
+                    name="Lviv",
+                    latitude=49.84,
+                    longitude=24.02
+                ),
+                distance=550
+            ),
+            train=Train.objects.create(
+                name="Intercity Express",
+                cargo_num=3,
+                places_in_cargo=50,
+                train_type=TrainType.objects.create(name="Inter-city")
+            ),
+            departure_time="2024-01-01T08:00:00Z",
+            arrival_time="2024-01-01T12:00:00Z"
+        )
+
+        self.payload = {
+            "tickets": [
+                {"cargo": 1, "seat": 1, "trip": self.trip.id},
+                {"cargo": 1, "seat": 2, "trip": self.trip.id},
+            ]
+        }
+
+    def hold(self, user, cargo: int, seat: int, expires_in: int = 10):
+        return SeatHold.objects.create(
+            user=user,
+            trip=self.trip,
+            cargo=cargo,
+            seat=seat,
+            expires_at=timezone.now() + timedelta(minutes=expires_in)
+        )
+
+    def test_create_seat_holds(self) -> None:
+        response = self.client.post(
+            SEAT_HOLD_URL, self.payload, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(
+            SeatHold.objects.filter(user=self.user).count(), 2
+        )
+
+    def test_list_only_own_active_seat_holds(self) -> None:
+        own_hold = self.hold(self.user, cargo=1, seat=1)
+        self.hold(self.user, cargo=1, seat=2, expires_in=-1)
+        self.hold(self.other_user, cargo=1, seat=3)
+
+        response = self.client.get(SEAT_HOLD_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [hold["id"] for hold in response.data["results"]],
+            [own_hold.id]
+        )
+
+    def test_place_held_by_other_user(self) -> None:
+        self.hold(self.other_user, cargo=1, seat=1)
+
+        hold_response = self.client.post(
+            SEAT_HOLD_URL, self.payload, format="json"
+        )
+        order_response = self.client.post(
+            ORDER_URL, self.payload, format="json"
+        )
+
+        self.assertEqual(
+            hold_response.status_code, status.HTTP_400_BAD_REQUEST
+        )
+        self.assertEqual(
+            order_response.status_code, status.HTTP_400_BAD_REQUEST
+        )
+        self.assertIn("non_field_errors", order_response.data["tickets"][0])
+
+    def test_expired_hold_is_replaced(self) -> None:
+        self.hold(self.other_user, cargo=1, seat=1, expires_in=-1)
+
+        response = self.client.post(
+            SEAT_HOLD_URL, self.payload, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertFalse(
+            SeatHold.objects.filter(user=self.other_user).exists()
+        )
+
+    def test_confirm_seat_holds(self) -> None:
+        holds = [
+            self.hold(self.user, cargo=1, seat=1),
+            self.hold(self.user, cargo=1, seat=2),
+        ]
+
+        response = self.client.post(
+            SEAT_HOLD_CONFIRM_URL,
+            {"holds": [hold.id for hold in holds]},
+            format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            Ticket.objects.filter(order_id=response.data["id"]).count(), 2
+        )
+        self.assertFalse(SeatHold.objects.exists())
+        self.trip.refresh_from_db()
+        self.assertEqual(self.trip.tickets_sold, 2)
+
+    def test_order_releases_own_seat_holds(self) -> None:
+        self.hold(self.user, cargo=1, seat=1)
+        own_hold = self.hold(self.user, cargo=1, seat=3)
+        other_hold = self.hold(self.other_user, cargo=1, seat=4)
+
+        response = self.client.post(ORDER_URL, self.payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            set(SeatHold.objects.values_list("id", flat=True)),
+            {own_hold.id, other_hold.id}
+        )
+
+    def test_confirm_expired_seat_hold(self) -> None:
+        hold = self.hold(self.user, cargo=1, seat=1, expires_in=-1)
+
+        response = self.client.post(
+            SEAT_HOLD_CONFIRM_URL, {"holds": [hold.id]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Ticket.objects.exists())
+
+    def test_confirm_other_user_seat_hold(self) -> None:
+        hold = self.hold(self.other_user, cargo=1, seat=1)
+
+        response = self.client.post(
+            SEAT_HOLD_CONFIRM_URL, {"holds": [hold.id]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(SeatHold.objects.filter(id=hold.id).exists())
+
+    def test_release_seat_hold(self) -> None:
+        hold = self.hold(self.user, cargo=1, seat=1)
+
+        response = self.client.delete(detail_url(hold.id))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(SeatHold.objects.exists())
+
+    def test_expire_seat_holds_command(self) -> None:
+        active_hold = self.hold(self.user, cargo=1, seat=1)
+        self.hold(self.user, cargo=1, seat=2, expires_in=-1)
+
+        call_command("expire_seat_holds", stdout=StringIO())
+
+        self.assertEqual(
+            list(SeatHold.objects.values_list("id", flat=True)),
+            [active_hold.id]
+        )
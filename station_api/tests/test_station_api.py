@@ -4,12 +4,19 @@ from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
 
-from station_api.models import Station
+from station_api.autocomplete import station_autocomplete
+from station_api.cache import bump_model_version
+from station_api.distances import station_distances
+from station_api.locations import station_locator
+from station_api.models import Station, Route
 from station_api.serializers import StationSerializer
 from station_api.views import StationViewSet
 
 
 STATION_URL = reverse("station-api:station-list")
+STATION_DISTANCE_URL = reverse("station-api:station-distance")
+STATION_AUTOCOMPLETE_URL = reverse("station-api:station-autocomplete")
+STATION_NEAREST_URL = reverse("station-api:station-nearest")
 PAGE_SIZE = StationViewSet.pagination_class.page_size
 
 
@@ -69,11 +76,283 @@ class AuthenticatedStationApiTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["results"], serializer.data)
 
+    def test_station_search_ranks_prefix_matches_first(self) -> None:
+        Station.objects.create(
+            name="Tsvitkove", latitude=49.13, longitude=31.17
+        )
+        response = self.client.get(STATION_URL, {"search": "Ts"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [station["name"] for station in response.data["results"]],
+            ["Tsvitkove", "Chernivtsi", "Donetsk", "Lutsk"]
+        )
+
+    def test_station_list_cached(self) -> None:
+        response = self.client.get(STATION_URL, {"name": "cher"})
+
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(STATION_URL, {"name": "cher"})
+
+        self.assertEqual(cached_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(cached_response.data, response.data)
+
+    def test_station_list_cache_invalidated_on_change(self) -> None:
+        self.client.get(STATION_URL)
+        Station.objects.create(**self.payload)
+        response = self.client.get(STATION_URL)
+
+        self.assertEqual(response.data["count"], 5)
+        self.assertIn(
+            "Kyiv",
+            [station["name"] for station in response.data["results"]]
+        )
+
     def test_create_station_forbidden(self) -> None:
         response = self.client.post(STATION_URL, self.payload)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
 
+class StationDistanceApiTests(TestCase):
+    def setUp(self) -> None:
+        station_distances.invalidate()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com",
+            password="testpassword",
+        )
+        self.client.force_authenticate(self.user)
+
+        self.lviv = Station.objects.create(
+            name="Lviv", latitude=49.84, longitude=24.02
+        )
+        self.kyiv = Station.objects.create(
+            name="Kyiv", latitude=50.45, longitude=30.52
+        )
+        self.kharkiv = Station.objects.create(
+            name="Kharkiv", latitude=49.99, longitude=36.23
+        )
+        Route.objects.create(
+            source=self.lviv, destination=self.kyiv, distance=540
+        )
+        Route.objects.create(
+            source=self.kyiv, destination=self.kharkiv, distance=480
+        )
+        self.direct_route = Route.objects.create(
+            source=self.lviv, destination=self.kharkiv, distance=1100
+        )
+
+    def get_distance(self, source: Station, destination: Station) -> dict:
+        response = self.client.get(
+            STATION_DISTANCE_URL,
+            {"source": source.id, "destination": destination.id}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_shortest_distance(self) -> None:
+        data = self.get_distance(self.lviv, self.kharkiv)
+
+        self.assertEqual(data["distance"], 1020)
+        self.assertEqual(data["stations"], ["Lviv", "Kyiv", "Kharkiv"])
+
+    def test_not_connected_stations(self) -> None:
+        data = self.get_distance(self.kharkiv, self.lviv)
+
+        self.assertIsNone(data["distance"])
+        self.assertEqual(data["stations"], [])
+
+    def test_distance_follows_route_changes(self) -> None:
+        self.get_distance(self.lviv, self.kharkiv)
+        self.direct_route.distance = 900
+        with self.captureOnCommitCallbacks(execute=True):
+            self.direct_route.save()
+
+        self.assertEqual(
+            station_distances.distance(self.lviv.id, self.kharkiv.id),
+            900
+        )
+
+    def test_distance_follows_shared_versions(self) -> None:
+        self.get_distance(self.lviv, self.kharkiv)
+        # Edited by another worker, only the shared version is bumped
+        Route.objects.filter(pk=self.direct_route.pk).update(distance=900)
+        self.assertNotEqual(
+            station_distances.distance(self.lviv.id, self.kharkiv.id), 900
+        )
+
+        bump_model_version(Route)
+        self.assertEqual(
+            station_distances.distance(self.lviv.id, self.kharkiv.id), 900
+        )
+
+    def test_distance_same_stations(self) -> None:
+        response = self.client.get(
+            STATION_DISTANCE_URL,
+            {"source": self.kyiv.id, "destination": self.kyiv.id}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class StationAutocompleteApiTests(TestCase):
+    def setUp(self) -> None:
+        station_autocomplete.invalidate()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com",
+            password="testpassword",
+        )
+        self.client.force_authenticate(self.user)
+
+        for name, latitude, longitude in (
+            ("Chernivtsi", 48.29, 25.39),
+            ("Chernihiv", 51.50, 31.32),
+            ("Ivano-Frankivsk", 48.92, 24.71),
+            ("Kyiv-Pasazhyrskyi", 50.44, 30.49),
+            ("Kyiv", 50.45, 30.52),
+        ):
+            Station.objects.create(
+                name=name, latitude=latitude, longitude=longitude
+            )
+
+    def complete(self, query: str, **params) -> list[str]:
+        response = self.client.get(
+            STATION_AUTOCOMPLETE_URL, {"q": query, **params}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [station["name"] for station in response.data]
+
+    def test_complete_name_prefix(self) -> None:
+        self.assertEqual(self.complete("CHER"), ["Chernihiv", "Chernivtsi"])
+        self.assertEqual(self.complete("kyiv"), ["Kyiv", "Kyiv-Pasazhyrskyi"])
+
+    def test_complete_word_prefix_after_name_prefix(self) -> None:
+        Station.objects.create(
+            name="Pavlohrad", latitude=48.52, longitude=35.87
+        )
+        station_autocomplete.invalidate()
+
+        self.assertEqual(
+            self.complete("pa"), ["Pavlohrad", "Kyiv-Pasazhyrskyi"]
+        )
+        self.assertEqual(self.complete("frank"), ["Ivano-Frankivsk"])
+
+    def test_complete_limit(self) -> None:
+        self.assertEqual(self.complete("k", limit=1), ["Kyiv"])
+
+    def test_complete_without_queries(self) -> None:
+        self.complete("ky")
+
+        with self.assertNumQueries(0):
+            station_autocomplete.complete("che", 10)
+
+    def test_complete_follows_station_changes(self) -> None:
+        self.complete("ch")
+        with self.captureOnCommitCallbacks(execute=True):
+            Station.objects.create(name="Chop", latitude=48.43, longitude=22.2)
+
+        self.assertEqual(
+            self.complete("ch"), ["Chernihiv", "Chernivtsi", "Chop"]
+        )
+
+    def test_complete_follows_shared_versions(self) -> None:
+        self.complete("ch")
+        # Renamed by another worker, only the shared version is bumped
+        Station.objects.filter(name="Chernihiv").update(name="Chop")
+        self.assertEqual(self.complete("ch"), ["Chernihiv", "Chernivtsi"])
+
+        bump_model_version(Station)
+        self.assertEqual(self.complete("ch"), ["Chernivtsi", "Chop"])
+
+    def test_invalid_limit(self) -> None:
+        response = self.client.get(
+            STATION_AUTOCOMPLETE_URL, {"q": "ky", "limit": 0}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class StationNearestApiTests(TestCase):
+    def setUp(self) -> None:
+        station_locator.invalidate()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com",
+            password="testpassword",
+        )
+        self.client.force_authenticate(self.user)
+
+        for name, latitude, longitude in (
+            ("Chernivtsi", 48.29, 25.39),
+            ("Lutsk", 50.76, 25.34),
+            ("Lviv", 49.84, 24.02),
+            ("Kyiv", 50.45, 30.52),
+        ):
+            Station.objects.create(
+                name=name, latitude=latitude, longitude=longitude
+            )
+
+    def nearest(self, **params) -> list[dict]:
+        response = self.client.get(
+            STATION_NEAREST_URL,
+            {"latitude": 48.3, "longitude": 25.35, **params}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_nearest_stations(self) -> None:
+        stations = self.nearest(limit=2)
+
+        self.assertEqual(
+            [station["name"] for station in stations], ["Chernivtsi", "Lviv"]
+        )
+        self.assertAlmostEqual(stations[0]["distance"], 3.161)
+
+    def test_nearest_stations_within_radius(self) -> None:
+        self.assertEqual(
+            [station["name"] for station in self.nearest(radius=250)],
+            ["Chernivtsi", "Lviv"]
+        )
+
+    def test_nearest_without_queries(self) -> None:
+        self.nearest()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(len(self.nearest()), 4)
+
+    def test_nearest_follows_station_changes(self) -> None:
+        self.nearest()
+        with self.captureOnCommitCallbacks(execute=True):
+            Station.objects.create(
+                name="Kamianets-Podilskyi", latitude=48.68, longitude=26.58
+            )
+
+        self.assertEqual(
+            [station["name"] for station in self.nearest(limit=2)],
+            ["Chernivtsi", "Kamianets-Podilskyi"]
+        )
+
+    def test_nearest_follows_shared_versions(self) -> None:
+        self.nearest()
+        # Moved by another worker, only the shared version is bumped
+        Station.objects.filter(name="Kyiv").update(
+            latitude=48.31, longitude=25.36
+        )
+        self.assertEqual(self.nearest(limit=1)[0]["name"], "Chernivtsi")
+
+        bump_model_version(Station)
+        station = self.nearest(limit=1)[0]
+        self.assertEqual(station["name"], "Kyiv")
+        self.assertEqual(
+            (station["latitude"], station["longitude"]), (48.31, 25.36)
+        )
+
+    def test_invalid_coordinates(self) -> None:
+        response = self.client.get(
+            STATION_NEAREST_URL, {"latitude": 91, "longitude": 25.35}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
 class AdminStationApiTests(TestCase):
     def setUp(self) -> None:
         self.client = APIClient()
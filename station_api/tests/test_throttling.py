@@ -0,0 +1,127 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.conf import settings
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from station_api.throttling import (
+    AnonCounterThrottle,
+    UserCounterThrottle,
+    ScopedCounterThrottle,
+)
+
+
+RATES = {"anon": "2/minute", "user": "3/minute", "orders": "1/minute"}
+
+
+class Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ThrottleMixin:
+    THROTTLE_RATES = RATES
+    timer = Clock(600.0)
+
+
+class TestAnonThrottle(ThrottleMixin, AnonCounterThrottle):
+    pass
+
+
+class TestUserThrottle(ThrottleMixin, UserCounterThrottle):
+    pass
+
+
+class TestScopedThrottle(ThrottleMixin, ScopedCounterThrottle):
+    pass
+
+
+class MockView(APIView):
+    permission_classes = []
+    throttle_classes = (TestAnonThrottle, TestUserThrottle, TestScopedThrottle)
+
+    def get(self, request):
+        return Response("ok")
+
+
+class OrdersMockView(MockView):
+    throttle_scope = "orders"
+
+
+class CounterThrottleTests(TestCase):
+    def setUp(self) -> None:
+        caches[settings.THROTTLE_CACHE_ALIAS].clear()
+        ThrottleMixin.timer.now = 600.0
+        self.factory = APIRequestFactory()
+        self.user = get_user_model().objects.create_user(
+            email="test@test.com",
+            password="testpassword",
+        )
+
+    def get(self, view: type[APIView], user=None) -> Response:
+        request = self.factory.get("/")
+        if user is not None:
+            force_authenticate(request, user)
+        return view.as_view()(request)
+
+    def statuses(self, view: type[APIView], count: int, user=None) -> list:
+        return [self.get(view, user).status_code for _ in range(count)]
+
+    def test_anon_rate(self) -> None:
+        self.assertEqual(
+            self.statuses(MockView, 3),
+            [status.HTTP_200_OK] * 2 + [status.HTTP_429_TOO_MANY_REQUESTS]
+        )
+
+    def test_user_rate(self) -> None:
+        self.assertEqual(
+            self.statuses(MockView, 4, self.user),
+            [status.HTTP_200_OK] * 3 + [status.HTTP_429_TOO_MANY_REQUESTS]
+        )
+
+    def test_scoped_rate_replaces_user_rate(self) -> None:
+        self.assertEqual(
+            self.statuses(OrdersMockView, 2, self.user),
+            [status.HTTP_200_OK, status.HTTP_429_TOO_MANY_REQUESTS]
+        )
+        self.assertEqual(
+            self.get(MockView, self.user).status_code, status.HTTP_200_OK
+        )
+
+    def test_sliding_window(self) -> None:
+        self.statuses(MockView, 3, self.user)
+
+        # Half of the previous window still counts: 3 * 0.5 + 1 <= 3
+        ThrottleMixin.timer.now = 690.0
+        self.assertEqual(
+            self.statuses(MockView, 2, self.user),
+            [status.HTTP_200_OK, status.HTTP_429_TOO_MANY_REQUESTS]
+        )
+
+        ThrottleMixin.timer.now = 780.0
+        self.assertEqual(
+            self.statuses(MockView, 4, self.user),
+            [status.HTTP_200_OK] * 3 + [status.HTTP_429_TOO_MANY_REQUESTS]
+        )
+
+    def test_rejected_requests_not_counted(self) -> None:
+        self.statuses(MockView, 10)
+
+        ThrottleMixin.timer.now = 690.0
+        self.assertEqual(
+            self.statuses(MockView, 2),
+            [status.HTTP_200_OK, status.HTTP_429_TOO_MANY_REQUESTS]
+        )
+
+    def test_retry_after(self) -> None:
+        ThrottleMixin.timer.now = 630.0
+        self.statuses(MockView, 2)
+
+        response = self.get(MockView)
+        self.assertEqual(response["Retry-After"], "60")
@@ -1,7 +1,10 @@
+import io
 import os
 import tempfile
 
 from PIL import Image
+from django.core.files.base import ContentFile
+from django.core.management import call_command
 from django.contrib.auth import get_user_model
 from django.db.models import ExpressionWrapper, F, IntegerField
 from django.test import TestCase
@@ -9,6 +12,7 @@ from rest_framework import status
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
 
+from station_api.images import rendition_name
 from station_api.models import Train, TrainType
 from station_api.serializers import TrainReadSerializer
 from station_api.views import TrainViewSet
@@ -281,6 +285,37 @@ class AdminTrainApiTests(TestCase):
 
         train.train_image.delete()
 
+    def test_build_image_renditions_command(self) -> None:
+        train = self.train
+        with tempfile.TemporaryFile() as tf:
+            Image.new("RGB", (400, 800)).save(tf, format="PNG")
+            tf.seek(0)
+            train.train_image.save("tiger.png", ContentFile(tf.read()))
+        storage = train.train_image.storage
+        thumbnail = rendition_name(train.train_image.name, "thumbnail")
+        medium = rendition_name(train.train_image.name, "medium")
+
+        response = self.client.get(detail_url(train.id))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["train_image_renditions"]["thumbnail"],
+            "http://testserver" + storage.url(thumbnail)
+        )
+        self.assertFalse(storage.exists(thumbnail))
+
+        call_command("build_image_renditions", stdout=io.StringIO())
+
+        with Image.open(storage.path(thumbnail)) as image:
+            self.assertEqual(image.size, (75, 150))
+        with Image.open(storage.path(medium)) as image:
+            self.assertEqual(image.size, (300, 600))
+
+        train.delete()
+
+        self.assertFalse(storage.exists(thumbnail))
+        self.assertFalse(storage.exists(medium))
+
     def test_upload_not_valid_size_image_to_train(self) -> None:
         train = self.train
         url = image_upload_url(train.id)
@@ -1,10 +1,24 @@
+import base64
+import csv
+import datetime
+import json
+from io import StringIO
+from unittest import mock
+
 from django.contrib.auth import get_user_model
+from django.core.management import call_command, CommandError
+from django.db import connection
 from django.db.models import F, Count, QuerySet
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
 from rest_framework.reverse import reverse
 from rest_framework.test import APIClient
 
+from station_api.filters import TripFilter
+from station_api.journeys import journey_planner
 from station_api.models import (
     Station,
     Route,
@@ -14,11 +28,21 @@ from station_api.models import (
     Order,
     Ticket, Crew
 )
-from station_api.serializers import TripListSerializer, TripRetrieveSerializer
+from station_api.seat_maps import build_seat_map, encode_bitmap, encode_runs
+from station_api.serializers import (
+    TripCreateUpdateSerializer,
+    TripListSerializer,
+    TripListRowSerializer,
+    TripRetrieveSerializer,
+    TripScheduleSerializer,
+)
 from station_api.views import TripViewSet
 
 
 TRIP_URL = reverse("station-api:trip-list")
+TRIP_EXPORT_URL = reverse("station-api:trip-export")
+TRIP_SCHEDULE_URL = reverse("station-api:trip-schedule")
+TRIP_CONFLICTS_URL = reverse("station-api:trip-conflicts")
 PAGE_SIZE = TripViewSet.pagination_class.page_size
 
 
@@ -132,6 +156,154 @@ class AuthenticatedTripApiTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["results"], serializer.data)
 
+    def test_trip_list_row_serializer_parity(self) -> None:
+        order = Order.objects.create(user=self.user)
+        Ticket.objects.create(trip=self.trip_2, cargo=1, seat=1, order=order)
+        Ticket.objects.create(trip=self.trip_2, cargo=2, seat=5, order=order)
+        trips = annotated_tickets_available(
+            Trip.objects.order_by("departure_time")
+        )
+        renderer = JSONRenderer()
+
+        self.assertEqual(
+            renderer.render(
+                TripListRowSerializer.serialize(
+                    trips.values_list(*TripListRowSerializer.columns)
+                )
+            ),
+            renderer.render(TripListSerializer(trips, many=True).data)
+        )
+        response = self.client.get(TRIP_URL)
+        self.assertEqual(
+            renderer.render(response.data["results"]),
+            renderer.render(TripListSerializer(trips, many=True).data)
+        )
+
+    def test_export_trips(self) -> None:
+        response = self.client.get(
+            TRIP_EXPORT_URL, {"source_station": "chernivtsi"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+        trips = annotated_tickets_available(
+            Trip.objects.filter(route=self.route_1).order_by("departure_time")
+        )
+        self.assertEqual(rows, TripListSerializer(trips, many=True).data)
+
+    def test_export_trips_csv(self) -> None:
+        response = self.client.get(TRIP_EXPORT_URL, {"export_format": "csv"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = list(
+            csv.DictReader(
+                b"".join(response.streaming_content).decode().splitlines()
+            )
+        )
+        self.assertEqual(
+            [int(row["id"]) for row in rows],
+            [self.trip_1.id, self.trip_2.id, self.trip_3.id, self.trip_4.id]
+        )
+        self.assertEqual(rows[0]["route"], "Chernivtsi - Donetsk")
+        self.assertEqual(rows[0]["departure_time"], "01 Jan 2024 12:00")
+
+    def test_export_trips_invalid_format(self) -> None:
+        response = self.client.get(TRIP_EXPORT_URL, {"export_format": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_trip_list_cursor_pagination(self) -> None:
+        Trip.objects.create(
+            route=self.route_1,
+            train=self.train_1,
+            departure_time="2024-01-01T12:00Z",
+            arrival_time="2024-01-01T20:00Z"
+        )
+        expected_ids = list(
+            Trip.objects.order_by("departure_time", "id")
+            .values_list("id", flat=True)
+        )
+
+        ids = []
+        url = TRIP_URL
+        params = {"pagination": "cursor", "per_page": 2}
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            ids.extend(trip["id"] for trip in response.data["results"])
+            url, params = response.data["next"], None
+        self.assertEqual(ids, expected_ids)
+
+        response = self.client.get(response.data["previous"])
+        self.assertEqual(
+            [trip["id"] for trip in response.data["results"]],
+            expected_ids[2:4]
+        )
+
+    def test_trip_list_cursor_pagination_count(self) -> None:
+        response = self.client.get(
+            TRIP_URL, {"pagination": "cursor", "count": "true"}
+        )
+        self.assertEqual(response.data["count"], Trip.objects.count())
+
+    def test_trip_list_invalid_cursor(self) -> None:
+        response = self.client.get(
+            TRIP_URL, {"pagination": "cursor", "cursor": "invalid"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        for position in (
+            5,
+            None,
+            [{"a": 1}, 2],
+            ["2024-01-01T12:00:00+00:00"],
+            ["2024-01-01T12:00:00+00:00", None],
+            ["2024-01-01T12:00:00+00:00", "not a number"],
+            [1.5, 2],
+        ):
+            cursor = base64.urlsafe_b64encode(
+                json.dumps({"r": 0, "p": position}).encode()
+            ).decode()
+            response = self.client.get(
+                TRIP_URL, {"pagination": "cursor", "cursor": cursor}
+            )
+            self.assertEqual(
+                response.status_code, status.HTTP_404_NOT_FOUND, position
+            )
+
+    @override_settings(
+        PAGINATION_COUNT_STRATEGY="capped",
+        PAGINATION_COUNT_CAP=2
+    )
+    def test_trip_list_capped_count(self) -> None:
+        response = self.client.get(TRIP_URL, {"per_page": 2})
+        self.assertEqual(response.data["count"], "2+")
+        self.assertEqual(response.data["pages"], "1+")
+        self.assertFalse(response.data["count_exact"])
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(TRIP_URL, {"per_page": 2, "page": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [trip["id"] for trip in response.data["results"]],
+            [self.trip_3.id, self.trip_4.id]
+        )
+        self.assertIsNone(response.data["next"])
+
+        response = self.client.get(TRIP_URL, {"per_page": 2, "page": 3})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(
+        PAGINATION_COUNT_STRATEGY="capped",
+        PAGINATION_COUNT_CAP=10
+    )
+    def test_trip_list_capped_count_below_cap(self) -> None:
+        response = self.client.get(TRIP_URL)
+        self.assertEqual(response.data["count"], 4)
+        self.assertNotIn("count_exact", response.data)
+
     def test_trip_filter_by_departure_date(self) -> None:
         departure_date = "2024-01-01"
         response = self.client.get(
@@ -147,6 +319,30 @@ class AuthenticatedTripApiTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["results"], serializer.data)
 
+    def test_trip_filter_by_departure_date_bounds(self) -> None:
+        Trip.objects.filter(pk=self.trip_2.pk).update(
+            departure_time="2024-01-02T00:00:00Z"
+        )
+        Trip.objects.filter(pk=self.trip_3.pk).update(
+            departure_time="2024-01-01T23:59:59Z"
+        )
+        response = self.client.get(TRIP_URL, {"departure_date": "2024-01-01"})
+
+        self.assertEqual(
+            [trip["id"] for trip in response.data["results"]],
+            [self.trip_1.id, self.trip_3.id]
+        )
+
+    def test_trip_filter_by_departure_date_uses_index(self) -> None:
+        queryset = TripFilter(
+            {"departure_date": "2024-01-01"}, queryset=Trip.objects.all()
+        ).qs
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+        self.assertIn("trip_departure_time_idx", queryset.explain())
+
     def test_trip_filter_by_source_station(self) -> None:
         source_station = "chernivtsi"
         response = self.client.get(
@@ -220,6 +416,107 @@ class AuthenticatedTripApiTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["results"], serializer.data)
 
+    def test_tickets_sold_follows_tickets(self) -> None:
+        order = Order.objects.create(user=self.user)
+        ticket = Ticket.objects.create(
+            trip=self.trip_1, cargo=1, seat=1, order=order
+        )
+        Ticket.objects.create(trip=self.trip_1, cargo=1, seat=2, order=order)
+        self.trip_1.refresh_from_db()
+        self.assertEqual(self.trip_1.tickets_sold, 2)
+
+        ticket.delete()
+        self.trip_1.refresh_from_db()
+        self.assertEqual(self.trip_1.tickets_sold, 1)
+
+        order.delete()
+        self.trip_1.refresh_from_db()
+        self.assertEqual(self.trip_1.tickets_sold, 0)
+
+    def test_rebuild_trip_inventory(self) -> None:
+        order = Order.objects.create(user=self.user)
+        Ticket.objects.create(trip=self.trip_1, cargo=1, seat=1, order=order)
+        Trip.objects.filter(pk=self.trip_1.pk).update(tickets_sold=10)
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "rebuild_trip_inventory", "--check", stdout=StringIO()
+            )
+        call_command("rebuild_trip_inventory", stdout=StringIO())
+
+        self.trip_1.refresh_from_db()
+        self.assertEqual(self.trip_1.tickets_sold, 1)
+        call_command("rebuild_trip_inventory", "--check", stdout=StringIO())
+
+    def test_trip_list_not_modified(self) -> None:
+        response = self.client.get(TRIP_URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", response)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                TRIP_URL, HTTP_IF_NONE_MATCH=response["ETag"]
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+    def test_trip_list_etag_changes_with_tickets(self) -> None:
+        etag = self.client.get(TRIP_URL)["ETag"]
+        Ticket.objects.create(
+            trip=self.trip_1,
+            cargo=1,
+            seat=1,
+            order=Order.objects.create(user=self.user)
+        )
+
+        response = self.client.get(TRIP_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_trip_list_modified_twice_in_same_second(self) -> None:
+        order = Order.objects.create(user=self.user)
+        now = datetime.datetime.now().timestamp() + 3600.5
+        with mock.patch("station_api.cache.time.time", return_value=now):
+            for seat in (1, 2):
+                last_modified = self.client.get(TRIP_URL)["Last-Modified"]
+                Ticket.objects.create(
+                    trip=self.trip_1, cargo=1, seat=seat, order=order
+                )
+
+                response = self.client.get(
+                    TRIP_URL, HTTP_IF_MODIFIED_SINCE=last_modified
+                )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertNotEqual(response["Last-Modified"], last_modified)
+
+    def test_retrieve_trip_not_modified(self) -> None:
+        response = self.client.get(detail_url(self.trip_1.id))
+        etag = response["ETag"]
+        self.assertNotEqual(
+            self.client.get(detail_url(self.trip_2.id))["ETag"], etag
+        )
+
+        response = self.client.get(
+            detail_url(self.trip_1.id),
+            HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.trip_1.crew.add(
+            Crew.objects.create(first_name="John", last_name="Doe")
+        )
+        response = self.client.get(
+            detail_url(self.trip_1.id), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_trip_conflicts_forbidden(self) -> None:
+        response = self.client.get(
+            TRIP_CONFLICTS_URL,
+            {"date_from": "2024-01-01", "date_to": "2024-01-02"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
     def test_create_trip_forbidden(self) -> None:
         response = self.client.post(TRIP_URL, self.payload)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -241,6 +538,73 @@ class AuthenticatedTripApiTests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data, serializer.data)
 
+    def test_retrieve_trip_seat_map(self) -> None:
+        order = Order.objects.create(user=self.user)
+        places = [(1, 1), (1, 2), (3, 50), (10, 50)]
+        for cargo, seat in places:
+            Ticket.objects.create(
+                trip=self.trip_1, cargo=cargo, seat=seat, order=order
+            )
+        seat_map = build_seat_map(places, cargo_num=10, places_in_cargo=50)
+
+        response = self.client.get(
+            detail_url(self.trip_1.id), {"seat_map": "bitmap"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("taken_places", response.data)
+        self.assertEqual(
+            response.data["seat_map"]["data"],
+            encode_bitmap(seat_map, self.train_1.capacity)
+        )
+
+        response = self.client.get(
+            detail_url(self.trip_1.id), {"seat_map": "rle"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["seat_map"]["runs"], [0, 2, 147, 1, 349, 1]
+        )
+        self.assertEqual(
+            response.data["seat_map"]["runs"],
+            encode_runs(seat_map, self.train_1.capacity)
+        )
+
+    def test_seat_map_of_trip_without_tickets(self) -> None:
+        response = self.client.get(
+            detail_url(self.trip_2.id), {"seat_map": "bitmap"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            base64.b64decode(response.data["seat_map"]["data"]),
+            bytes(13)
+        )
+
+        response = self.client.get(
+            detail_url(self.trip_2.id), {"seat_map": "rle"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["seat_map"]["runs"], [100])
+
+        call_command("rebuild_trip_inventory", "--check", stdout=StringIO())
+
+    def test_seat_map_follows_tickets(self) -> None:
+        order = Order.objects.create(user=self.user)
+        ticket = Ticket.objects.create(
+            trip=self.trip_2, cargo=2, seat=3, order=order
+        )
+        self.trip_2.refresh_from_db()
+        self.assertEqual(
+            bytes(self.trip_2.seat_map),
+            build_seat_map([(2, 3)], cargo_num=10, places_in_cargo=10)
+        )
+
+        ticket.delete()
+        self.trip_2.refresh_from_db()
+        self.assertEqual(
+            bytes(self.trip_2.seat_map),
+            build_seat_map([], cargo_num=10, places_in_cargo=10)
+        )
+
     def test_update_trip_forbidden(self) -> None:
         response = self.client.put(detail_url(self.trip_1.id), self.payload)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -331,6 +695,202 @@ class AdminTripApiTests(TestCase):
             list(trip.crew.values_list("id", flat=True))
         )
 
+    def test_create_trip_missing_crew(self) -> None:
+        self.payload["crew_ids"] = [self.crew_1.id, 998, 999]
+        response = self.client.post(TRIP_URL, self.payload)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["crew_ids"], ["Crew 998, 999 does not exist."]
+        )
+        self.assertEqual(Trip.objects.count(), 1)
+
+    def test_create_trip_crew_resolved_with_one_query(self) -> None:
+        crew_ids = [
+            Crew.objects.create(first_name=f"Name{i}", last_name="Doe").id
+            for i in range(10)
+        ]
+        queries = []
+        for day, ids in ((1, crew_ids[:1]), (2, crew_ids)):
+            payload = {
+                **self.payload,
+                "departure_time": f"2024-03-0{day} 12:00",
+                "arrival_time": f"2024-03-0{day} 14:00",
+                "crew_ids": ids,
+            }
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(TRIP_URL, payload)
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            queries.append(len(context))
+        self.assertEqual(queries[0], queries[1])
+
+    def test_create_trip_overlapping_train_and_crew(self) -> None:
+        self.trip.crew.set([self.crew_1])
+        self.payload["departure_time"] = "2024-01-01 19:00"
+        self.payload["arrival_time"] = "2024-01-01 23:00"
+        response = self.client.post(TRIP_URL, self.payload)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["train_id"],
+            [
+                f"Train is already assigned to overlapping trips: "
+                f"{self.trip.id}."
+            ]
+        )
+        self.assertEqual(
+            response.data["crew_ids"],
+            [
+                f"Crew {self.crew_1.id} is already assigned to "
+                f"overlapping trips: {self.trip.id}."
+            ]
+        )
+
+    def test_create_trip_back_to_back(self) -> None:
+        self.trip.crew.set([self.crew_1])
+        self.payload["train_id"] = self.train.id
+        self.payload["departure_time"] = "2024-01-01 20:00"
+        self.payload["arrival_time"] = "2024-01-01 23:00"
+        response = self.client.post(TRIP_URL, self.payload)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_create_trip_conflicting_after_validation(self) -> None:
+        self.payload["departure_time"] = "2024-01-02 19:00"
+        self.payload["arrival_time"] = "2024-01-02 23:00"
+        serializer = TripCreateUpdateSerializer(data=self.payload)
+        self.assertTrue(serializer.is_valid())
+        schedule_serializer = TripScheduleSerializer(
+            data={**self.payload, "repeat_count": 1}
+        )
+        self.assertTrue(schedule_serializer.is_valid())
+
+        Trip.objects.create(
+            route=self.route_2,
+            train=self.train,
+            departure_time="2024-01-02T20:00:00Z",
+            arrival_time="2024-01-02T21:00:00Z"
+        )
+
+        for pending in (serializer, schedule_serializer):
+            with self.assertRaises(ValidationError) as context:
+                pending.save()
+            self.assertIn("train_id", context.exception.detail)
+        self.assertEqual(
+            Trip.objects.filter(departure_time__date="2024-01-02").count(), 1
+        )
+
+    def test_update_trip_does_not_conflict_with_itself(self) -> None:
+        self.trip.crew.set([self.crew_1])
+        response = self.client.patch(
+            detail_url(self.trip.id), {"arrival_time": "2024-01-01 21:00"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_schedule_trips_overlapping_existing(self) -> None:
+        self.trip.crew.set([self.crew_2])
+        payload = {
+            **self.payload,
+            "departure_time": "2023-12-30 13:00",
+            "arrival_time": "2023-12-30 15:00",
+            "crew_ids": [self.crew_1.id, self.crew_2.id],
+            "repeat_count": 5,
+        }
+        response = self.client.post(TRIP_SCHEDULE_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("train_id", response.data)
+        self.assertEqual(
+            response.data["crew_ids"],
+            [
+                f"Crew {self.crew_2.id} is already assigned to "
+                f"overlapping trips: {self.trip.id}."
+            ]
+        )
+
+    def test_schedule_trips_overlapping_each_other(self) -> None:
+        payload = {
+            **self.payload,
+            "arrival_time": "2024-03-02 14:00",
+            "repeat_count": 2,
+        }
+        response = self.client.post(TRIP_SCHEDULE_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_trip_conflicts(self) -> None:
+        Trip.objects.create(
+            route=self.route_2,
+            train=self.train,
+            departure_time="2024-01-01T19:00:00Z",
+            arrival_time="2024-01-01T23:00:00Z"
+        )
+        crew_trip = Trip.objects.create(
+            route=self.route_2,
+            train=Train.objects.create(
+                name="Eagle-02",
+                cargo_num=10,
+                places_in_cargo=50,
+                train_type=self.train.train_type
+            ),
+            departure_time="2024-01-01T10:00:00Z",
+            arrival_time="2024-01-01T13:00:00Z"
+        )
+        Trip.objects.create(
+            route=self.route_2,
+            train=self.train,
+            departure_time="2024-01-03T19:00:00Z",
+            arrival_time="2024-01-03T23:00:00Z"
+        )
+        self.trip.crew.set([self.crew_1])
+        crew_trip.crew.set([self.crew_1, self.crew_2])
+        train_trip_id = Trip.objects.get(
+            departure_time="2024-01-01T19:00:00Z"
+        ).id
+
+        response = self.client.get(
+            TRIP_CONFLICTS_URL,
+            {"date_from": "2024-01-01", "date_to": "2024-01-02"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            [
+                {
+                    "resource": "crew",
+                    "id": self.crew_1.id,
+                    "name": "John Doe",
+                    "trips": [self.trip.id, crew_trip.id],
+                },
+                {
+                    "resource": "train",
+                    "id": self.train.id,
+                    "name": "Eagle-01",
+                    "trips": [self.trip.id, train_trip_id],
+                },
+            ]
+        )
+
+    def test_trip_conflicts_invalid_window(self) -> None:
+        response = self.client.get(
+            TRIP_CONFLICTS_URL,
+            {"date_from": "2024-01-02", "date_to": "2024-01-01"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_partial_update_trip_keeps_crew(self) -> None:
+        self.trip.crew.set([self.crew_1, self.crew_2])
+        response = self.client.patch(
+            detail_url(self.trip.id), {"arrival_time": "2024-01-01 21:00"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            sorted(self.trip.crew.values_list("id", flat=True)),
+            sorted([self.crew_1.id, self.crew_2.id])
+        )
+
     def test_create_trip_invalid_times(self) -> None:
         self.payload["arrival_time"] = "2024-01-01T10:00:00Z"
         self.payload["departure_time"] = "2024-01-01T11:00:00Z"
@@ -338,6 +898,101 @@ class AdminTripApiTests(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_schedule_trips(self) -> None:
+        payload = {
+            **self.payload,
+            "repeat_every_days": 2,
+            "repeat_count": 3,
+        }
+        response = self.client.post(TRIP_SCHEDULE_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        trips = Trip.objects.filter(
+            id__in=[trip["id"] for trip in response.data]
+        ).order_by("departure_time")
+        self.assertEqual(
+            [trip.departure_time.strftime("%Y-%m-%d %H:%M") for trip in trips],
+            ["2024-03-01 12:00", "2024-03-03 12:00", "2024-03-05 12:00"]
+        )
+        self.assertEqual(
+            [trip.arrival_time.strftime("%Y-%m-%d %H:%M") for trip in trips],
+            ["2024-03-01 14:00", "2024-03-03 14:00", "2024-03-05 14:00"]
+        )
+        for trip in trips:
+            self.assertEqual(trip.route_id, self.route_2.id)
+            self.assertEqual(
+                sorted(trip.crew.values_list("id", flat=True)),
+                sorted(self.payload["crew_ids"])
+            )
+
+    def test_schedule_trips_queries_do_not_grow_with_trips(self) -> None:
+        queries = []
+        for month, repeat_count in ((3, 2), (4, 20)):
+            payload = {
+                **self.payload,
+                "departure_time": f"2024-0{month}-01 12:00",
+                "arrival_time": f"2024-0{month}-01 14:00",
+                "repeat_count": repeat_count,
+            }
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(
+                    TRIP_SCHEDULE_URL, payload, format="json"
+                )
+            self.assertEqual(
+                response.status_code, status.HTTP_201_CREATED
+            )
+            queries.append(len(context))
+        self.assertEqual(queries[0], queries[1])
+
+    def test_schedule_trips_updates_journey_planner(self) -> None:
+        journey_planner.reset()
+        journey_planner.load()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                TRIP_SCHEDULE_URL,
+                {**self.payload, "repeat_count": 2},
+                format="json"
+            )
+
+        legs = journey_planner.plan(
+            self.station_2.id,
+            self.station_1.id,
+            datetime.datetime(2024, 3, 2, tzinfo=datetime.timezone.utc),
+            datetime.timedelta(0)
+        )
+        self.assertEqual(
+            [leg.trip_id for leg in legs], [response.data[1]["id"]]
+        )
+        journey_planner.reset()
+
+    def test_schedule_trips_invalid_references(self) -> None:
+        payload = {
+            **self.payload,
+            "route_id": 999,
+            "crew_ids": [self.crew_1.id, 998, 999],
+            "repeat_count": 5,
+        }
+        response = self.client.post(TRIP_SCHEDULE_URL, payload, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["route_id"], ["Route 999 does not exist."]
+        )
+        self.assertEqual(
+            response.data["crew_ids"], ["Crew 998, 999 does not exist."]
+        )
+        self.assertEqual(Trip.objects.count(), 1)
+
+    def test_schedule_trips_forbidden(self) -> None:
+        self.user.is_staff = False
+        self.user.save()
+        response = self.client.post(
+            TRIP_SCHEDULE_URL,
+            {**self.payload, "repeat_count": 2},
+            format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
     def test_update_trip(self) -> None:
         trip = self.trip
         response = self.client.put(detail_url(trip.id), self.payload)
@@ -0,0 +1,132 @@
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.request import Request
+from rest_framework.throttling import SimpleRateThrottle
+
+if TYPE_CHECKING:
+    # rest_framework.views loads throttle classes from settings
+    from rest_framework.views import APIView
+
+
+class CounterRateThrottle(SimpleRateThrottle):
+    """
+    Sliding window throttle over two fixed window counters.
+    Requests of the current window are counted with a cache
+    increment, requests of the previous one are weighted by the part
+    of it still inside the sliding window. Every request costs a
+    constant number of cache operations. THROTTLE_CACHE_ALIAS must
+    point to a backend with atomic add() and incr(), such as Redis,
+    for counters to be exact and shared by all workers.
+    """
+
+    cache_format = "throttle:%(scope)s:%(ident)s"
+
+    @property
+    def cache(self):
+        return caches[settings.THROTTLE_CACHE_ALIAS]
+
+    def allow_request(self, request: Request, view: "APIView") -> bool:
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window, self.elapsed = divmod(self.now / self.duration, 1)
+        current_key = f"{self.key}:{int(window)}"
+        self.previous = self.cache.get(f"{self.key}:{int(window) - 1}", 0)
+        self.cache.add(current_key, 0, timeout=self.duration * 2)
+        try:
+            self.current = self.cache.incr(current_key)
+        except ValueError:
+            # Counter evicted between add() and incr()
+            self.cache.set(current_key, 1, timeout=self.duration * 2)
+            self.current = 1
+
+        if self.previous * (1 - self.elapsed) + self.current > (
+            self.num_requests
+        ):
+            # Rejected requests are not counted
+            self.current = self.cache.decr(current_key)
+            return False
+        return True
+
+    def wait(self) -> float:
+        """Seconds until the sliding window has room for one request"""
+        remaining = (1 - self.elapsed) * self.duration
+        if self.current + 1 > self.num_requests:
+            # Wait for the next window, where current requests become
+            # previous ones
+            return remaining + self.duration * max(
+                0.0, 1 - (self.num_requests - 1) / self.current
+            )
+        if not self.previous:
+            return 0.0
+        return max(
+            0.0,
+            remaining
+            - self.duration
+            * (self.num_requests - 1 - self.current) / self.previous,
+        )
+
+
+class AnonCounterThrottle(CounterRateThrottle):
+    """Limit anonymous requests to views without own throttle scope"""
+
+    scope = "anon"
+
+    def get_cache_key(self, request: Request, view: "APIView") -> str | None:
+        if request.user and request.user.is_authenticated:
+            return None
+        if getattr(view, "throttle_scope", None):
+            return None
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
+
+
+class UserCounterThrottle(CounterRateThrottle):
+    """Limit user requests to views without own throttle scope"""
+
+    scope = "user"
+
+    def get_cache_key(self, request: Request, view: "APIView") -> str | None:
+        if not (request.user and request.user.is_authenticated):
+            return None
+        if getattr(view, "throttle_scope", None):
+            return None
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": request.user.pk,
+        }
+
+
+class ScopedCounterThrottle(CounterRateThrottle):
+    """
+    Limit requests to views by their `throttle_scope` rate, per user
+    or per IP address of anonymous clients
+    """
+
+    def __init__(self) -> None:
+        # Rate depends on the view, it is read in allow_request()
+        pass
+
+    def allow_request(self, request: Request, view: "APIView") -> bool:
+        self.scope = getattr(view, "throttle_scope", None)
+        if not self.scope:
+            return True
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().allow_request(request, view)
+
+    def get_cache_key(self, request: Request, view: "APIView") -> str:
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {"scope": self.scope, "ident": ident}
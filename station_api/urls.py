@@ -8,7 +8,9 @@ from station_api.views import (
     TrainTypeViewSet,
     TrainViewSet,
     TripViewSet,
-    OrderViewSet
+    JourneyViewSet,
+    OrderViewSet,
+    SeatHoldViewSet,
 )
 
 
@@ -19,7 +21,9 @@ router.register("crews", CrewViewSet)
 router.register("train-types", TrainTypeViewSet)
 router.register("trains", TrainViewSet)
 router.register("trips", TripViewSet)
+router.register("journeys", JourneyViewSet, basename="journey")
 router.register("orders", OrderViewSet)
+router.register("seat-holds", SeatHoldViewSet)
 
 urlpatterns = [
     path("", include(router.urls))
@@ -1,5 +1,11 @@
+from datetime import datetime, time, timedelta
+from typing import Iterator
+
+from django.conf import settings
 from django.db.models import QuerySet, F, Count
-from rest_framework import mixins, viewsets, status
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import mixins, viewsets, status, serializers
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.request import Request
@@ -13,6 +19,14 @@ from station_api.filters import (
     TrainFilter,
     TripFilter,
 )
+from station_api.autocomplete import station_autocomplete
+from station_api.cache import CachedListMixin, ConditionalGetMixin
+from station_api.conflicts import find_conflicts
+from station_api.distances import station_distances
+from station_api.exports import ExportMixin
+from station_api.journeys import journey_planner
+from station_api.locations import station_locator
+from station_api.order_history import load_order_history
 from station_api.models import (
     Station,
     Route,
@@ -20,19 +34,28 @@ from station_api.models import (
     TrainType,
     Train,
     Trip,
-    Order
+    Order,
+    Ticket,
+    SeatHold,
+    UserTrip,
 )
+from station_api.pagination import CursorPaginationMixin
 from station_api.schemas.crews import crew_set_schema
+from station_api.schemas.journeys import journey_list_schema
 from station_api.schemas.orders import order_list_create_schema
 from station_api.schemas.train_types import (
     train_type_list_create_schema
 )
 from station_api.schemas.routes import route_set_schema
+from station_api.schemas.seat_holds import seat_hold_set_schema
 from station_api.schemas.stations import station_list_create_schema
 from station_api.schemas.trains import train_set_schema
 from station_api.schemas.trips import trip_set_schema
 from station_api.serializers import (
     StationSerializer,
+    StationDistanceSerializer,
+    StationAutocompleteSerializer,
+    StationNearestSerializer,
     RouteSerializer,
     RouteReadSerializer,
     RouteCreateUpdateSerializer,
@@ -48,14 +71,38 @@ from station_api.serializers import (
     TripSerializer,
     TripCreateUpdateSerializer,
     TripListSerializer,
+    TripListRowSerializer,
     TripRetrieveSerializer,
+    TripScheduleSerializer,
+    TripConflictSearchSerializer,
+    TripConflictSerializer,
+    TripSeatMapSerializer,
+    JourneySearchSerializer,
+    JourneySerializer,
+    TripSeatRunsSerializer,
     OrderSerializer,
     OrderListSerializer,
+    OrderSummarySerializer,
+    SeatHoldSerializer,
+    SeatHoldCreateSerializer,
+    SeatHoldConfirmSerializer,
 )
 
 
+def annotate_tickets_available(queryset: QuerySet) -> QuerySet:
+    return queryset.annotate(
+        tickets_available=(
+            F("train__cargo_num")
+            * F("train__places_in_cargo")
+            - F("tickets_sold")
+        )
+    )
+
+
 @station_list_create_schema
 class StationViewSet(
+    ConditionalGetMixin,
+    CachedListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     viewsets.GenericViewSet
@@ -63,13 +110,77 @@ class StationViewSet(
     queryset = Station.objects.all()
     serializer_class = StationSerializer
     filterset_class = StationFilter
+    cache_models = (Station,)
+    throttle_scope = "stations"
+
+    def get_serializer_class(self) -> type[serializers.Serializer]:
+        if self.action == "distance":
+            return StationDistanceSerializer
+        if self.action == "autocomplete":
+            return StationAutocompleteSerializer
+        if self.action == "nearest":
+            return StationNearestSerializer
+        return self.serializer_class
+
+    @action(methods=["GET"], detail=False)
+    def distance(self, request: Request) -> Response:
+        """Endpoint for the shortest network distance between stations"""
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        source = serializer.validated_data["source"]
+        destination = serializer.validated_data["destination"]
+
+        path = station_distances.path(source.id, destination.id)
+        names = Station.objects.in_bulk(path)
+        serializer = self.get_serializer(
+            {
+                "source": source,
+                "destination": destination,
+                "distance": station_distances.distance(
+                    source.id, destination.id
+                ),
+                "stations": [names[station_id].name for station_id in path],
+            }
+        )
+        return Response(serializer.data)
+
+    @action(methods=["GET"], detail=False)
+    def autocomplete(self, request: Request) -> Response:
+        """Endpoint for station name completion from in-memory index"""
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return Response(
+            station_autocomplete.complete(
+                serializer.validated_data["q"],
+                serializer.validated_data["limit"],
+            )
+        )
+
+    @action(methods=["GET"], detail=False)
+    def nearest(self, request: Request) -> Response:
+        """Endpoint for stations nearest to coordinates"""
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return Response(
+            station_locator.nearest(
+                serializer.validated_data["latitude"],
+                serializer.validated_data["longitude"],
+                serializer.validated_data["limit"],
+                serializer.validated_data.get("radius"),
+            )
+        )
 
 
 @route_set_schema
-class RouteViewSet(viewsets.ModelViewSet):
+class RouteViewSet(
+    ConditionalGetMixin,
+    CachedListMixin,
+    viewsets.ModelViewSet
+):
     queryset = Route.objects.all()
     serializer_class = RouteSerializer
     filterset_class = RouteFilter
+    cache_models = (Route, Station)
 
     def get_serializer_class(self) -> type[RouteSerializer]:
         if self.action in ["list", "retrieve"]:
@@ -86,10 +197,11 @@ class RouteViewSet(viewsets.ModelViewSet):
 
 
 @crew_set_schema
-class CrewViewSet(viewsets.ModelViewSet):
+class CrewViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Crew.objects.all()
     serializer_class = CrewSerializer
     filterset_class = CrewFilter
+    cache_models = (Crew,)
 
     def get_serializer_class(self) -> type[CrewSerializer]:
         if self.action in ["list", "retrieve"]:
@@ -120,6 +232,8 @@ class CrewViewSet(viewsets.ModelViewSet):
 
 @train_type_list_create_schema
 class TrainTypeViewSet(
+    ConditionalGetMixin,
+    CachedListMixin,
     mixins.CreateModelMixin,
     mixins.ListModelMixin,
     viewsets.GenericViewSet
@@ -127,13 +241,19 @@ class TrainTypeViewSet(
     queryset = TrainType.objects.all()
     serializer_class = TrainTypeSerializer
     filterset_class = TrainTypeFilter
+    cache_models = (TrainType,)
 
 
 @train_set_schema
-class TrainViewSet(viewsets.ModelViewSet):
+class TrainViewSet(
+    ConditionalGetMixin,
+    CachedListMixin,
+    viewsets.ModelViewSet
+):
     queryset = Train.objects.all()
     serializer_class = TrainSerializer
     filterset_class = TrainFilter
+    cache_models = (Train, TrainType)
 
     def get_serializer_class(self) -> type[TrainSerializer]:
         if self.action in ["list", "retrieve"]:
@@ -169,7 +289,12 @@ class TrainViewSet(viewsets.ModelViewSet):
 
 
 @trip_set_schema
-class TripViewSet(viewsets.ModelViewSet):
+class TripViewSet(
+    ConditionalGetMixin,
+    CursorPaginationMixin,
+    ExportMixin,
+    viewsets.ModelViewSet
+):
     queryset = (
         Trip.objects
         .select_related(
@@ -180,54 +305,287 @@ class TripViewSet(viewsets.ModelViewSet):
     )
     serializer_class = TripSerializer
     filterset_class = TripFilter
+    cursor_ordering = ("departure_time", "id")
+    cache_models = (Trip, Route, Station, Train, TrainType, Crew, Ticket)
+    export_fields = TripListRowSerializer.fields
 
     def get_serializer_class(self) -> type[TripSerializer]:
         if self.action == "list":
             return TripListSerializer
         if self.action == "retrieve":
+            seat_map = self.request.query_params.get("seat_map")
+            if seat_map == "bitmap":
+                return TripSeatMapSerializer
+            if seat_map == "rle":
+                return TripSeatRunsSerializer
             return TripRetrieveSerializer
         if self.action in ["create", "update", "partial_update"]:
             return TripCreateUpdateSerializer
+        if self.action == "schedule":
+            return TripScheduleSerializer
+        if self.action == "conflicts":
+            return TripConflictSerializer
         return self.serializer_class
 
     def get_queryset(self) -> QuerySet:
         queryset = super().get_queryset()
-        if self.action == "list":
-            queryset = queryset.annotate(
-                tickets_available=(
-                    F("train__cargo_num")
-                    * F("train__places_in_cargo")
-                    - Count("tickets")
-                )
-            )
+        if self.action in ["list", "export"]:
+            queryset = annotate_tickets_available(queryset)
         if self.action == "retrieve":
             queryset = queryset.prefetch_related("crew")
+        else:
+            queryset = queryset.defer("seat_map")
         return queryset.order_by("departure_time")
 
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """Render trips from value rows instead of model instances"""
+        queryset = self.filter_queryset(self.get_queryset()).values_list(
+            *TripListRowSerializer.columns, named=True
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(
+                TripListRowSerializer.serialize(page)
+            )
+        return Response(TripListRowSerializer.serialize(queryset))
+
+    @action(methods=["POST"], detail=False)
+    def schedule(self, request: Request) -> Response:
+        """Endpoint for creating recurring trips in bulk"""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        trips = serializer.save()
+        return Response(
+            TripCreateUpdateSerializer(trips, many=True).data,
+            status=status.HTTP_201_CREATED
+        )
+
+    @action(methods=["GET"], detail=False, permission_classes=[IsAdminUser])
+    def conflicts(self, request: Request) -> Response:
+        """Endpoint for listing trips sharing a train or crew at once"""
+        search = TripConflictSearchSerializer(data=request.query_params)
+        search.is_valid(raise_exception=True)
+        params = search.validated_data
+
+        start = timezone.make_aware(
+            datetime.combine(params["date_from"], time.min)
+        )
+        end = timezone.make_aware(
+            datetime.combine(params["date_to"] + timedelta(days=1), time.min)
+        )
+        serializer = self.get_serializer(find_conflicts(start, end), many=True)
+        return Response(serializer.data)
+
+    def get_export_rows(self, queryset: QuerySet) -> Iterator[dict]:
+        return map(
+            TripListRowSerializer.to_representation,
+            queryset.values_list(*TripListRowSerializer.columns).iterator(
+                chunk_size=settings.EXPORT_CHUNK_SIZE
+            )
+        )
+
+
+@journey_list_schema
+class JourneyViewSet(viewsets.ViewSet):
+    def list(self, request: Request) -> Response:
+        search = JourneySearchSerializer(data=request.query_params)
+        search.is_valid(raise_exception=True)
+        params = search.validated_data
+
+        journeys = journey_planner.plan_many(
+            source_id=params["source"].id,
+            destination_id=params["destination"].id,
+            departure_after=params.get("departure_after", timezone.now()),
+            min_transfer_time=(
+                timedelta(minutes=params["transfer_minutes"])
+                if "transfer_minutes" in params
+                else settings.JOURNEY_MIN_TRANSFER_TIME
+            ),
+            limit=params["limit"],
+        )
+        trips = annotate_tickets_available(
+            TripViewSet.queryset.defer("seat_map")
+        ).in_bulk(
+            {connection.trip_id for legs in journeys for connection in legs}
+        )
+        serializer = JourneySerializer(
+            [
+                {"legs": [trips[connection.trip_id] for connection in legs]}
+                for legs in journeys
+                if all(connection.trip_id in trips for connection in legs)
+            ],
+            many=True
+        )
+        return Response(serializer.data)
+
 
 @order_list_create_schema
 class OrderViewSet(
+    ConditionalGetMixin,
+    CursorPaginationMixin,
+    ExportMixin,
     mixins.ListModelMixin,
     mixins.CreateModelMixin,
     viewsets.GenericViewSet,
 ):
-    queryset = Order.objects.prefetch_related(
-        "tickets__trip__route__source",
-        "tickets__trip__route__destination",
-        "tickets__trip__train__train_type",
-    )
+    queryset = Order.objects.all()
     serializer_class = OrderSerializer
     permission_classes = [IsAuthenticated]
+    cursor_ordering = ("-created_at", "-id")
+    cache_models = (Order, Ticket, Trip, Route, Station, Train, TrainType)
+    throttle_scope = "orders"
+    export_fields = ("id", "created_at", "tickets")
 
     def get_queryset(self) -> QuerySet:
         queryset = super().get_queryset()
-        queryset = queryset.filter(user=self.request.user)
+        queryset = queryset.filter(user_id=self.request.user.pk)
         return queryset
 
     def get_serializer_class(self) -> type[OrderSerializer]:
         if self.action == "list":
             return OrderListSerializer
+        if self.action == "summary":
+            return OrderSummarySerializer
         return self.serializer_class
 
     def perform_create(self, serializer: OrderSerializer):
         serializer.save(user=self.request.user)
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """Render orders with tickets and trips loaded in one query"""
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(
+                load_order_history(page), many=True
+            )
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(
+            load_order_history(queryset), many=True
+        )
+        return Response(serializer.data)
+
+    @action(methods=["GET"], detail=False)
+    def summary(self, request: Request) -> Response:
+        """Endpoint for trip and ticket totals of user orders"""
+        serializer = self.get_serializer(
+            UserTrip.summary(request.user.pk, timezone.now())
+        )
+        return Response(serializer.data)
+
+    def get_export_rows(self, queryset: QuerySet) -> Iterator[dict]:
+        orders = (
+            queryset
+            .annotate(tickets_count=Count("tickets"))
+            .order_by("-created_at", "-id")
+            .values_list("id", "created_at", "tickets_count")
+        )
+        for order_id, created_at, tickets_count in orders.iterator(
+            chunk_size=settings.EXPORT_CHUNK_SIZE
+        ):
+            yield {
+                "id": order_id,
+                "created_at": created_at.strftime("%d %b %Y %H:%M"),
+                "tickets": tickets_count,
+            }
+
+    @action(methods=["GET"], detail=False, url_path="tickets/export")
+    def export_tickets(self, request: Request) -> StreamingHttpResponse:
+        """Endpoint for streaming tickets of user orders as NDJSON or CSV"""
+        tickets = (
+            Ticket.objects
+            .filter(order__user_id=request.user.pk)
+            .order_by("-order__created_at", "-order_id", "id")
+            .values_list(
+                "id",
+                "order_id",
+                "trip_id",
+                "trip__route__source__name",
+                "trip__route__destination__name",
+                "trip__departure_time",
+                "cargo",
+                "seat",
+            )
+        )
+        rows = (
+            {
+                "id": ticket_id,
+                "order": order_id,
+                "trip": trip_id,
+                "route": f"{source} - {destination}",
+                "departure_time": departure_time.strftime("%d %b %Y %H:%M"),
+                "cargo": cargo,
+                "seat": seat,
+            }
+            for (
+                ticket_id,
+                order_id,
+                trip_id,
+                source,
+                destination,
+                departure_time,
+                cargo,
+                seat,
+            ) in tickets.iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+        )
+        return self.stream_export(
+            request,
+            rows,
+            (
+                "id",
+                "order",
+                "trip",
+                "route",
+                "departure_time",
+                "cargo",
+                "seat",
+            ),
+            "tickets",
+        )
+
+
+@seat_hold_set_schema
+class SeatHoldViewSet(
+    mixins.ListModelMixin,
+    mixins.CreateModelMixin,
+    mixins.DestroyModelMixin,
+    viewsets.GenericViewSet,
+):
+    queryset = SeatHold.objects.all()
+    serializer_class = SeatHoldSerializer
+    permission_classes = [IsAuthenticated]
+    throttle_scope = "orders"
+
+    def get_queryset(self) -> QuerySet:
+        queryset = super().get_queryset()
+        return queryset.filter(
+            user_id=self.request.user.pk,
+            expires_at__gt=timezone.now()
+        )
+
+    def get_serializer_class(self) -> type[serializers.Serializer]:
+        if self.action == "create":
+            return SeatHoldCreateSerializer
+        if self.action == "confirm":
+            return SeatHoldConfirmSerializer
+        return self.serializer_class
+
+    def create(self, request: Request, *args, **kwargs) -> Response:
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        holds = serializer.save(user=request.user)
+        return Response(
+            SeatHoldSerializer(holds, many=True).data,
+            status=status.HTTP_201_CREATED
+        )
+
+    @action(methods=["POST"], detail=False)
+    def confirm(self, request: Request) -> Response:
+        """Endpoint for turning held places into an order"""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        order = serializer.save(user=request.user)
+        return Response(
+            OrderSerializer(order).data,
+            status=status.HTTP_201_CREATED
+        )
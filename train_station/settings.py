@@ -41,6 +41,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
 
     # 3rd apps
     "debug_toolbar",
@@ -100,6 +101,52 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+# Redis server shared by all workers, e.g. "redis://localhost:6379/0".
+# Without it caches live in the memory of each process, which only
+# suits a single worker process and tests: model change versions,
+# cached users and throttle counters would differ between workers
+REDIS_URL = os.environ.get("REDIS_URL")
+
+# Throttle counters need atomic add() and incr(). RedisCache and
+# LocMemCache have them, file and database caches do not
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        },
+        "throttle": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "throttle",
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+        "throttle": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "throttle",
+        },
+    }
+
+# Cache used for catalog (stations, routes, train types, trains)
+# responses and for model change versions behind ETag and
+# Last-Modified headers. It must be shared by all workers, or changes
+# made through one worker stay unseen by the others
+CATALOG_CACHE_ALIAS = "default"
+
+CATALOG_CACHE_TIMEOUT = 60 * 60
+
+# Cache keeping request counters of throttles
+THROTTLE_CACHE_ALIAS = "throttle"
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -161,32 +208,114 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": (
         "station_api.pagination.TrainStationPaginator"
     ),
+    # Encodes with orjson when installed, the same as JSONRenderer otherwise
+    "DEFAULT_RENDERER_CLASSES": [
+        "station_api.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_PERMISSION_CLASSES": [
         "station_api.permissions.IsAdminOrIfAuthenticatedReadOnly"
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication"
+        "user_api.authentication.ClaimsJWTAuthentication"
     ],
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle"
+        "station_api.throttling.AnonCounterThrottle",
+        "station_api.throttling.UserCounterThrottle",
+        "station_api.throttling.ScopedCounterThrottle",
     ],
+    # "anon" and "user" apply to views without `throttle_scope`,
+    # other rates are per view `throttle_scope`
     "DEFAULT_THROTTLE_RATES": {
         "anon": "10/minute",
-        "user": "30/minute"
+        "user": "30/minute",
+        "stations": "120/minute",
+        "orders": "10/minute",
     },
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
 
+# Pagination settings
+
+# "exact", "capped" (count up to PAGINATION_COUNT_CAP rows) or "estimated"
+# (PostgreSQL planner statistics for unfiltered listings, capped otherwise)
+PAGINATION_COUNT_STRATEGY = "exact"
+
+PAGINATION_COUNT_CAP = 1000
+
+
+# Station autocomplete settings
+
+# Default and maximum number of stations returned by autocomplete
+STATION_AUTOCOMPLETE_LIMIT = 10
+
+STATION_AUTOCOMPLETE_MAX_LIMIT = 50
+
+
+# Nearest stations settings
+
+# Default and maximum number of stations returned by nearest lookup
+STATION_NEAREST_LIMIT = 10
+
+STATION_NEAREST_MAX_LIMIT = 50
+
+
+# Image renditions settings
+
+# Longest side in pixels of renditions derived from train and crew images
+IMAGE_RENDITIONS = {
+    "thumbnail": 150,
+    "medium": 600,
+}
+
+# "WEBP" or "JPEG"
+IMAGE_RENDITION_FORMAT = "WEBP"
+
+IMAGE_RENDITION_QUALITY = 80
+
+
+# Export settings
+
+# Rows fetched from the database cursor at once by streaming exports
+EXPORT_CHUNK_SIZE = 2000
+
+
 # JSON Web Token settings
 
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(hours=12),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "ROTATE_REFRESH_TOKENS": False,
+    "TOKEN_OBTAIN_SERIALIZER": (
+        "user_api.serializers.UserTokenObtainPairSerializer"
+    ),
+    "TOKEN_REFRESH_SERIALIZER": (
+        "user_api.serializers.UserTokenRefreshSerializer"
+    ),
 }
 
+JWT_USER_CACHE_ALIAS = "default"
+
+# Seconds users loaded by ClaimsJWTAuthentication are cached, 0 disables
+JWT_USER_CACHE_TIMEOUT = 60
+
+
+# Trip schedule settings
+
+# Maximum number of trips created by one schedule request
+TRIP_SCHEDULE_MAX_TRIPS = 366
+
+
+# Seat holds settings
+
+SEAT_HOLD_LIFETIME = timedelta(minutes=10)
+
+
+# Journey planner settings
+
+JOURNEY_MIN_TRANSFER_TIME = timedelta(minutes=15)
+
 
 # Spectacular settings
 
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UserApiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "user_api"
+
+    def ready(self) -> None:
+        import user_api.schemas.authentication
+        import user_api.signals
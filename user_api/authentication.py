@@ -0,0 +1,66 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+
+USER_CLAIMS = ("email", "is_staff")
+
+
+def add_user_claims(token: Token, user: get_user_model()) -> Token:
+    for claim in USER_CLAIMS:
+        token[claim] = getattr(user, claim)
+    return token
+
+
+def user_cache_key(user_id: int) -> str:
+    return f"jwt-user:{user_id}"
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    caches[settings.JWT_USER_CACHE_ALIAS].delete(user_cache_key(user_id))
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication building the user of read-only requests from
+    token claims without a database query. Writes and tokens issued
+    without user claims load the user, so deactivation and permission
+    changes apply to them at once. Loaded users are cached for
+    JWT_USER_CACHE_TIMEOUT seconds until the user changes.
+    """
+
+    def authenticate(self, request: Request) -> tuple | None:
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if request.method in SAFE_METHODS and all(
+            claim in validated_token
+            for claim in (api_settings.USER_ID_CLAIM, *USER_CLAIMS)
+        ):
+            return TokenUser(validated_token), validated_token
+        return self.get_user(validated_token), validated_token
+
+    def get_user(self, validated_token: Token) -> get_user_model():
+        timeout = settings.JWT_USER_CACHE_TIMEOUT
+        if not timeout:
+            return super().get_user(validated_token)
+
+        cache = caches[settings.JWT_USER_CACHE_ALIAS]
+        key = user_cache_key(validated_token.get(api_settings.USER_ID_CLAIM))
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, timeout=timeout)
+        return user
@@ -0,0 +1,126 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+
+TOKEN_URL = reverse("user-api:token-obtain-pair")
+TOKEN_REFRESH_URL = reverse("user-api:token-refresh")
+MANAGE_USER_URL = reverse("user-api:manage")
+STATION_URL = reverse("station-api:station-list")
+TRIP_CONFLICTS_URL = reverse("station-api:trip-conflicts")
+
+
+class ClaimsJWTAuthenticationTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        self.client = APIClient()
+        self.user = get_user_model().objects.create_user(
+            email="admin@test.com",
+            password="testpass123",
+            is_staff=True,
+        )
+        response = self.client.post(
+            TOKEN_URL, {"email": "admin@test.com", "password": "testpass123"}
+        )
+        self.access = response.data["access"]
+        self.refresh = response.data["refresh"]
+        self.authorize(self.access)
+
+    def authorize(self, access: str) -> None:
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+    def user_queries(self, method: str, url: str, **kwargs) -> list[str]:
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url, **kwargs)
+        self.response = response
+        return [
+            query["sql"] for query in queries
+            if get_user_model()._meta.db_table in query["sql"]
+        ]
+
+    def test_token_contains_user_claims(self) -> None:
+        token = AccessToken(self.access)
+
+        self.assertEqual(token["email"], "admin@test.com")
+        self.assertTrue(token["is_staff"])
+
+    def test_read_does_not_query_user(self) -> None:
+        self.assertEqual(self.user_queries("get", STATION_URL), [])
+        self.assertEqual(self.response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.user_queries(
+                "get",
+                TRIP_CONFLICTS_URL,
+                data={"date_from": "2024-01-01", "date_to": "2024-01-02"}
+            ),
+            []
+        )
+        self.assertEqual(self.response.status_code, status.HTTP_200_OK)
+
+    def test_write_checks_current_user(self) -> None:
+        get_user_model().objects.filter(pk=self.user.pk).update(
+            is_staff=False
+        )
+        cache.clear()
+
+        response = self.client.post(
+            STATION_URL,
+            {"name": "Kyiv", "latitude": 50.45, "longitude": 30.52}
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_write_of_inactive_user_rejected(self) -> None:
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.patch(MANAGE_USER_URL, {"email": "x@test.com"})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_write_user_cached(self) -> None:
+        payload = {"latitude": 50.45, "longitude": 30.52}
+        self.client.post(STATION_URL, {"name": "Kyiv", **payload})
+
+        self.assertEqual(
+            self.user_queries(
+                "post", STATION_URL, data={"name": "Lviv", **payload}
+            ),
+            []
+        )
+        self.assertEqual(self.response.status_code, status.HTTP_201_CREATED)
+
+    def test_retrieve_user_info_from_database(self) -> None:
+        self.client.patch(MANAGE_USER_URL, {"email": "new@test.com"})
+
+        response = self.client.get(MANAGE_USER_URL)
+        self.assertEqual(response.data["email"], "new@test.com")
+
+    def test_refresh_updates_user_claims(self) -> None:
+        self.user.is_staff = False
+        self.user.save()
+
+        response = self.client.post(
+            TOKEN_REFRESH_URL, {"refresh": self.refresh}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(AccessToken(response.data["access"])["is_staff"])
+
+    def test_refresh_of_inactive_user_rejected(self) -> None:
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.post(
+            TOKEN_REFRESH_URL, {"refresh": self.refresh}
+        )
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_token_without_claims_loads_user(self) -> None:
+        self.authorize(str(RefreshToken.for_user(self.user).access_token))
+
+        self.assertNotEqual(self.user_queries("get", STATION_URL), [])
+        self.assertEqual(self.response.status_code, status.HTTP_200_OK)
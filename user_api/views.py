@@ -18,4 +18,7 @@ class ManageUserView(generics.RetrieveUpdateAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_object(self) -> get_user_model():
-        return self.request.user
+        """Load user, as read-only requests carry a user built from token"""
+        if isinstance(self.request.user, get_user_model()):
+            return self.request.user
+        return get_user_model().objects.get(pk=self.request.user.pk)